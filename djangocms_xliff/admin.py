@@ -1,28 +1,31 @@
 import json
+from collections.abc import Generator
 from dataclasses import asdict
+from itertools import chain
 
 from django import forms
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.admin.templatetags.admin_urls import admin_urlname
-from django.http import HttpResponse
+from django.contrib.contenttypes.models import ContentType
 from django.shortcuts import redirect, render
 from django.urls import reverse
 from django.utils.translation import gettext as _
 
+from djangocms_xliff.bundles import parse_xliff_upload
 from djangocms_xliff.exceptions import XliffError, XliffImportError
-from djangocms_xliff.extractors import extract_units_from_obj
-from djangocms_xliff.imports import compare_units, save_xliff_context
-from djangocms_xliff.parsers import parse_xliff_document
-from djangocms_xliff.renderer import render_xliff_document
-from djangocms_xliff.settings import TEMPLATES_FOLDER_ADMIN
-from djangocms_xliff.types import XliffContext
+from djangocms_xliff.extractors import iter_units_from_objs
+from djangocms_xliff.imports import compare_units, save_xliff_contexts
+from djangocms_xliff.responses import create_sharded_xliff_response
+from djangocms_xliff.settings import EXTRACTION_DATABASE, TEMPLATES_FOLDER_ADMIN
+from djangocms_xliff.types import Unit, XliffContext, XliffObj
 from djangocms_xliff.utils import get_lang_name, get_xliff_version
 
 
 class XliffExportForm(forms.Form):
     source_language = forms.ChoiceField(label=_("Source language:"))
     target_language = forms.ChoiceField(label=_("Target language:"))
+    compress = forms.BooleanField(label=_("Compress the file"), required=False)
     action = forms.CharField(widget=forms.HiddenInput(), initial="export")
 
     def __init__(self, *args, **kwargs):
@@ -72,7 +75,8 @@ class XliffImportExportMixin:
                 if export_form.is_valid():
                     source_language = export_form.cleaned_data["source_language"]
                     target_language = export_form.cleaned_data["target_language"]
-                    return self.handle_export(request, source_language, target_language)
+                    compress = export_form.cleaned_data["compress"]
+                    return self.handle_export(request, source_language, target_language, compress)
             elif action == "import":
                 import_form = XliffImportForm(request.POST, request.FILES)
                 if import_form.is_valid():
@@ -86,65 +90,82 @@ class XliffImportExportMixin:
         }
         return render(request, f"{TEMPLATES_FOLDER_ADMIN}/overview.html", context=context)
 
-    def get_xliff_context(self, request, source_language: str, target_language: str) -> XliffContext:
-        units = []
+    def iter_objs_with_units(self, request, language: str) -> Generator[tuple[XliffObj, list[Unit]]]:
+        objs = self.get_queryset_with_filters(request).using(EXTRACTION_DATABASE)
+        return iter_units_from_objs(objs=objs, language=language, allow_empty_plugins=True)
 
-        for obj in self.get_queryset_with_filters(request):
-            units.extend(extract_units_from_obj(obj=obj, language=source_language, allow_empty_plugins=True))
+    def get_database_units(self, request, language: str) -> list[Unit]:
+        return [unit for _obj, obj_units in self.iter_objs_with_units(request, language) for unit in obj_units]
 
+    def get_xliff_context(self, request, obj: XliffObj, source_language: str, target_language: str) -> XliffContext:
         return XliffContext(
             source_language=source_language,
             target_language=target_language,
-            content_type_id=0,
-            obj_id=0,
+            content_type_id=ContentType.objects.get_for_model(obj).pk,
+            obj_id=obj.pk,
             path=request.path,
-            units=units,
+            units=[],
         )
 
-    def handle_export(self, request, source_language: str, target_language: str):
-        xliff_context = self.get_xliff_context(request, source_language, target_language)
+    def handle_export(self, request, source_language: str, target_language: str, compress: bool = False):
+        # One <file> per object. The units are extracted batch by batch while the response is streamed
+        objs_with_units = self.iter_objs_with_units(request, source_language)
+        try:
+            # The first object is extracted before the response starts, so errors can still be shown
+            first_obj_with_units = next(objs_with_units, None)
+        except XliffError as e:
+            return self.error_response(request, e)
+
+        first_objs_with_units = [first_obj_with_units] if first_obj_with_units is not None else []
+        xliff_files = (
+            (self.get_xliff_context(request, obj, source_language, target_language), obj_units)
+            for obj, obj_units in chain(first_objs_with_units, objs_with_units)
+        )
         xliff_version = get_xliff_version("1.2")
-        xliff_str = render_xliff_document(xliff_version, xliff_context)
 
         app_label, model_name = self.get_model_info()
         file_name = f"admin_{app_label}_{model_name}.xliff"
 
-        return HttpResponse(
-            content_type="application/xliff+xml",
-            content=xliff_str,
-            headers={"Content-Disposition": f"attachment; filename={file_name}"},
+        return create_sharded_xliff_response(
+            version=xliff_version, files=xliff_files, file_name=file_name, compress=compress
         )
 
+    def validate_xliff_context(self, request, xliff_context: XliffContext) -> None:
+        if xliff_context.path != request.path:
+            error_message = _('Selected page: "%(current_path)s" is not the same as xliff path: "%(xliff_path)s"')
+            error_params = {"current_path": request.path, "xliff_path": xliff_context.path}
+            raise XliffImportError(error_message % error_params)
+
+        # Files exported before every object got its own <file> have no content type
+        content_type_id = ContentType.objects.get_for_model(self.model).pk  # type: ignore
+        if xliff_context.content_type_id not in (0, content_type_id):
+            raise XliffImportError(_("The XLIFF file was exported from a different type of object."))
+
+        languages = dict(settings.LANGUAGES)
+        if xliff_context.source_language not in languages:
+            raise XliffImportError("Source language is not a supported language")
+
+        if xliff_context.target_language not in languages:
+            raise XliffImportError("Target language is not a supported language")
+
     def handle_import(self, request, uploaded_file):
         try:
-            xliff_context = parse_xliff_document(uploaded_file)
-            database_xliff_context = self.get_xliff_context(
-                request=request,
-                source_language=xliff_context.source_language,
-                target_language=xliff_context.target_language,
-            )
-            xliff_context.units = compare_units(xliff_context.units, database_xliff_context.units)
-
-            if xliff_context.path != request.path:
-                error_message = _('Selected page: "%(current_path)s" is not the same as xliff path: "%(xliff_path)s"')
-                error_params = {"current_path": request.path, "xliff_path": xliff_context.path}
-                raise XliffImportError(error_message % error_params)
-
-            languages = dict(settings.LANGUAGES)
-            if xliff_context.source_language not in languages:
-                raise XliffImportError("Source language is not a supported language")
-
-            if xliff_context.target_language not in languages:
-                raise XliffImportError("Target language is not a supported language")
-
-            return self.render_preview(request, xliff_context)
+            xliff_contexts = parse_xliff_upload(uploaded_file)
+            for xliff_context in xliff_contexts:
+                self.validate_xliff_context(request, xliff_context)
+
+            database_units = self.get_database_units(request, xliff_contexts[0].source_language)
+            for xliff_context in xliff_contexts:
+                xliff_context.units = compare_units(xliff_context.units, database_units)
+
+            return self.render_preview(request, xliff_contexts)
         except XliffError as e:
             return self.error_response(request, e)
 
-    def render_preview(self, request, xliff_context: XliffContext):
+    def render_preview(self, request, xliff_contexts: list[XliffContext]):
         description_params = {
-            "language": get_lang_name(xliff_context.target_language),
-            "count_plugins": len(xliff_context.units),
+            "language": get_lang_name(xliff_contexts[0].target_language),
+            "count_plugins": sum(len(xliff_context.units) for xliff_context in xliff_contexts),
         }
         description = (
             _('Found %(count_plugins)d plugins that will be imported to the "%(language)s" page.') % description_params
@@ -158,8 +179,8 @@ class XliffImportExportMixin:
         context = {
             "description": description,
             "note": note,
-            "xliff": xliff_context,
-            "xliff_json": json.dumps(asdict(xliff_context)),
+            "xliffs": xliff_contexts,
+            "xliff_json": json.dumps([asdict(xliff_context) for xliff_context in xliff_contexts]),
             **self.admin_context(request),
         }
         return render(request, f"{TEMPLATES_FOLDER_ADMIN}/preview.html", context)
@@ -175,8 +196,7 @@ class XliffImportExportMixin:
     def xliff_import_view(self, request):
         try:
             data = json.loads(request.POST["xliff_json"])
-            xliff_context = XliffContext.from_dict(data)
-            save_xliff_context(xliff_context)
+            save_xliff_contexts([XliffContext.from_dict(file_data) for file_data in data])
 
             _, model_name = self.get_model_info()
             messages.add_message(request, messages.SUCCESS, f"Successfully updated: {model_name}")
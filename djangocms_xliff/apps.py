@@ -4,4 +4,12 @@ from django.utils.translation import gettext_lazy
 
 class DjangoCMSXliffConfig(AppConfig):
     name = "djangocms_xliff"
+    default_auto_field = "django.db.models.BigAutoField"
     verbose_name = gettext_lazy("Django CMS XLIFF Import / Export")
+
+    def ready(self):
+        from djangocms_xliff.cache import connect_signals
+        from djangocms_xliff.registry import build_field_registry
+
+        connect_signals()
+        build_field_registry()
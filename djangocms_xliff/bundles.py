@@ -0,0 +1,214 @@
+import hashlib
+import json
+import logging
+from collections.abc import Generator, Iterable
+from io import BytesIO, RawIOBase
+from typing import IO
+from zipfile import ZIP_DEFLATED, BadZipFile, ZipFile, is_zipfile
+
+from django.utils.translation import gettext
+
+from djangocms_xliff.exceptions import XliffError
+from djangocms_xliff.imports import merge_xliff_contexts
+from djangocms_xliff.parsers import parse_xliff_document_files
+from djangocms_xliff.renderer import iter_xliff_files_document
+from djangocms_xliff.settings import (
+    BUNDLE_MAX_BYTES,
+    BUNDLE_MAX_FILE_BYTES,
+    SHARD_MAX_BYTES,
+    SHARD_MAX_UNITS,
+    XliffVersion,
+)
+from djangocms_xliff.shards import iter_sharded_bundle_entries
+from djangocms_xliff.types import BundleEntry, ExportContext, XliffContext
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "manifest.json"
+XLIFF_FILE_EXTENSIONS = (".xliff", ".xlf")
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class ZipStreamBuffer(RawIOBase):
+    """
+    Collects the bytes ZipFile writes, until they are taken out with pop().
+    It is not seekable, so ZipFile writes the sizes of every entry after its data.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def pop(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def get_manifest_entry(entry: BundleEntry, sha256: str) -> dict:
+    manifest_entry = {
+        "file_name": entry.file_name,
+        "units": entry.units_count,
+        "sha256": sha256,
+        "objects": [
+            {
+                "content_type_id": xliff_context.content_type_id,
+                "obj_id": xliff_context.obj_id,
+                "path": xliff_context.path,
+                "source_language": xliff_context.source_language,
+                "target_language": xliff_context.target_language,
+                "units": len(units),
+            }
+            for xliff_context, units in entry.files
+        ],
+    }
+    if entry.shard is not None:
+        manifest_entry["shard"] = entry.shard
+    return manifest_entry
+
+
+def iter_xliff_bundle_entries(version: XliffVersion, entries: Iterable[BundleEntry]) -> Generator[bytes]:
+    """
+    Yields a ZIP file with one XLIFF document per entry and a manifest with the unit count, sha256 hash and objects
+    of every document. Every document is compressed while it is rendered, only the current chunk is held in memory.
+    """
+    buffer = ZipStreamBuffer()
+    manifest = []
+
+    with ZipFile(buffer, "w", compression=ZIP_DEFLATED) as archive:
+        for entry in entries:
+            file_hash = hashlib.sha256()
+            with archive.open(entry.file_name, "w") as zip_entry:
+                for chunk in iter_xliff_files_document(version, entry.files):
+                    data = chunk.encode()
+                    file_hash.update(data)
+                    zip_entry.write(data)
+                    if buffer.chunks:
+                        yield buffer.pop()
+
+            manifest.append(get_manifest_entry(entry, file_hash.hexdigest()))
+            yield buffer.pop()
+
+        archive.writestr(MANIFEST_FILE_NAME, json.dumps({"version": version.value, "files": manifest}, indent=2))
+
+    yield buffer.pop()
+
+
+def get_bundle_entries(export_contexts: Iterable[ExportContext]) -> Generator[BundleEntry]:
+    for xliff_context, file_name in export_contexts:
+        yield BundleEntry(file_name=file_name, files=[(xliff_context, xliff_context.units)])
+
+
+def iter_xliff_bundle(
+    version: XliffVersion,
+    export_contexts: Iterable[ExportContext],
+    max_units: int | None = SHARD_MAX_UNITS,
+    max_bytes: int | None = SHARD_MAX_BYTES,
+) -> Generator[bytes]:
+    """
+    Yields a ZIP file with one XLIFF file per context. Files above the shard limits are split into numbered shards.
+    """
+    entries = iter_sharded_bundle_entries(version, get_bundle_entries(export_contexts), max_units, max_bytes)
+    return iter_xliff_bundle_entries(version, entries)
+
+
+def write_xliff_bundle(
+    version: XliffVersion,
+    export_contexts: Iterable[ExportContext],
+    file: IO[bytes],
+    max_units: int | None = SHARD_MAX_UNITS,
+    max_bytes: int | None = SHARD_MAX_BYTES,
+) -> None:
+    for chunk in iter_xliff_bundle(version, export_contexts, max_units, max_bytes):
+        file.write(chunk)
+
+
+def read_bundle_file(archive: ZipFile, file_name: str, max_bytes: int) -> bytes:
+    """
+    Reads a file of a bundle in chunks. Files that are larger than max_bytes when unpacked are rejected
+    before they are read, and while they are read in case the size in the ZIP file is wrong.
+    """
+    error_message = gettext('The file "%(file_name)s" in the ZIP file is too large') % {"file_name": file_name}
+    if archive.getinfo(file_name).file_size > max_bytes:
+        raise XliffError(error_message)
+
+    data = bytearray()
+    with archive.open(file_name) as zip_entry:
+        while chunk := zip_entry.read(READ_CHUNK_SIZE):
+            data += chunk
+            if len(data) > max_bytes:
+                raise XliffError(error_message)
+    return bytes(data)
+
+
+def validate_bundle_size(archive: ZipFile, max_bytes: int) -> None:
+    if sum(info.file_size for info in archive.infolist()) > max_bytes:
+        raise XliffError(gettext("The ZIP file is too large when unpacked"))
+
+
+def get_bundle_file_names(archive: ZipFile, max_file_bytes: int = BUNDLE_MAX_FILE_BYTES) -> list[str]:
+    """
+    Returns the XLIFF files in the order of the manifest. Without a valid manifest, e.g. if a bundle was packed again
+    or edited by a translation tool, all XLIFF files are returned by name.
+    """
+    try:
+        # A missing manifest raises a KeyError too
+        manifest = json.loads(read_bundle_file(archive, MANIFEST_FILE_NAME, max_file_bytes))
+        file_names = [manifest_file["file_name"] for manifest_file in manifest["files"]]
+        if not all(isinstance(file_name, str) for file_name in file_names):
+            raise TypeError("File names in the manifest must be strings")
+        return file_names
+    except (KeyError, ValueError, TypeError) as e:
+        logger.debug(f"No valid manifest in bundle, reading the XLIFF files by name: {e!r}")
+
+    return sorted(name for name in archive.namelist() if name.endswith(XLIFF_FILE_EXTENSIONS))
+
+
+def read_xliff_bundle(
+    file,
+    max_file_bytes: int = BUNDLE_MAX_FILE_BYTES,
+    max_bytes: int = BUNDLE_MAX_BYTES,
+) -> list[XliffContext]:
+    """
+    Parses every XLIFF file of a bundle into its contexts. Files of the manifest that are missing are skipped,
+    so any subset of the shards of an export can be imported.
+    """
+    try:
+        with ZipFile(file) as archive:
+            validate_bundle_size(archive, max_bytes)
+
+            names = set(archive.namelist())
+            remaining_bytes = max_bytes
+            xliff_contexts = []
+            for file_name in get_bundle_file_names(archive, max_file_bytes):
+                if file_name not in names:
+                    continue
+
+                data = read_bundle_file(archive, file_name, min(max_file_bytes, remaining_bytes))
+                remaining_bytes -= len(data)
+                xliff_contexts.extend(parse_xliff_document_files(BytesIO(data)))
+    except BadZipFile as e:
+        raise XliffError(gettext("Invalid ZIP file")) from e
+
+    if not xliff_contexts:
+        raise XliffError(gettext("The ZIP file contains no XLIFF files"))
+    return xliff_contexts
+
+
+def parse_xliff_upload(file) -> list[XliffContext]:
+    """
+    Parses an uploaded XLIFF file or a ZIP bundle of XLIFF files. The shards of an object are merged into one context.
+    """
+    if is_zipfile(file):
+        file.seek(0)
+        return merge_xliff_contexts(read_xliff_bundle(file))
+
+    file.seek(0)
+    return merge_xliff_contexts(parse_xliff_document_files(file))
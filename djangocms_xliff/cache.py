@@ -0,0 +1,172 @@
+import hashlib
+import logging
+from collections.abc import Callable
+from functools import cache
+from uuid import uuid4
+
+from cms.extensions import PageContentExtension, PageExtension
+from cms.models import CMSPlugin, PageContent, PageUrl, Placeholder
+from cms.signals import post_placeholder_operation
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import BaseCache, caches
+from django.db.models.signals import post_delete, post_save
+
+from djangocms_xliff import __version__
+from djangocms_xliff.settings import EXTRACTION_CACHE, EXTRACTION_CACHE_TIMEOUT
+from djangocms_xliff.types import Unit, XliffObj
+from djangocms_xliff.utils import get_unit_id_format
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "djangocms_xliff"
+
+# Settings that change the extracted units
+FINGERPRINT_SETTINGS = [
+    "DJANGOCMS_XLIFF_FIELDS",
+    "DJANGOCMS_XLIFF_FIELD_EXTRACTORS",
+    "DJANGOCMS_XLIFF_FIELD_BATCH_EXTRACTORS",
+    "DJANGOCMS_XLIFF_FIELD_PROCESS_EXTRACTORS",
+    "DJANGOCMS_XLIFF_VALIDATORS",
+    "DJANGOCMS_XLIFF_MODEL_METADATA_FIELDS",
+    "DJANGOCMS_XLIFF_MODEL_FOR_ALIAS_CONTENT",
+    "DJANGOCMS_XLIFF_LOAD_ONLY_TRANSLATABLE_FIELDS",
+]
+
+# Only page contents are cached. Everything their units depend on is invalidated by the signals below.
+CACHED_MODELS = (PageContent,)
+
+extraction_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_extraction_cache() -> BaseCache | None:
+    if not EXTRACTION_CACHE:
+        return None
+    return caches[EXTRACTION_CACHE]
+
+
+def get_extraction_cache_stats() -> dict[str, int]:
+    return dict(extraction_cache_stats)
+
+
+def reset_extraction_cache_stats() -> None:
+    extraction_cache_stats["hits"] = 0
+    extraction_cache_stats["misses"] = 0
+
+
+@cache
+def get_settings_fingerprint() -> str:
+    values = [__version__, *(repr(getattr(settings, name, None)) for name in FINGERPRINT_SETTINGS)]
+    return hashlib.sha1("|".join(values).encode(), usedforsecurity=False).hexdigest()
+
+
+def get_version_key(content_type_id: int, obj_id) -> str:
+    return get_unit_id_format(CACHE_KEY_PREFIX, "version", content_type_id, obj_id)
+
+
+def get_units_key(extraction_cache: BaseCache, content_type_id: int, obj_id, language: str, *options) -> str:
+    # Invalidation replaces the version of an object, which orphans all cached units of it
+    version = extraction_cache.get_or_set(get_version_key(content_type_id, obj_id), lambda: uuid4().hex, None)
+    return get_unit_id_format(
+        CACHE_KEY_PREFIX,
+        "units",
+        content_type_id,
+        obj_id,
+        language,
+        *options,
+        get_settings_fingerprint(),
+        version,
+    )
+
+
+def get_or_extract_units(
+    obj: XliffObj,
+    language: str,
+    extract: Callable[[], list[Unit]],
+    *options,
+) -> list[Unit]:
+    extraction_cache = get_extraction_cache()
+    if extraction_cache is None or type(obj) not in CACHED_MODELS:
+        return extract()
+
+    content_type_id = ContentType.objects.get_for_model(obj).pk
+    key = get_units_key(extraction_cache, content_type_id, obj.pk, language, *options)
+
+    units = extraction_cache.get(key)
+    if units is not None:
+        extraction_cache_stats["hits"] += 1
+        return units
+
+    extraction_cache_stats["misses"] += 1
+    units = extract()
+    extraction_cache.set(key, units, EXTRACTION_CACHE_TIMEOUT)
+    return units
+
+
+def invalidate_obj(model, obj_id) -> None:
+    extraction_cache = get_extraction_cache()
+    if extraction_cache is None:
+        return
+
+    logger.debug(f"Invalidate cached units of {model._meta.object_name} {obj_id}")
+    content_type_id = ContentType.objects.get_for_model(model).pk
+    extraction_cache.delete(get_version_key(content_type_id, obj_id))
+
+
+def invalidate_page(page_id) -> None:
+    for page_content_id in PageContent.admin_manager.filter(page_id=page_id).values_list("pk", flat=True):
+        invalidate_obj(PageContent, page_content_id)
+
+
+def invalidate_placeholder(placeholder_id) -> None:
+    placeholder = Placeholder.objects.filter(pk=placeholder_id).values("content_type_id", "object_id").first()
+    if placeholder is None or placeholder["content_type_id"] is None:
+        return
+
+    model = ContentType.objects.get_for_id(placeholder["content_type_id"]).model_class()
+    if model in CACHED_MODELS:
+        invalidate_obj(model, placeholder["object_id"])
+
+
+def invalidate_extraction_cache(sender, instance, **kwargs) -> None:
+    if get_extraction_cache() is None:
+        return
+
+    if isinstance(instance, CMSPlugin):
+        invalidate_placeholder(instance.placeholder_id)
+    elif isinstance(instance, Placeholder):
+        invalidate_placeholder(instance.pk)
+    elif isinstance(instance, PageContent):
+        invalidate_obj(PageContent, instance.pk)
+    elif isinstance(instance, PageUrl):
+        invalidate_page(instance.page_id)
+    elif isinstance(instance, PageContentExtension):
+        invalidate_obj(PageContent, instance.extended_object_id)
+    elif isinstance(instance, PageExtension):
+        invalidate_page(instance.extended_object_id)
+
+
+# Keyword arguments of post_placeholder_operation with the placeholders changed by an operation
+PLACEHOLDER_OPERATION_ARGUMENTS = ("placeholder", "source_placeholder", "target_placeholder")
+
+
+def invalidate_extraction_cache_for_operation(sender, operation, **kwargs) -> None:
+    """
+    Moving, pasting and reordering plugins updates their positions with queryset.update(), which sends no model
+    signals. The source and target placeholders of the operation are invalidated instead.
+    """
+    if get_extraction_cache() is None:
+        return
+
+    placeholder_ids = {kwargs[name].pk for name in PLACEHOLDER_OPERATION_ARGUMENTS if kwargs.get(name) is not None}
+    for placeholder_id in placeholder_ids:
+        invalidate_placeholder(placeholder_id)
+
+
+def connect_signals() -> None:
+    # Plugins and extensions are saved with their own models as sender, so the receiver listens to all models
+    post_save.connect(invalidate_extraction_cache, dispatch_uid="djangocms_xliff_post_save")
+    post_delete.connect(invalidate_extraction_cache, dispatch_uid="djangocms_xliff_post_delete")
+    post_placeholder_operation.connect(
+        invalidate_extraction_cache_for_operation, dispatch_uid="djangocms_xliff_post_placeholder_operation"
+    )
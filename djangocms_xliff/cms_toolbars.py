@@ -48,6 +48,11 @@ class XliffToolbar(CMSToolbar):
             gettext("Export as XLIFF"),
             reverse_xliff(viewname="djangocms_xliff:export"),
         )
+        if self.is_page_content(obj):
+            language_menu.add_modal_item(
+                gettext("Export with subpages as XLIFF"),
+                reverse_xliff(viewname="djangocms_xliff:export_subtree"),
+            )
         language_menu.add_modal_item(
             gettext("Import from XLIFF"),
             reverse_xliff(viewname="djangocms_xliff:upload"),
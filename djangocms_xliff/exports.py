@@ -1,18 +1,56 @@
+from collections.abc import Generator, Iterable
+from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from cms.models import PageContent
 from django.contrib.contenttypes.models import ContentType
+from django.utils.translation import gettext
 
-from djangocms_xliff.extractors import extract_units_from_obj
-from djangocms_xliff.renderer import render_xliff_document
-from djangocms_xliff.types import ExportPage, XliffContext, XliffObj
+from djangocms_xliff.bundles import iter_xliff_bundle
+from djangocms_xliff.exceptions import XliffExportError
+from djangocms_xliff.extractors import (
+    extract_units_from_obj,
+    extract_units_from_objs_by_language,
+    get_subtree_page_contents,
+    iter_units_from_objs,
+)
+from djangocms_xliff.ledger import (
+    filter_changed_units,
+    get_exported_hashes,
+    record_exported_context,
+    record_exported_hashes,
+    record_exported_units,
+)
+from djangocms_xliff.renderer import render_xliff_contexts_document, render_xliff_document
+from djangocms_xliff.settings import SHARD_MAX_BYTES, SHARD_MAX_UNITS, XliffVersion
+from djangocms_xliff.types import ExportContext, ExportContexts, ExportPage, ExportScope, Unit, XliffContext, XliffObj
+from djangocms_xliff.untranslated import extract_untranslated_units_from_obj
 from djangocms_xliff.utils import (
+    get_obj_in_language,
     get_path,
     get_xliff_export_file_name,
+    get_xliff_export_file_name_for_context,
     get_xliff_version,
 )
 
 
-def convert_obj_to_xliff_context(obj: XliffObj, source_language: str, target_language: str) -> XliffContext:
+def convert_obj_to_xliff_context(
+    obj: XliffObj,
+    source_language: str,
+    target_language: str,
+    scope: ExportScope | None = None,
+    only_untranslated: bool = False,
+    only_changed: bool = False,
+    units: list[Unit] | None = None,
+) -> XliffContext:
     content_type_id = ContentType.objects.get_for_model(obj).pk
-    units = extract_units_from_obj(obj, target_language)
+    if units is None and only_untranslated:
+        units = extract_untranslated_units_from_obj(obj, target_language, source_language, scope=scope)
+    elif units is None:
+        units = extract_units_from_obj(obj, target_language, scope=scope)
+
+    if only_changed:
+        units = filter_changed_units(obj, target_language, units)
 
     return XliffContext(
         source_language=source_language,
@@ -24,15 +62,223 @@ def convert_obj_to_xliff_context(obj: XliffObj, source_language: str, target_lan
     )
 
 
+def export_content_as_xliff_context(
+    obj: XliffObj,
+    source_language: str,
+    target_language: str,
+    scope: ExportScope | None = None,
+    only_untranslated: bool = False,
+    only_changed: bool = False,
+) -> ExportContext:
+    context = convert_obj_to_xliff_context(
+        obj, source_language, target_language, scope, only_untranslated, only_changed
+    )
+    if only_changed:
+        record_exported_units(obj, target_language, context.units)
+    file_name = get_xliff_export_file_name(obj=obj, target_language=target_language)
+
+    return context, file_name
+
+
 def export_content_as_xliff(
     obj: XliffObj,
     source_language: str,
     target_language: str,
     version: str = "1.2",
+    scope: ExportScope | None = None,
+    only_untranslated: bool = False,
+    only_changed: bool = False,
 ) -> ExportPage:
     xliff_version = get_xliff_version(version)
-    context = convert_obj_to_xliff_context(obj, source_language, target_language)
-    content = render_xliff_document(xliff_version, context)
-    file_name = get_xliff_export_file_name(obj=obj, target_language=target_language)
+    context, file_name = export_content_as_xliff_context(
+        obj, source_language, target_language, scope, only_untranslated, only_changed
+    )
+
+    return render_xliff_document(xliff_version, context), file_name
+
+
+def export_content_as_xliff_contexts_for_languages(
+    obj: XliffObj,
+    source_language: str,
+    target_languages: list[str],
+    scope: ExportScope | None = None,
+    only_untranslated: bool = False,
+    only_changed: bool = False,
+) -> list[ExportContext]:
+    """
+    Converts an object into one context per target language. The contents of all languages are extracted together,
+    so their placeholders and plugins are loaded with a few queries for all languages.
+    """
+    objs_by_language = {language: get_obj_in_language(obj, language) for language in target_languages}
+
+    units_by_language = {}
+    if not only_untranslated:
+        units_by_language = extract_units_from_objs_by_language(objs_by_language, scope=scope)
+
+    export_contexts = []
+    for target_language, target_obj in objs_by_language.items():
+        context = convert_obj_to_xliff_context(
+            target_obj,
+            source_language,
+            target_language,
+            scope,
+            only_untranslated,
+            only_changed,
+            units=units_by_language.get(target_language),
+        )
+        if only_changed:
+            record_exported_units(target_obj, target_language, context.units)
+        file_name = get_xliff_export_file_name(obj=target_obj, target_language=target_language)
+        export_contexts.append((context, file_name))
+
+    return export_contexts
+
+
+def export_content_as_xliff_for_languages(
+    obj: XliffObj,
+    source_language: str,
+    target_languages: list[str],
+    version: str = "1.2",
+    scope: ExportScope | None = None,
+    only_untranslated: bool = False,
+    only_changed: bool = False,
+) -> list[ExportPage]:
+    """
+    Exports one XLIFF file per target language
+    """
+    xliff_version = get_xliff_version(version)
+    export_contexts = export_content_as_xliff_contexts_for_languages(
+        obj, source_language, target_languages, scope, only_untranslated, only_changed
+    )
+    return [(render_xliff_document(xliff_version, context), file_name) for context, file_name in export_contexts]
+
+
+def create_xliff_archive(export_pages: list[ExportPage]) -> bytes:
+    buffer = BytesIO()
+    with ZipFile(buffer, "w", compression=ZIP_DEFLATED) as archive:
+        for content, file_name in export_pages:
+            archive.writestr(file_name, content)
+    return buffer.getvalue()
+
+
+def iter_subtree_xliff_contexts(
+    page_content: PageContent,
+    source_language: str,
+    target_language: str,
+    scope: ExportScope | None = None,
+    only_changed: bool = False,
+) -> Generator[XliffContext]:
+    """
+    Yields one context per page of a page and all its descendants, the root page first.
+    The units are extracted batch by batch while the contexts are consumed.
+    """
+    page_contents = get_subtree_page_contents(page_content, target_language)
+    content_type_id = ContentType.objects.get_for_model(page_content).pk
+
+    for obj, units in iter_units_from_objs(page_contents, target_language, allow_empty_plugins=True, scope=scope):
+        if only_changed:
+            units = filter_changed_units(obj, target_language, units)
+
+        yield XliffContext(
+            source_language=source_language,
+            target_language=target_language,
+            content_type_id=content_type_id,
+            obj_id=obj.pk,
+            path=get_path(obj=obj, language=target_language),
+            units=units,
+        )
+
+
+def convert_subtree_to_xliff_contexts(
+    page_content: PageContent,
+    source_language: str,
+    target_language: str,
+    scope: ExportScope | None = None,
+    only_changed: bool = False,
+) -> list[XliffContext]:
+    """
+    Converts a page and all its descendants into one context per page, the root page first.
+    They are written as one <file> per page into the same document.
+    """
+    return list(iter_subtree_xliff_contexts(page_content, source_language, target_language, scope, only_changed))
+
+
+def iter_subtree_export_contexts(
+    page_content: PageContent,
+    source_language: str,
+    target_languages: list[str],
+    scope: ExportScope | None = None,
+    only_changed: bool = False,
+) -> Generator[ExportContext]:
+    """
+    Yields one context with its own file name per page and target language, e.g. for a bundle export.
+    The contexts are not recorded in the ledger, iter_recorded_xliff_bundle records them once the bundle is written.
+    """
+    if type(page_content) is not PageContent:
+        raise XliffExportError(gettext("Only pages can be exported together with their subpages"))
+
+    for target_language in target_languages:
+        root_page_content = get_obj_in_language(page_content, target_language)
+        for context in iter_subtree_xliff_contexts(
+            root_page_content, source_language, target_language, scope, only_changed
+        ):
+            yield context, get_xliff_export_file_name_for_context(context)
+
+
+def export_subtree_as_xliff_contexts(
+    page_content: PageContent,
+    source_language: str,
+    target_language: str,
+    scope: ExportScope | None = None,
+    only_changed: bool = False,
+) -> ExportContexts:
+    if type(page_content) is not PageContent:
+        raise XliffExportError(gettext("Only pages can be exported together with their subpages"))
+
+    contexts = convert_subtree_to_xliff_contexts(page_content, source_language, target_language, scope, only_changed)
+    if only_changed:
+        for context in contexts:
+            record_exported_context(context)
+    file_name = get_xliff_export_file_name(obj=page_content, target_language=target_language)
+
+    return contexts, file_name
+
+
+def export_subtree_as_xliff(
+    page_content: PageContent,
+    source_language: str,
+    target_language: str,
+    version: str = "1.2",
+    scope: ExportScope | None = None,
+    only_changed: bool = False,
+) -> ExportPage:
+    xliff_version = get_xliff_version(version)
+    contexts, file_name = export_subtree_as_xliff_contexts(
+        page_content, source_language, target_language, scope, only_changed
+    )
+
+    return render_xliff_contexts_document(xliff_version, contexts), file_name
+
+
+def iter_recorded_xliff_bundle(
+    version: XliffVersion,
+    export_contexts: Iterable[ExportContext],
+    only_changed: bool = False,
+    max_units: int | None = SHARD_MAX_UNITS,
+    max_bytes: int | None = SHARD_MAX_BYTES,
+) -> Generator[bytes]:
+    """
+    Yields a ZIP bundle of the contexts. With only_changed the exported units are recorded in the ledger
+    after the last chunk, so nothing is recorded if the download is aborted or the file can't be written.
+    """
+    exported_hashes = []
+
+    def iter_export_contexts() -> Generator[ExportContext]:
+        for context, file_name in export_contexts:
+            if only_changed:
+                exported_hashes.append(get_exported_hashes(context))
+            yield context, file_name
+
+    yield from iter_xliff_bundle(version, iter_export_contexts(), max_units, max_bytes)
 
-    return content, file_name
+    record_exported_hashes(exported_hashes)
@@ -1,6 +1,8 @@
 import logging
-from collections.abc import Callable, Generator
-from contextlib import suppress
+from collections import defaultdict
+from collections.abc import Callable, Generator, Iterable, Sequence
+from functools import cache
+from itertools import batched, chain
 from typing import cast
 
 from cms.extensions import extension_pool
@@ -11,42 +13,53 @@ from cms.models import (
     PlaceholderRelationField,
     StaticPlaceholder,
 )
+from cms.plugin_pool import plugin_pool
 from cms.templatetags.cms_tags import DeclaredPlaceholder
 from cms.utils.placeholder import get_declared_placeholders_for_obj as _get_declared_placeholders_for_obj_original
-from django.db.models import (
-    CharField,
-    Field,
-    Model,
-    OneToOneField,
-    SlugField,
-    TextField,
-    URLField,
-)
+from cms.utils.placeholder import get_placeholders as _get_template_placeholders_original
+from cms.utils.plugins import get_plugin_class
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Field, Model, OneToOneField, QuerySet, prefetch_related_objects
 from django.utils import translation
 from django.utils.translation import gettext
 from djangocms_alias.models import AliasContent
 
+from djangocms_xliff.cache import get_or_extract_units
 from djangocms_xliff.exceptions import XliffExportError
+from djangocms_xliff.registry import get_field_handlers, has_batch_extractors
 from djangocms_xliff.settings import (
-    FIELD_EXTRACTORS,
-    FIELDS,
+    EXPORT_BATCH_SIZE,
+    EXTRACTION_DATABASE,
+    LOAD_ONLY_TRANSLATABLE_FIELDS,
     METADATA_FIELDS,
     MODEL_METADATA_FIELDS,
+    UNIT_ID_METADATA_ID,
     VALIDATORS,
 )
-from djangocms_xliff.types import Unit, XliffObj
+from djangocms_xliff.types import (
+    ExportScope,
+    ModelPlan,
+    PendingUnits,
+    TranslatableField,
+    Unit,
+    UnitOrPending,
+    XliffObj,
+)
 from djangocms_xliff.utils import (
     get_plugin_id_for_extension_obj,
     get_plugin_id_for_metadata_obj,
+    get_template_mtime,
     get_type_with_path,
+    get_unit_id_format,
     must_get_model_for_alias_content,
 )
+from djangocms_xliff.validators import is_instance_independent
 
 logger = logging.getLogger(__name__)
 
 
 def has_translatable_type(field: Field) -> bool:
-    return type(field) in [CharField, TextField, URLField, SlugField, *FIELDS]
+    return get_field_handlers(type(field)).is_translatable
 
 
 def is_not_cms_default(name: str) -> bool:
@@ -57,46 +70,149 @@ def has_no_choices(field: Field) -> bool:
     return getattr(field, "choices", None) is None
 
 
-def is_field_to_translate(field: Field, instance: CMSPlugin) -> bool:
-    default_validators = [
-        has_translatable_type(field),
-        is_not_cms_default(field.name),
-        has_no_choices(field),
-    ]
-    validators = [validator(field, instance) for validator in VALIDATORS]
-    return all(default_validators + validators)
+def is_placeholder_field(field: Field) -> bool:
+    field_type = type(field)
+    return field_type is PlaceholderRelationField or (
+        field_type is OneToOneField and field.related_model == StaticPlaceholder
+    )
 
 
-def extract_units_from_plugin_instance(instance: CMSPlugin) -> list[Unit]:
-    units = []
+@cache
+def get_model_plan(model: type[Model]) -> ModelPlan:
+    """
+    Computes once per model which fields are translated and how. Validators marked as instance independent
+    are evaluated here, the remaining validators are kept on the field and run for every instance.
+    """
+    instance_independent_validators = [validator for validator in VALIDATORS if is_instance_independent(validator)]
+    instance_dependent_validators = tuple(
+        validator for validator in VALIDATORS if not is_instance_independent(validator)
+    )
 
-    for field in instance._meta.get_fields():
+    translatable_fields = []
+    for field in model._meta.get_fields():
         field = cast(Field, field)
 
-        if not is_field_to_translate(field, instance):
+        if not (has_translatable_type(field) and is_not_cms_default(field.name) and has_no_choices(field)):
+            continue
+
+        if not all(validator(field, None) for validator in instance_independent_validators):
             continue
 
+        handlers = get_field_handlers(type(field))
+        translatable_fields.append(
+            TranslatableField(
+                field=field,
+                field_type=get_type_with_path(field),  # type: ignore
+                extractor=handlers.extractor,
+                validators=instance_dependent_validators,
+                batch_extractor=handlers.batch_extractor,
+            )
+        )
+
+    placeholder_fields = tuple(field for field in model._meta.fields if is_placeholder_field(field))
+
+    return ModelPlan(translatable_fields=tuple(translatable_fields), placeholder_fields=placeholder_fields)
+
+
+def get_instance_plan(instance: Model) -> ModelPlan:
+    return get_model_plan(type(instance))
+
+
+def has_translatable_fields(model: type[Model]) -> bool:
+    return len(get_model_plan(model).translatable_fields) > 0
+
+
+def get_plugin_types_classification() -> dict[str, bool]:
+    """
+    Returns for every registered plugin type if its model has translatable fields.
+    Plugins without translatable fields are never downcasted during the extraction.
+    """
+    plugin_pool.discover_plugins()
+    return {name: has_translatable_fields(plugin.model) for name, plugin in plugin_pool.plugins.items()}
+
+
+def is_field_to_translate(field: Field, instance: Model) -> bool:
+    translatable_field = get_instance_plan(instance).get_translatable_field(field.name)
+    return translatable_field is not None and translatable_field.is_valid_for(instance)
+
+
+def create_unit_for_plugin_field(instance: CMSPlugin, translatable_field: TranslatableField, source: str) -> Unit:
+    field = translatable_field.field
+    return Unit(
+        plugin_id=str(instance.pk),
+        plugin_type=instance.plugin_type,
+        plugin_name=instance.get_plugin_name(),
+        field_name=field.name,
+        field_type=translatable_field.field_type,
+        field_verbose_name=field.verbose_name,  # type: ignore
+        source=source,
+        max_length=field.max_length,
+    )
+
+
+def iter_units_or_pending_from_plugin_instance(instance: CMSPlugin) -> Generator[UnitOrPending]:
+    for translatable_field in get_instance_plan(instance).translatable_fields:
+        if not translatable_field.is_valid_for(instance):
+            continue
+
+        field = translatable_field.field
         source = getattr(instance, field.name, None)
         if not source:
             continue
 
-        field_type = type(field)
-        if field_type in FIELD_EXTRACTORS:
-            units.extend(FIELD_EXTRACTORS[field_type](instance=instance, field=field, source=source))
-        else:
-            units.append(
-                Unit(
-                    plugin_id=str(instance.pk),
-                    plugin_type=instance.plugin_type,
-                    plugin_name=instance.get_plugin_name(),
-                    field_name=field.name,
-                    field_type=get_type_with_path(field),  # type: ignore
-                    field_verbose_name=field.verbose_name,  # type: ignore
-                    source=source,
-                    max_length=field.max_length,
-                )
+        if translatable_field.batch_extractor:
+            yield PendingUnits(
+                batch_extractor=translatable_field.batch_extractor,
+                instance=instance,
+                field=field,
+                source=source,
             )
-    return units
+        elif translatable_field.extractor:
+            yield from translatable_field.extractor(instance=instance, field=field, source=source)
+        else:
+            yield create_unit_for_plugin_field(instance, translatable_field, source)
+
+
+def run_batch_extractors(units_or_pending: Iterable[UnitOrPending]) -> None:
+    """
+    Calls every batch extractor once with all of its pending fields and stores the units on them
+    """
+    pending_by_batch_extractor = defaultdict(list)
+    for unit_or_pending in units_or_pending:
+        if isinstance(unit_or_pending, PendingUnits) and unit_or_pending.units is None:
+            pending_by_batch_extractor[unit_or_pending.batch_extractor].append(unit_or_pending)
+
+    for batch_extractor, pending_units in pending_by_batch_extractor.items():
+        items = [(pending.instance, pending.field, pending.source) for pending in pending_units]
+        for pending, units in zip(pending_units, batch_extractor(items), strict=True):
+            pending.units = list(units)
+
+
+def resolve_units(units_or_pending: Iterable[UnitOrPending]) -> Generator[Unit]:
+    """
+    Yields the units in their original order. Without batch extractors the units are passed through lazily,
+    otherwise all of them are collected to call every batch extractor only once.
+    """
+    if not has_batch_extractors():
+        yield from units_or_pending  # type: ignore
+        return
+
+    units_or_pending = list(units_or_pending)
+    run_batch_extractors(units_or_pending)
+
+    for unit_or_pending in units_or_pending:
+        if isinstance(unit_or_pending, PendingUnits):
+            yield from unit_or_pending.units or []
+        else:
+            yield unit_or_pending
+
+
+def iter_units_from_plugin_instance(instance: CMSPlugin) -> Generator[Unit]:
+    return resolve_units(iter_units_or_pending_from_plugin_instance(instance))
+
+
+def extract_units_from_plugin_instance(instance: CMSPlugin) -> list[Unit]:
+    return list(iter_units_from_plugin_instance(instance))
 
 
 def extract_units_from_plugin(cms_plugin: CMSPlugin) -> list[Unit]:
@@ -111,20 +227,191 @@ def extract_units_from_plugin(cms_plugin: CMSPlugin) -> list[Unit]:
 
     # Extract the units from all child plugins too.
     for child_plugin in instance.get_children().order_by("position"):
-        units += extract_units_from_plugin(child_plugin)
+        units.extend(extract_units_from_plugin(child_plugin))
 
     return units
 
 
-def extract_units_from_placeholder(placeholder: Placeholder, language: str) -> list[Unit]:
-    units = []
+def get_plugin_queryset(plugin_model: type[Model]) -> QuerySet:
+    """
+    Loads only the columns needed to build the units, if the plugin model has no custom extractor
+    or instance dependent validator. Wide plugin tables with json or configuration columns are expensive to load.
+    """
+    plan = get_model_plan(plugin_model)
+    queryset = plugin_model.objects.using(EXTRACTION_DATABASE)
+    if not LOAD_ONLY_TRANSLATABLE_FIELDS or plan.requires_instance:
+        return queryset
+
+    field_names = [translatable_field.field.name for translatable_field in plan.translatable_fields]
+    return queryset.only("plugin_type", *field_names)
+
 
-    cms_plugins = placeholder.get_plugins(language).filter(parent__isnull=True).order_by("position")
+def downcast_plugins(cms_plugins: Iterable[CMSPlugin]) -> dict[int, CMSPlugin]:
+    """
+    Downcasts the given plugins with one query per plugin model, like cms.utils.plugins.downcast_plugins.
+    Plugins that are not installed or have no row in their model table are missing in the result.
+    Plugins without translatable fields are returned as they are, they are only needed for the tree structure.
+    """
+    instances = {}
+    pks_by_model = defaultdict(list)
 
     for cms_plugin in cms_plugins:
-        logger.debug(f"Plugin: {cms_plugin.pk}, type={cms_plugin.plugin_type}")
-        units += extract_units_from_plugin(cms_plugin)
-    return units
+        try:
+            plugin_model = get_plugin_class(cms_plugin.plugin_type).model
+        except KeyError:
+            logger.debug(f"Plugin not installed: {cms_plugin.plugin_type} (pk={cms_plugin.pk})")
+            continue
+
+        if not has_translatable_fields(plugin_model):
+            instances[cms_plugin.pk] = cms_plugin
+            continue
+
+        concrete_model = plugin_model._meta.concrete_model
+        if concrete_model is CMSPlugin:
+            cms_plugin.__class__ = plugin_model
+            instances[cms_plugin.pk] = cms_plugin
+        else:
+            pks_by_model[concrete_model].append(cms_plugin.pk)
+
+    for concrete_model, pks in pks_by_model.items():
+        for instance in get_plugin_queryset(concrete_model).filter(pk__in=pks):
+            # Cast to the original plugin model, which could be a proxy model
+            instance.__class__ = get_plugin_class(instance.plugin_type).model
+            instances[instance.pk] = instance
+
+    return instances
+
+
+def filter_plugins_by_scope(queryset: QuerySet, scope: ExportScope | None) -> QuerySet:
+    if scope is None:
+        return queryset
+    if scope.include_plugin_types:
+        queryset = queryset.filter(plugin_type__in=scope.include_plugin_types)
+    if scope.exclude_plugin_types:
+        queryset = queryset.exclude(plugin_type__in=scope.exclude_plugin_types)
+    return queryset
+
+
+def build_plugin_tree(cms_plugins: Sequence[CMSPlugin], instances: dict[int, CMSPlugin]) -> Generator[CMSPlugin]:
+    """
+    Yields the downcasted instances of the plugins of one placeholder in tree order:
+    Every plugin is followed by its children, siblings are ordered by position.
+    Plugins whose parent is not in the given plugins take the place of their parent.
+    """
+    plugin_ids = {cms_plugin.pk for cms_plugin in cms_plugins}
+    children_by_parent_id = defaultdict(list)
+    for cms_plugin in sorted(cms_plugins, key=lambda cms_plugin: cms_plugin.position):
+        parent_id = cms_plugin.parent_id if cms_plugin.parent_id in plugin_ids else None
+        children_by_parent_id[parent_id].append(cms_plugin.pk)
+
+    stack = list(reversed(children_by_parent_id[None]))
+    while stack:
+        plugin_id = stack.pop()
+
+        instance = instances.get(plugin_id)
+        if instance is None:
+            # Children of a missing plugin are skipped too
+            continue
+
+        yield instance
+        stack.extend(reversed(children_by_parent_id[plugin_id]))
+
+
+type PluginTrees = dict[tuple[int, str], list[CMSPlugin]]
+
+
+def get_plugin_trees(
+    placeholders_with_language: Iterable[tuple[Placeholder, str]],
+    scope: ExportScope | None = None,
+) -> PluginTrees:
+    """
+    Loads the plugins of many placeholders, each in its own language, with one query
+    and downcasts them with one query per plugin model. Returns the plugin trees by placeholder id and language.
+    """
+    keys = {(placeholder.pk, language) for placeholder, language in placeholders_with_language}
+    if not keys:
+        return {}
+
+    queryset = CMSPlugin.objects.using(EXTRACTION_DATABASE).filter(
+        placeholder_id__in={placeholder_id for placeholder_id, _ in keys},
+        language__in={language for _, language in keys},
+    )
+    cms_plugins = [
+        cms_plugin
+        for cms_plugin in filter_plugins_by_scope(queryset, scope)
+        if (cms_plugin.placeholder_id, cms_plugin.language) in keys
+    ]
+    instances = downcast_plugins(cms_plugins)
+
+    cms_plugins_by_key = defaultdict(list)
+    for cms_plugin in cms_plugins:
+        cms_plugins_by_key[(cms_plugin.placeholder_id, cms_plugin.language)].append(cms_plugin)
+
+    return {key: list(build_plugin_tree(cms_plugins_by_key[key], instances)) for key in keys}
+
+
+def get_plugin_tree(placeholder: Placeholder, language: str, scope: ExportScope | None = None) -> Generator[CMSPlugin]:
+    """
+    Loads all plugins of a placeholder in one query and yields the downcasted instances in tree order
+    """
+    queryset = filter_plugins_by_scope(placeholder.get_plugins(language).using(EXTRACTION_DATABASE), scope)
+    cms_plugins = list(queryset.order_by("position"))
+    yield from build_plugin_tree(cms_plugins, downcast_plugins(cms_plugins))
+
+
+def iter_units_or_pending_from_placeholder(
+    placeholder: Placeholder,
+    language: str,
+    scope: ExportScope | None = None,
+    plugin_trees: PluginTrees | None = None,
+) -> Generator[UnitOrPending]:
+    plugin_tree: Iterable[CMSPlugin]
+    if plugin_trees is None:
+        plugin_tree = get_plugin_tree(placeholder, language, scope)
+    else:
+        plugin_tree = plugin_trees.get((placeholder.pk, language), [])
+
+    for instance in plugin_tree:
+        logger.debug(f"Plugin: {instance.pk}, type={instance.plugin_type}")
+        yield from iter_units_or_pending_from_plugin_instance(instance)
+
+
+def iter_units_from_placeholder(
+    placeholder: Placeholder,
+    language: str,
+    scope: ExportScope | None = None,
+) -> Generator[Unit]:
+    return resolve_units(iter_units_or_pending_from_placeholder(placeholder, language, scope))
+
+
+def extract_units_from_placeholder(
+    placeholder: Placeholder, language: str, scope: ExportScope | None = None
+) -> list[Unit]:
+    return list(iter_units_from_placeholder(placeholder, language, scope))
+
+
+# Declared placeholders per template name, together with the template mtime they were read at
+_declared_placeholders_cache: dict[str, tuple[float | None, list[DeclaredPlaceholder]]] = {}
+
+
+def clear_declared_placeholders_cache() -> None:
+    """
+    Clears the cached declared placeholders. Changes of the template itself are detected by its mtime,
+    changes of extended or included templates are not.
+    """
+    _declared_placeholders_cache.clear()
+
+
+def get_declared_placeholders_for_template(template: str) -> list[DeclaredPlaceholder]:
+    mtime = get_template_mtime(template)
+
+    cached = _declared_placeholders_cache.get(template)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    declared_placeholders = _get_template_placeholders_original(template)
+    _declared_placeholders_cache[template] = (mtime, declared_placeholders)
+    return declared_placeholders
 
 
 def get_declared_placeholders_for_obj(obj: XliffObj) -> list[DeclaredPlaceholder]:
@@ -133,53 +420,103 @@ def get_declared_placeholders_for_obj(obj: XliffObj) -> list[DeclaredPlaceholder
     if isinstance(obj, AliasContent):
         return [DeclaredPlaceholder(slot=obj.name, inherit=False)]
 
+    template = getattr(obj, "get_template", lambda: None)()
+    if template:
+        return get_declared_placeholders_for_template(template)
+
     return _get_declared_placeholders_for_obj_original(obj=obj)
 
 
-def get_page_content_placeholders(page_content: PageContent) -> Generator[Placeholder]:
-    declared_placeholders_slots = [pl.slot for pl in get_declared_placeholders_for_obj(page_content)]
-    logger.debug(f"Declared placeholders in page: {declared_placeholders_slots}")
+def resolve_declared_placeholders(
+    objs: Sequence[XliffObj],
+    scope: ExportScope | None = None,
+) -> list[list[Placeholder]]:
+    """
+    Resolves the declared placeholders of PageContent and AliasContent objects with one query per model.
+    Returns the placeholders of every object in declared order. Declared slots without a placeholder are skipped,
+    slots outside the scope are never queried.
+    """
+    declared_slots = [
+        [pl.slot for pl in get_declared_placeholders_for_obj(obj) if scope is None or scope.is_slot_included(pl.slot)]
+        for obj in objs
+    ]
+
+    objs_by_model = defaultdict(list)
+    for obj, slots in zip(objs, declared_slots, strict=True):
+        objs_by_model[type(obj)].append((obj, slots))
+
+    placeholders_by_key = {}
+    for model, objs_with_slots in objs_by_model.items():
+        placeholders = Placeholder.objects.using(EXTRACTION_DATABASE).filter(
+            content_type=ContentType.objects.db_manager(EXTRACTION_DATABASE).get_for_model(model),
+            object_id__in={obj.pk for obj, _ in objs_with_slots},
+            slot__in={slot for _, slots in objs_with_slots for slot in slots},
+        )
+        for placeholder in placeholders:
+            placeholders_by_key[(model, placeholder.object_id, placeholder.slot)] = placeholder
+
+    resolved = []
+    for obj, slots in zip(objs, declared_slots, strict=True):
+        logger.debug(f"Declared placeholders in {obj._meta.object_name} {obj.pk}: {slots}")
+
+        obj_placeholders = []
+        for slot in slots:
+            placeholder = placeholders_by_key.get((type(obj), obj.pk, slot))
+            if placeholder is None:
+                logger.warning(f'Declared placeholder "{slot}" does not exist for {obj._meta.object_name} {obj.pk}')
+                continue
+            obj_placeholders.append(placeholder)
+        resolved.append(obj_placeholders)
 
-    for declared_placeholders_slot in declared_placeholders_slots:
-        yield page_content.placeholders.get(slot=declared_placeholders_slot)
+    return resolved
 
 
-def get_alias_placeholders(alias_content: AliasContent) -> Generator[Placeholder]:
-    declared_placeholders_slots = [pl.slot for pl in get_declared_placeholders_for_obj(alias_content)]
-    logger.debug(f"Alias placeholders in page: {declared_placeholders_slots}")
+def get_page_content_placeholders(page_content: PageContent, scope: ExportScope | None = None) -> list[Placeholder]:
+    return resolve_declared_placeholders([page_content], scope)[0]
 
-    for declared_placeholders_slot in declared_placeholders_slots:
-        yield alias_content.placeholders.get(slot=declared_placeholders_slot)
 
+def get_alias_placeholders(alias_content: AliasContent, scope: ExportScope | None = None) -> list[Placeholder]:
+    return resolve_declared_placeholders([alias_content], scope)[0]
 
-def get_model_placeholders(obj: type[Model]):
+
+def get_model_placeholders(obj: Model, scope: ExportScope | None = None):
     placeholders = []
-    for field in obj._meta.fields:
-        field_type = type(field)
+    for field in get_instance_plan(obj).placeholder_fields:
+        placeholder = getattr(obj, field.name, None)
+        if not placeholder:
+            continue
 
-        if field_type in [PlaceholderRelationField] or (
-            field_type == OneToOneField and field.related_model == StaticPlaceholder
-        ):
-            placeholder = getattr(obj, field.name, None)
-            if not placeholder:
-                continue
+        if scope is not None and not scope.is_slot_included(placeholder.slot):
+            continue
 
-            draft = getattr(placeholder, "draft", None)
-            if draft:
-                placeholders.append(draft)
-            else:
-                placeholders.append(placeholder)
+        draft = getattr(placeholder, "draft", None)
+        if draft:
+            placeholders.append(draft)
+        else:
+            placeholders.append(placeholder)
 
     return placeholders
 
 
-def get_placeholders(obj: XliffObj):
+def get_placeholders(obj: XliffObj, scope: ExportScope | None = None):
     if type(obj) is PageContent:
-        return get_page_content_placeholders(obj)
+        return get_page_content_placeholders(obj, scope)
     elif type(obj) is AliasContent:
-        return get_alias_placeholders(obj)
+        return get_alias_placeholders(obj, scope)
     else:
-        return get_model_placeholders(obj)  # type: ignore
+        return get_model_placeholders(obj, scope)  # type: ignore
+
+
+def get_placeholders_for_objs(objs: Sequence[XliffObj], scope: ExportScope | None = None) -> list[list[Placeholder]]:
+    content_objs = [obj for obj in objs if type(obj) in (PageContent, AliasContent)]
+    content_placeholders = dict(
+        zip(map(id, content_objs), resolve_declared_placeholders(content_objs, scope), strict=True)
+    )
+
+    return [
+        content_placeholders[id(obj)] if id(obj) in content_placeholders else get_model_placeholders(obj, scope)  # type: ignore
+        for obj in objs
+    ]
 
 
 def get_metadata_fields(obj: XliffObj) -> tuple[XliffObj, dict]:
@@ -210,26 +547,30 @@ def get_metadata_fields(obj: XliffObj) -> tuple[XliffObj, dict]:
 
 
 def extract_metadata_from_obj(obj, language: str, plugin_id_func: Callable | None = None) -> list[Unit]:
+    get_plugin_id = plugin_id_func or get_plugin_id_for_metadata_obj
+
     with translation.override(language):
         target_obj, fields = get_metadata_fields(obj)
+        plugin_id = get_plugin_id(target_obj)
 
         final_units = []
 
         for field_name, field_verbose_name in fields.items():
             # The slug for PageContent is not on the content, we need to lookup the PageUrl model
             if field_name == "slug" and type(obj) is PageContent:
+                page_url = obj.page.get_url_obj(language)
                 units = extract_units_from_obj_by_field_name(
-                    obj=obj.page.get_url_obj(language),
+                    obj=page_url,
                     field_name=field_name,
                     field_verbose_name=field_verbose_name,
-                    plugin_id_func=plugin_id_func,
+                    plugin_id=get_plugin_id(page_url),
                 )
             else:
                 units = extract_units_from_obj_by_field_name(
                     obj=target_obj,
                     field_name=field_name,
                     field_verbose_name=field_verbose_name,
-                    plugin_id_func=plugin_id_func,
+                    plugin_id=plugin_id,
                 )
 
             final_units.extend(units)
@@ -237,26 +578,64 @@ def extract_metadata_from_obj(obj, language: str, plugin_id_func: Callable | Non
         return final_units
 
 
+def prefetch_metadata_relations(objs: Iterable[XliffObj]) -> None:
+    """
+    Loads the page urls of all page contents with one query, the slug of a page content is stored on its PageUrl.
+    Page contents whose urls were already prefetched are skipped.
+    """
+    page_contents = [obj for obj in objs if type(obj) is PageContent]
+    prefetch_related_objects(page_contents, "page__urls")
+
+
+def extract_metadata_from_objs(objs: Sequence[XliffObj], language: str) -> list[list[Unit]]:
+    """
+    Extracts the metadata of many objects, in the order of the objects.
+    Page urls are prefetched and the id prefix of each model is only computed once,
+    so the number of queries does not grow with the number of objects.
+    """
+    prefetch_metadata_relations(objs)
+
+    content_type_ids: dict[type[Model], int] = {}
+
+    def get_plugin_id(obj: Model) -> str:
+        model = type(obj)
+        if model not in content_type_ids:
+            content_type_ids[model] = ContentType.objects.db_manager(EXTRACTION_DATABASE).get_for_model(model).pk
+        return get_unit_id_format(UNIT_ID_METADATA_ID, content_type_ids[model], obj.pk)
+
+    return [extract_metadata_from_obj(obj, language, plugin_id_func=get_plugin_id) for obj in objs]
+
+
 def extract_units_from_obj_by_field_name(
     obj: XliffObj,
     field_name: str,
     field_verbose_name: str,
     plugin_id_func: Callable | None = None,
+    plugin_id: str | None = None,
 ) -> list[Unit]:
-    plugin_id = plugin_id_func(obj) if plugin_id_func else get_plugin_id_for_metadata_obj(obj)
+    if plugin_id is None:
+        plugin_id = plugin_id_func(obj) if plugin_id_func else get_plugin_id_for_metadata_obj(obj)
 
-    target_obj_field = obj._meta.get_field(field_name)
+    translatable_field = get_instance_plan(obj).get_translatable_field(field_name)
 
-    if not is_field_to_translate(target_obj_field, obj):  # type: ignore
+    if translatable_field is None:
+        # Make sure misconfigured metadata fields still raise FieldDoesNotExist
+        obj._meta.get_field(field_name)
         return []
 
+    if not translatable_field.is_valid_for(obj):  # type: ignore
+        return []
+
+    target_obj_field = translatable_field.field
     source = target_obj_field.value_from_object(obj)
     if not source:
         return []
 
-    target_obj_field_type = type(target_obj_field)
-    if target_obj_field_type in FIELD_EXTRACTORS:
-        return FIELD_EXTRACTORS[target_obj_field_type](instance=obj, field=target_obj_field, source=source)
+    if translatable_field.batch_extractor:
+        return list(translatable_field.batch_extractor([(obj, target_obj_field, source)])[0])
+
+    if translatable_field.extractor:
+        return translatable_field.extractor(instance=obj, field=target_obj_field, source=source)
 
     return [
         Unit(
@@ -264,73 +643,294 @@ def extract_units_from_obj_by_field_name(
             plugin_type=obj._meta.object_name or "",
             plugin_name=obj._meta.verbose_name or "",
             field_name=target_obj_field.name,
-            field_type=get_type_with_path(target_obj_field),  # type: ignore
+            field_type=translatable_field.field_type,
             field_verbose_name=field_verbose_name,
-            source=target_obj_field.value_from_object(obj),
+            source=source,
             max_length=target_obj_field.max_length,
         )
     ]
 
 
-def extract_extension_data_from_page(obj: XliffObj, language: str) -> list[Unit]:
-    obj = cast(PageContent, obj)
+def get_page_content_extensions(page_contents: Sequence[PageContent], language: str) -> dict[int, list[Model]]:
+    """
+    Loads the title and page extensions of many page contents with one query per registered extension model.
+    Returns the extensions by page content id, title extensions first.
+    """
+    extensions = defaultdict(list)
 
-    with translation.override(language):
-        units = []
-        title_extensions = extension_pool.page_content_extensions
-        for title_extension_class in title_extensions:
-            with suppress(title_extension_class.DoesNotExist):
-                instance = title_extension_class.objects.get(
-                    extended_object__id=obj.pk,
-                    extended_object__language=language,
-                )
-                units.extend(
-                    extract_metadata_from_obj(
-                        obj=instance,
-                        language=language,
-                        plugin_id_func=get_plugin_id_for_extension_obj,
-                    )
-                )
+    page_content_ids = [page_content.pk for page_content in page_contents]
+    for title_extension_class in extension_pool.page_content_extensions:
+        instances = title_extension_class.objects.using(EXTRACTION_DATABASE).filter(
+            extended_object__in=page_content_ids,
+            extended_object__language=language,
+        )
+        for instance in instances:
+            extensions[instance.extended_object_id].append(instance)
 
-        # In rare cases it makes sense to use translated fields on page extensions
-        for page_extension_class in extension_pool.page_extensions:
-            with suppress(page_extension_class.DoesNotExist):
-                instance = page_extension_class.objects.get(extended_object=obj.page)
-                units.extend(
-                    extract_metadata_from_obj(
-                        obj=instance,
-                        language=language,
-                        plugin_id_func=get_plugin_id_for_extension_obj,
-                    )
-                )
+    # In rare cases it makes sense to use translated fields on page extensions
+    page_content_ids_by_page_id = defaultdict(list)
+    for page_content in page_contents:
+        page_content_ids_by_page_id[page_content.page_id].append(page_content.pk)
 
-        return units
+    for page_extension_class in extension_pool.page_extensions:
+        page_extensions = page_extension_class.objects.using(EXTRACTION_DATABASE).filter(
+            extended_object__in=page_content_ids_by_page_id.keys()
+        )
+        for instance in page_extensions:
+            for page_content_id in page_content_ids_by_page_id[instance.extended_object_id]:
+                extensions[page_content_id].append(instance)
 
+    return extensions
 
-def extract_units_from_obj(
-    obj: XliffObj,
+
+def extract_extension_data_from_page_contents(
+    page_contents: Sequence[PageContent],
     language: str,
-    include_metadata=True,
-    allow_empty_plugins=False,
-) -> list[Unit]:
-    plugin_units = []
+) -> dict[int, list[Unit]]:
+    extensions = get_page_content_extensions(page_contents, language)
+
+    return {
+        page_content.pk: [
+            unit
+            for instance in extensions[page_content.pk]
+            for unit in extract_metadata_from_obj(
+                obj=instance,
+                language=language,
+                plugin_id_func=get_plugin_id_for_extension_obj,
+            )
+        ]
+        for page_content in page_contents
+    }
 
-    for placeholder in get_placeholders(obj):
+
+def extract_extension_data_from_page(obj: XliffObj, language: str) -> list[Unit]:
+    obj = cast(PageContent, obj)
+    return extract_extension_data_from_page_contents([obj], language)[obj.pk]
+
+
+def iter_units_or_pending_from_placeholders(
+    placeholders: Iterable[Placeholder],
+    language: str,
+    scope: ExportScope | None = None,
+    plugin_trees: PluginTrees | None = None,
+) -> Generator[UnitOrPending]:
+    for placeholder in placeholders:
         logger.debug(
             f"Placeholder: {placeholder.pk}, is_static={placeholder.is_static}, "
             f"is_editable={placeholder.is_editable}, label={placeholder.get_label()}"
         )
-        plugin_units.extend(extract_units_from_placeholder(placeholder, language))
+        yield from iter_units_or_pending_from_placeholder(placeholder, language, scope, plugin_trees)
+
 
-    if not allow_empty_plugins and len(plugin_units) == 0:
+def iter_units_or_pending_from_obj(
+    obj: XliffObj,
+    language: str,
+    include_metadata=True,
+    allow_empty_plugins=False,
+    placeholders: Iterable[Placeholder] | None = None,
+    extension_data_units: list[Unit] | None = None,
+    scope: ExportScope | None = None,
+    plugin_trees: PluginTrees | None = None,
+    metadata_units: list[Unit] | None = None,
+) -> Generator[UnitOrPending]:
+    if placeholders is None:
+        placeholders = get_placeholders(obj, scope)
+
+    plugin_units = iter_units_or_pending_from_placeholders(placeholders, language, scope, plugin_trees)
+
+    # Look ahead one plugin unit, so empty objects fail before anything was yielded
+    first_plugin_unit = next(plugin_units, None)
+    if not allow_empty_plugins and first_plugin_unit is None:
         raise XliffExportError(gettext("No plugins found. You need to copy plugins from an existing page"))
 
-    metadata_units = []
     if include_metadata:
-        metadata_units.extend(extract_metadata_from_obj(obj=obj, language=language))
+        if metadata_units is None:
+            metadata_units = extract_metadata_from_obj(obj=obj, language=language)
+        yield from metadata_units
 
-    extension_data_units = []
     if type(obj) is PageContent:
-        extension_data_units.extend(extract_extension_data_from_page(obj, language))
+        if extension_data_units is None:
+            extension_data_units = extract_extension_data_from_page(obj, language)
+        yield from extension_data_units
+
+    if first_plugin_unit is not None:
+        yield first_plugin_unit
+        yield from plugin_units
+
+
+def iter_units_from_obj(
+    obj: XliffObj,
+    language: str,
+    include_metadata=True,
+    allow_empty_plugins=False,
+    placeholders: Iterable[Placeholder] | None = None,
+    extension_data_units: list[Unit] | None = None,
+    scope: ExportScope | None = None,
+) -> Generator[Unit]:
+    """
+    Yields the units of an object lazily: metadata first, then extension data and then the units of all plugins.
+    Only the plugin tree of the placeholder that is currently extracted is held in memory.
+    Placeholders and extension data units can be passed in, if they were loaded for many objects at once.
+    The scope restricts the plugin units to some placeholder slots and plugin types.
+    """
+    return resolve_units(
+        iter_units_or_pending_from_obj(
+            obj=obj,
+            language=language,
+            include_metadata=include_metadata,
+            allow_empty_plugins=allow_empty_plugins,
+            placeholders=placeholders,
+            extension_data_units=extension_data_units,
+            scope=scope,
+        )
+    )
+
+
+def iter_units_from_objs(
+    objs: Iterable[XliffObj],
+    language: str,
+    include_metadata=True,
+    allow_empty_plugins=False,
+    visited_placeholder_ids: set[int] | None = None,
+    scope: ExportScope | None = None,
+) -> Generator[tuple[XliffObj, list[Unit]]]:
+    """
+    Yields every object with its units. Placeholders, plugins and extensions are loaded for batches of objects,
+    instead of running the same queries for every object. Batch extractors are called once per batch.
+
+    Placeholders shared by many objects, like static placeholders, are only extracted for the first object
+    that references them. Pass visited_placeholder_ids to share this across many calls of one export.
+    """
+    if visited_placeholder_ids is None:
+        visited_placeholder_ids = set()
+
+    for batch in batched(objs, EXPORT_BATCH_SIZE, strict=False):
+        placeholders = get_placeholders_for_objs(batch, scope)
+
+        page_contents = [obj for obj in batch if type(obj) is PageContent]
+        extension_data_units = extract_extension_data_from_page_contents(page_contents, language)
+        metadata_units: list[list[Unit] | None] = [None] * len(batch)
+        if include_metadata:
+            metadata_units = list(extract_metadata_from_objs(batch, language))
+
+        unvisited_placeholders_by_obj = []
+        for obj_placeholders in placeholders:
+            unvisited_placeholders = [pl for pl in obj_placeholders if pl.pk not in visited_placeholder_ids]
+            visited_placeholder_ids.update(pl.pk for pl in unvisited_placeholders)
+            unvisited_placeholders_by_obj.append(unvisited_placeholders)
+
+        plugin_trees = get_plugin_trees(
+            (
+                (placeholder, language)
+                for obj_placeholders in unvisited_placeholders_by_obj
+                for placeholder in obj_placeholders
+            ),
+            scope,
+        )
+
+        units_or_pending_by_obj = []
+        for obj, obj_placeholders, unvisited_placeholders, obj_metadata_units in zip(
+            batch, placeholders, unvisited_placeholders_by_obj, metadata_units, strict=True
+        ):
+            # An object is not empty, if its plugins were already extracted with another object
+            has_visited_placeholders = len(unvisited_placeholders) < len(obj_placeholders)
+
+            obj_units_or_pending = iter_units_or_pending_from_obj(
+                obj=obj,
+                language=language,
+                include_metadata=include_metadata,
+                allow_empty_plugins=allow_empty_plugins or has_visited_placeholders,
+                placeholders=unvisited_placeholders,
+                extension_data_units=extension_data_units.get(obj.pk) if type(obj) is PageContent else None,
+                scope=scope,
+                plugin_trees=plugin_trees,
+                metadata_units=obj_metadata_units,
+            )
+            units_or_pending_by_obj.append((obj, list(obj_units_or_pending)))
+
+        run_batch_extractors(chain.from_iterable(units_or_pending for _, units_or_pending in units_or_pending_by_obj))
+
+        for obj, units_or_pending in units_or_pending_by_obj:
+            yield obj, list(resolve_units(units_or_pending))
+
+
+def get_subtree_page_contents(page_content: PageContent, language: str) -> list[PageContent]:
+    """
+    Returns the latest page contents of a page and all its descendants in tree order, with their pages and page urls.
+    Descendants without a page content in the language are skipped.
+    """
+    page = page_content.page
+    return list(
+        PageContent.admin_manager.using(EXTRACTION_DATABASE)
+        .latest_content(page__path__startswith=page.path, page__depth__gte=page.depth, language=language)
+        .select_related("page")
+        .prefetch_related("page__urls")
+        .order_by("page__path")
+    )
+
+
+def extract_units_from_objs_by_language(
+    objs_by_language: dict[str, XliffObj],
+    include_metadata=True,
+    allow_empty_plugins=False,
+    scope: ExportScope | None = None,
+) -> dict[str, list[Unit]]:
+    """
+    Extracts the units of one object in many languages, e.g. the page contents of a page.
+    The placeholders of all languages are loaded with one query per model and their plugins with one query,
+    plus one query per plugin model.
+    """
+    languages = list(objs_by_language.keys())
+    objs = list(objs_by_language.values())
+    placeholders = get_placeholders_for_objs(objs, scope)
+
+    plugin_trees = get_plugin_trees(
+        (
+            (placeholder, language)
+            for language, obj_placeholders in zip(languages, placeholders, strict=True)
+            for placeholder in obj_placeholders
+        ),
+        scope,
+    )
+
+    if include_metadata:
+        prefetch_metadata_relations(objs)
+
+    units_by_language = {}
+    for language, obj, obj_placeholders in zip(languages, objs, placeholders, strict=True):
+        units_or_pending = iter_units_or_pending_from_obj(
+            obj=obj,
+            language=language,
+            include_metadata=include_metadata,
+            allow_empty_plugins=allow_empty_plugins,
+            placeholders=obj_placeholders,
+            scope=scope,
+            plugin_trees=plugin_trees,
+        )
+        units_by_language[language] = list(units_or_pending)
+
+    run_batch_extractors(chain.from_iterable(units_by_language.values()))
+
+    return {language: list(resolve_units(units_or_pending)) for language, units_or_pending in units_by_language.items()}
+
+
+def extract_units_from_obj(
+    obj: XliffObj,
+    language: str,
+    include_metadata=True,
+    allow_empty_plugins=False,
+    scope: ExportScope | None = None,
+) -> list[Unit]:
+    def extract() -> list[Unit]:
+        return list(
+            iter_units_from_obj(
+                obj=obj,
+                language=language,
+                include_metadata=include_metadata,
+                allow_empty_plugins=allow_empty_plugins,
+                scope=scope,
+            )
+        )
 
-    return [*metadata_units, *extension_data_units, *plugin_units]
+    scope_key = scope.get_cache_key() if scope else ""
+    return get_or_extract_units(obj, language, extract, include_metadata, allow_empty_plugins, scope_key)
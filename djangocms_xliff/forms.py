@@ -2,6 +2,12 @@ from django import forms
 from django.conf import settings
 from django.utils.translation import gettext_lazy
 
+from djangocms_xliff.types import ExportScope
+
+
+def split_names(value: str) -> tuple[str, ...]:
+    return tuple(name.strip() for name in value.split(",") if name.strip())
+
 
 class ExportForm(forms.Form):
     source_language = forms.ChoiceField(
@@ -11,6 +17,33 @@ class ExportForm(forms.Form):
             "It serves as an orientation for the translator in the XLIFF tool."
         ),
     )
+    include_slots = forms.CharField(
+        label=gettext_lazy("Only export placeholders:"),
+        help_text=gettext_lazy("Comma separated placeholder slots, e.g. main. Leave empty to export all."),
+        required=False,
+    )
+    exclude_slots = forms.CharField(label=gettext_lazy("Do not export placeholders:"), required=False)
+    include_plugin_types = forms.CharField(
+        label=gettext_lazy("Only export plugins:"),
+        help_text=gettext_lazy("Comma separated plugin types, e.g. TextPlugin. Leave empty to export all."),
+        required=False,
+    )
+    exclude_plugin_types = forms.CharField(label=gettext_lazy("Do not export plugins:"), required=False)
+    only_untranslated = forms.BooleanField(
+        label=gettext_lazy("Only export untranslated texts"),
+        help_text=gettext_lazy("Texts that are the same as in the source language or empty."),
+        required=False,
+    )
+    only_changed = forms.BooleanField(
+        label=gettext_lazy("Only export changes since the last export"),
+        help_text=gettext_lazy("Texts that are new or changed since the last export or import."),
+        required=False,
+    )
+    compress = forms.BooleanField(
+        label=gettext_lazy("Compress the file"),
+        help_text=gettext_lazy("Download a gzip compressed file, which is much smaller for large exports."),
+        required=False,
+    )
 
     def __init__(self, current_language: str, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -18,6 +51,27 @@ class ExportForm(forms.Form):
             (code, name) for code, name in settings.LANGUAGES if code != current_language
         ]
 
+    def get_scope(self) -> ExportScope:
+        return ExportScope(
+            include_slots=split_names(self.cleaned_data["include_slots"]),
+            exclude_slots=split_names(self.cleaned_data["exclude_slots"]),
+            include_plugin_types=split_names(self.cleaned_data["include_plugin_types"]),
+            exclude_plugin_types=split_names(self.cleaned_data["exclude_plugin_types"]),
+        )
+
+
+class ExportSubtreeForm(ExportForm):
+    bundle = forms.BooleanField(
+        label=gettext_lazy("One file per page"),
+        help_text=gettext_lazy("Download a ZIP file with one XLIFF file per page and a manifest."),
+        required=False,
+    )
+
+    def __init__(self, current_language: str, *args, **kwargs):
+        super().__init__(current_language, *args, **kwargs)
+        # The untranslated mode compares single pages only
+        del self.fields["only_untranslated"]
+
 
 class UploadFileForm(forms.Form):
     file = forms.FileField(label=gettext_lazy("File to import"))
@@ -1,13 +1,15 @@
 import logging
+from dataclasses import replace
 
-from cms.models import CMSPlugin, PageUrl
+from cms.models import CMSPlugin, PageContent, PageUrl
 from django.utils import translation
 from django.utils.translation import gettext
 from djangocms_alias.models import AliasContent
 
 from djangocms_xliff.exceptions import XliffImportError
+from djangocms_xliff.ledger import record_imported_units
+from djangocms_xliff.registry import get_field_handlers_for_type_path
 from djangocms_xliff.settings import (
-    FIELD_IMPORTERS,
     UNIT_ID_DELIMITER,
     UNIT_ID_EXTENSION_DATA_ID,
     UNIT_ID_METADATA_ID,
@@ -58,8 +60,9 @@ def save_xliff_units_for_cms_plugin(units: list[Unit], plugin_id: str) -> None:
         field_name = unit.field_name
         target = unit.target
 
-        if unit.field_type in FIELD_IMPORTERS:
-            instance = FIELD_IMPORTERS[unit.field_type](instance=instance, unit=unit)
+        importer = get_field_handlers_for_type_path(unit.field_type).importer
+        if importer:
+            instance = importer(instance=instance, unit=unit)
         else:
             setattr(instance, field_name, target)
 
@@ -75,6 +78,39 @@ def save_xliff_context(xliff_context: XliffContext) -> None:
         else:
             save_xliff_units_for_cms_plugin(units, plugin_id)
 
+    record_imported_units(
+        xliff_context.content_type_id, xliff_context.obj_id, xliff_context.target_language, xliff_context.units
+    )
+
+
+def merge_xliff_contexts(xliff_contexts: list[XliffContext]) -> list[XliffContext]:
+    """
+    Merges the contexts of the same object and language, e.g. from the shards of a split export,
+    in the order they were found. Units that are in more than one shard are only kept once.
+    """
+    merged_contexts: dict[tuple, XliffContext] = {}
+    unit_ids: dict[tuple, set[str]] = {}
+    for xliff_context in xliff_contexts:
+        key = (xliff_context.content_type_id, xliff_context.obj_id, xliff_context.target_language)
+        if key not in merged_contexts:
+            merged_contexts[key] = replace(xliff_context, units=[])
+            unit_ids[key] = set()
+
+        for unit in xliff_context.units:
+            if unit.id not in unit_ids[key]:
+                unit_ids[key].add(unit.id)
+                merged_contexts[key].units.append(unit)
+
+    return list(merged_contexts.values())
+
+
+def save_xliff_contexts(xliff_contexts: list[XliffContext]) -> None:
+    """
+    Saves every <file> of a document to its own object
+    """
+    for xliff_context in xliff_contexts:
+        save_xliff_context(xliff_context)
+
 
 def validate_page_with_xliff_context(xliff_context: XliffContext, current_language: str) -> None:
     xliff_target_language = xliff_context.target_language
@@ -157,6 +193,46 @@ def validate_xliff(
     validate_page_with_xliff_context(xliff_context, current_language)
 
 
+def is_other_page(current_obj: XliffObj, xliff_obj: XliffObj) -> bool:
+    return (
+        type(current_obj) is PageContent and type(xliff_obj) is PageContent and current_obj.page_id != xliff_obj.page_id
+    )
+
+
+def validate_subtree_obj(current_obj: XliffObj, xliff_obj: XliffObj) -> None:
+    is_descendant = (
+        type(current_obj) is PageContent
+        and type(xliff_obj) is PageContent
+        and xliff_obj.page.path.startswith(current_obj.page.path)
+    )
+    if not is_descendant:
+        raise XliffImportError(
+            gettext(
+                "The XLIFF file contains a page, that is not a subpage of this page. "
+                "Please make sure to import the XLIFF file to the page it was exported from."
+            )
+        )
+
+
+def validate_xliff_files(
+    current_obj: XliffObj,
+    xliff_objs: list[XliffObj],
+    xliff_contexts: list[XliffContext],
+    current_language: str,
+) -> None:
+    """
+    Every file of a document must belong to the current object or one of its subpages, in any order,
+    so that any subset of the shards of an export can be imported
+    """
+    for xliff_obj, xliff_context in zip(xliff_objs, xliff_contexts, strict=True):
+        if is_other_page(current_obj, xliff_obj):
+            validate_subtree_obj(current_obj, xliff_obj)
+        else:
+            validate_current_obj(current_obj, xliff_obj)
+        validate_units_max_lengths(xliff_context.units)
+        validate_page_with_xliff_context(xliff_context, current_language)
+
+
 def compare_units(
     units_to_import: list[Unit],
     units_from_database: list[Unit],
@@ -0,0 +1,144 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.timezone import now
+
+from djangocms_xliff.models import ExportLedgerEntry
+from djangocms_xliff.types import ExportedHashes, Unit, XliffContext, XliffObj
+from djangocms_xliff.utils import get_text_hash
+
+
+def get_ledger_entries(content_type_id: int, obj_id, language: str):
+    # The ledger is written by exports and imports, so it is always read from the default database
+    return ExportLedgerEntry.objects.using(DEFAULT_DB_ALIAS).filter(
+        content_type_id=content_type_id,
+        object_id=str(obj_id),
+        language=language,
+    )
+
+
+def get_ledger_hashes(obj: XliffObj, language: str) -> dict[str, str]:
+    content_type_id = ContentType.objects.get_for_model(obj).pk
+    return dict(get_ledger_entries(content_type_id, obj.pk, language).values_list("unit_id", "source_hash"))
+
+
+def filter_changed_units(obj: XliffObj, language: str, units: list[Unit]) -> list[Unit]:
+    """
+    Returns the units that are new or whose source changed since the last delta export or import
+    """
+    ledger_hashes = get_ledger_hashes(obj, language)
+    return [unit for unit in units if ledger_hashes.get(unit.id) != get_text_hash(unit.source)]
+
+
+def has_ledger_entries(content_type_id: int, obj_id, language: str) -> bool:
+    return get_ledger_entries(content_type_id, obj_id, language).exists()
+
+
+def update_or_create_ledger_entries(entries: list[ExportLedgerEntry]) -> None:
+    """
+    Fallback for databases without ON CONFLICT with a target, e.g. MySQL and MariaDB:
+    the existing entries are updated and the missing ones created
+    """
+    entry = entries[0]
+    existing_entries = {
+        existing_entry.unit_id: existing_entry
+        for existing_entry in get_ledger_entries(entry.content_type_id, entry.object_id, entry.language).filter(
+            unit_id__in=[entry.unit_id for entry in entries]
+        )
+    }
+
+    entries_to_update = []
+    entries_to_create = []
+    for entry in entries:
+        existing_entry = existing_entries.get(entry.unit_id)
+        if existing_entry is None:
+            entries_to_create.append(entry)
+        else:
+            existing_entry.source_hash = entry.source_hash
+            existing_entry.exported_at = entry.exported_at
+            entries_to_update.append(existing_entry)
+
+    with transaction.atomic(using=DEFAULT_DB_ALIAS):
+        ExportLedgerEntry.objects.using(DEFAULT_DB_ALIAS).bulk_update(
+            entries_to_update, fields=["source_hash", "exported_at"]
+        )
+        ExportLedgerEntry.objects.using(DEFAULT_DB_ALIAS).bulk_create(entries_to_create)
+
+
+def record_unit_hashes(content_type_id: int, obj_id, language: str, hashes: dict[str, str]) -> None:
+    exported_at = now()
+    entries = [
+        ExportLedgerEntry(
+            content_type_id=content_type_id,
+            object_id=str(obj_id),
+            language=language,
+            unit_id=unit_id,
+            source_hash=source_hash,
+            exported_at=exported_at,
+        )
+        for unit_id, source_hash in hashes.items()
+    ]
+    if not entries:
+        return
+
+    if not connections[DEFAULT_DB_ALIAS].features.supports_update_conflicts_with_target:
+        update_or_create_ledger_entries(entries)
+        return
+
+    ExportLedgerEntry.objects.using(DEFAULT_DB_ALIAS).bulk_create(
+        entries,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id", "language", "unit_id"],
+        update_fields=["source_hash", "exported_at"],
+    )
+
+
+def record_exported_units(obj: XliffObj, language: str, units: list[Unit]) -> None:
+    content_type_id = ContentType.objects.get_for_model(obj).pk
+    record_unit_hashes(content_type_id, obj.pk, language, {unit.id: get_text_hash(unit.source) for unit in units})
+
+
+def get_exported_hashes(context: XliffContext) -> ExportedHashes:
+    return (
+        context.content_type_id,
+        context.obj_id,
+        context.target_language,
+        {unit.id: get_text_hash(unit.source) for unit in context.units},
+    )
+
+
+def record_exported_context(context: XliffContext) -> None:
+    record_unit_hashes(*get_exported_hashes(context))
+
+
+def record_exported_hashes(exported_hashes: list[ExportedHashes]) -> None:
+    with transaction.atomic(using=DEFAULT_DB_ALIAS):
+        for content_type_id, obj_id, language, hashes in exported_hashes:
+            record_unit_hashes(content_type_id, obj_id, language, hashes)
+
+
+def get_ledger_content_type_id(content_type_id: int) -> int | None:
+    """
+    Returns the content type id if it exists. Files exported from the admin before every object got its own <file>
+    have the content type 0, they can't be recorded in the ledger.
+    """
+    if not content_type_id:
+        return None
+
+    try:
+        return ContentType.objects.get_for_id(content_type_id).pk
+    except ContentType.DoesNotExist:
+        return None
+
+
+def record_imported_units(content_type_id: int, obj_id, language: str, units: list[Unit]) -> None:
+    """
+    The imported targets are the sources of the next export, they are no changes to export again.
+    Only objects that were exported with only changed units before are recorded.
+    """
+    ledger_content_type_id = get_ledger_content_type_id(content_type_id)
+    if ledger_content_type_id is None or not has_ledger_entries(ledger_content_type_id, obj_id, language):
+        return
+
+    record_unit_hashes(
+        ledger_content_type_id, obj_id, language, {unit.id: get_text_hash(unit.target) for unit in units}
+    )
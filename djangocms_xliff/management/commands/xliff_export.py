@@ -1,11 +1,21 @@
+from collections.abc import Iterable
 from pathlib import Path
 
 from django.conf import settings
 from django.core.management import BaseCommand, CommandError
 
 from djangocms_xliff.exceptions import XliffError
-from djangocms_xliff.exports import export_content_as_xliff
-from djangocms_xliff.utils import get_obj
+from djangocms_xliff.exports import (
+    export_content_as_xliff_contexts_for_languages,
+    export_content_as_xliff_for_languages,
+    export_subtree_as_xliff,
+    iter_recorded_xliff_bundle,
+    iter_subtree_export_contexts,
+)
+from djangocms_xliff.processes import shutdown_process_pool
+from djangocms_xliff.settings import EXTRACTION_DATABASE, SHARD_MAX_BYTES, SHARD_MAX_UNITS, XliffVersion
+from djangocms_xliff.types import ExportContext, ExportScope
+from djangocms_xliff.utils import get_obj, get_obj_in_language, get_xliff_archive_file_name
 
 
 class Command(BaseCommand):
@@ -20,30 +30,148 @@ class Command(BaseCommand):
         parser.add_argument(
             "target_language",
             type=str,
+            nargs="+",
             choices=[code for code, language in settings.LANGUAGES],
         )
+        parser.add_argument("--output-dir", type=Path, default=Path(), help="Directory to write the xliff files to")
+        parser.add_argument(
+            "--zip",
+            action="store_true",
+            help="Write the xliff files of all languages, or all pages with --subtree, into a zip file with a manifest",
+        )
+        parser.add_argument(
+            "--max-units",
+            type=int,
+            default=SHARD_MAX_UNITS,
+            help="Split xliff files with more units into shards, which are written into a zip file",
+        )
+        parser.add_argument(
+            "--max-bytes",
+            type=int,
+            default=SHARD_MAX_BYTES,
+            help="Split xliff files with more bytes into shards, which are written into a zip file",
+        )
+        parser.add_argument("--include-slot", action="append", default=[], help="Only export these placeholder slots")
+        parser.add_argument("--exclude-slot", action="append", default=[], help="Do not export these placeholder slots")
+        parser.add_argument("--include-plugin-type", action="append", default=[], help="Only export these plugin types")
+        parser.add_argument(
+            "--exclude-plugin-type", action="append", default=[], help="Do not export these plugin types"
+        )
+        parser.add_argument(
+            "--subtree",
+            action="store_true",
+            help="Export the page together with all its subpages into one xliff file per language",
+        )
+        parser.add_argument(
+            "--only-changed",
+            action="store_true",
+            help="Only export texts that are new or changed since the last export",
+        )
+        parser.add_argument(
+            "--only-untranslated",
+            action="store_true",
+            help="Only export texts that are the same as in the source language or empty",
+        )
 
     def handle(self, *args, **options):
         try:
             content_type_id = options["content_type_id"]
             obj_id = options["obj_id"]
             xliff_source_language = options["xliff_source_language"]
-            target_language = options["target_language"]
+            target_languages = options["target_language"]
+            output_dir = options["output_dir"]
 
-            if xliff_source_language == target_language:
+            if xliff_source_language in target_languages:
                 raise CommandError("xliff source language and current language should not be the same")
 
-            obj = get_obj(content_type_id, obj_id)
-            xliff_str, file_name = export_content_as_xliff(
-                obj=obj,
-                source_language=xliff_source_language,
-                target_language=target_language,
+            if options["subtree"] and options["only_untranslated"]:
+                raise CommandError("--only-untranslated can not be combined with --subtree")
+
+            scope = ExportScope(
+                include_slots=tuple(options["include_slot"]),
+                exclude_slots=tuple(options["exclude_slot"]),
+                include_plugin_types=tuple(options["include_plugin_type"]),
+                exclude_plugin_types=tuple(options["exclude_plugin_type"]),
             )
 
-            exported_file = Path(file_name)
-            with exported_file.open("w") as translation_file:
-                translation_file.write(xliff_str)
+            obj = get_obj(content_type_id, obj_id, using=EXTRACTION_DATABASE)
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            if options["zip"] or options["max_units"] or options["max_bytes"]:
+                self.export_bundle(obj, xliff_source_language, target_languages, scope, output_dir, options)
+                return
 
-            self.stdout.write(self.style.SUCCESS(f"Successfully exported xliff file: {exported_file.resolve()}"))
+            if options["subtree"]:
+                export_pages = [
+                    export_subtree_as_xliff(
+                        page_content=get_obj_in_language(obj, target_language),  # type: ignore
+                        source_language=xliff_source_language,
+                        target_language=target_language,
+                        scope=scope,
+                        only_changed=options["only_changed"],
+                    )
+                    for target_language in target_languages
+                ]
+            else:
+                export_pages = export_content_as_xliff_for_languages(
+                    obj=obj,
+                    source_language=xliff_source_language,
+                    target_languages=target_languages,
+                    scope=scope,
+                    only_untranslated=options["only_untranslated"],
+                    only_changed=options["only_changed"],
+                )
+
+            for xliff_str, file_name in export_pages:
+                exported_file = output_dir / file_name
+                with exported_file.open("w") as translation_file:
+                    translation_file.write(xliff_str)
+
+                self.stdout.write(self.style.SUCCESS(f"Successfully exported xliff file: {exported_file.resolve()}"))
         except XliffError as e:
             raise CommandError(e) from e
+        finally:
+            shutdown_process_pool()
+
+    def export_bundle(self, obj, source_language: str, target_languages: list[str], scope, output_dir: Path, options):
+        """
+        Writes a ZIP with one xliff file per language, or per page and language with --subtree, and a manifest.
+        Files above --max-units or --max-bytes are split into shards.
+        """
+        export_contexts: Iterable[ExportContext]
+        if options["subtree"]:
+            export_contexts = iter_subtree_export_contexts(
+                page_content=obj,
+                source_language=source_language,
+                target_languages=target_languages,
+                scope=scope,
+                only_changed=options["only_changed"],
+            )
+        else:
+            export_contexts = export_content_as_xliff_contexts_for_languages(
+                obj=obj,
+                source_language=source_language,
+                target_languages=target_languages,
+                scope=scope,
+                only_untranslated=options["only_untranslated"],
+                only_changed=options["only_changed"],
+            )
+
+        exported_file = output_dir / get_xliff_archive_file_name(obj, target_languages)
+        try:
+            with exported_file.open("wb") as bundle_file:
+                # Subtrees are recorded in the ledger after the last file was written, others when they are extracted
+                for chunk in iter_recorded_xliff_bundle(
+                    XliffVersion.V1_2,
+                    export_contexts,
+                    only_changed=options["only_changed"] and options["subtree"],
+                    max_units=options["max_units"],
+                    max_bytes=options["max_bytes"],
+                ):
+                    bundle_file.write(chunk)
+        except BaseException:
+            # Do not leave a truncated zip behind when the export fails halfway
+            exported_file.unlink(missing_ok=True)
+            raise
+
+        self.stdout.write(self.style.SUCCESS(f"Successfully exported xliff files: {exported_file.resolve()}"))
@@ -2,40 +2,49 @@ from pathlib import Path
 
 from django.core.management import BaseCommand, CommandError
 
+from djangocms_xliff.bundles import parse_xliff_upload
 from djangocms_xliff.exceptions import XliffError
-from djangocms_xliff.imports import save_xliff_context
-from djangocms_xliff.parsers import parse_xliff_document
+from djangocms_xliff.imports import merge_xliff_contexts, save_xliff_context
 
 
 class Command(BaseCommand):
     def add_arguments(self, parser):
-        parser.add_argument("file_name", type=str)
+        parser.add_argument("file_name", type=str, nargs="+", help="Xliff files, zip bundles or shards in any order")
 
     def handle(self, *args, **options):
         try:
-            import_file = Path(options["file_name"])
-
-            with import_file.open("r") as xliff_file:
-                xliff_context = parse_xliff_document(xliff_file)
-                self.stdout.write(f"Found {len(xliff_context.units)} xliff units in {import_file.resolve()}")
-
-                wants_to_continue = input(
-                    "Do you want to import the units? This will save them directly into the database. (y/n): "
-                )
-                if wants_to_continue == "y":
-                    save_xliff_context(xliff_context)
-
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f"Successfully imported {len(xliff_context.units)} units for "
-                            f"obj with id: {xliff_context.obj_id}, content_type_id: {xliff_context.content_type_id} "
-                            f"and language: {xliff_context.target_language}"
-                        )
+            xliff_contexts = []
+            for file_name in options["file_name"]:
+                import_file = Path(file_name)
+
+                # A single xliff file or a zip bundle of xliff files
+                with import_file.open("rb") as xliff_file:
+                    xliff_contexts.extend(parse_xliff_upload(xliff_file))
+
+            # The shards of an object can be spread over many files
+            xliff_contexts = merge_xliff_contexts(xliff_contexts)
+
+            count_units = sum(len(xliff_context.units) for xliff_context in xliff_contexts)
+            self.stdout.write(f"Found {count_units} xliff units for {len(xliff_contexts)} objects")
+
+            wants_to_continue = input(
+                "Do you want to import the units? This will save them directly into the database. (y/n): "
+            )
+            if wants_to_continue != "y":
+                raise CommandError("Aborted.")
+
+            for xliff_context in xliff_contexts:
+                save_xliff_context(xliff_context)
+
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Successfully imported {len(xliff_context.units)} units for "
+                        f"obj with id: {xliff_context.obj_id}, content_type_id: {xliff_context.content_type_id} "
+                        f"and language: {xliff_context.target_language}"
                     )
-                    self.stdout.write(
-                        f"Path to page: {xliff_context.get_obj().get_absolute_url(xliff_context.target_language)}"  # type: ignore
-                    )
-                else:
-                    raise CommandError("Aborted.")
+                )
+                self.stdout.write(
+                    f"Path to page: {xliff_context.get_obj().get_absolute_url(xliff_context.target_language)}"  # type: ignore
+                )
         except XliffError as e:
             raise CommandError(e) from e
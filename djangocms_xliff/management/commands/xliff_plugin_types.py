@@ -0,0 +1,27 @@
+from cms.plugin_pool import plugin_pool
+from django.core.management import BaseCommand
+
+from djangocms_xliff.extractors import get_model_plan, get_plugin_types_classification
+
+
+class Command(BaseCommand):
+    help = "Lists which plugin types have translatable fields and which are only used for the layout"
+
+    def handle(self, *args, **options):
+        classification = get_plugin_types_classification()
+
+        translatable_plugin_types = [name for name, is_translatable in classification.items() if is_translatable]
+        layout_plugin_types = [name for name, is_translatable in classification.items() if not is_translatable]
+
+        self.stdout.write(self.style.SUCCESS(f"Found {len(translatable_plugin_types)} translatable plugin types:"))
+        for plugin_type in translatable_plugin_types:
+            plan = get_model_plan(plugin_pool.get_plugin(plugin_type).model)
+            field_names = ", ".join(translatable_field.field.name for translatable_field in plan.translatable_fields)
+            self.stdout.write(f"{plugin_type}: {field_names}")
+
+        self.stdout.write("")
+        self.stdout.write(
+            self.style.SUCCESS(f"Found {len(layout_plugin_types)} plugin types without translatable fields:")
+        )
+        for plugin_type in layout_plugin_types:
+            self.stdout.write(plugin_type)
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 00:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportLedgerEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("object_id", models.CharField(max_length=255)),
+                ("language", models.CharField(max_length=15)),
+                ("unit_id", models.CharField(max_length=255)),
+                ("source_hash", models.CharField(max_length=40)),
+                ("exported_at", models.DateTimeField()),
+                (
+                    "content_type",
+                    models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="contenttypes.contenttype"),
+                ),
+            ],
+            options={
+                "verbose_name": "Export ledger entry",
+                "verbose_name_plural": "Export ledger entries",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("content_type", "object_id", "language", "unit_id"),
+                        name="djangocms_xliff_unique_ledger_unit",
+                    )
+                ],
+            },
+        ),
+    ]
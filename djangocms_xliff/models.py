@@ -0,0 +1,29 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy
+
+
+class ExportLedgerEntry(models.Model):
+    """
+    Hash of the source of an exported unit at the time of the export, to export only changed units later on
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.CharField(max_length=255)
+    language = models.CharField(max_length=15)
+    unit_id = models.CharField(max_length=255)
+    source_hash = models.CharField(max_length=40)
+    exported_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = gettext_lazy("Export ledger entry")
+        verbose_name_plural = gettext_lazy("Export ledger entries")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "language", "unit_id"],
+                name="djangocms_xliff_unique_ledger_unit",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.content_type_id}:{self.object_id} ({self.language}) {self.unit_id}"
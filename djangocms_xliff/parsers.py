@@ -1,5 +1,5 @@
 import abc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from cms.models import Page
 from defusedxml.ElementTree import ParseError, parse
@@ -21,42 +21,41 @@ class VersionParser(abc.ABC):
         self.xml_namespaces = xml_namespaces
 
     @abc.abstractmethod
-    def parse(self) -> XliffContext:
+    def parse_files(self) -> list[XliffContext]:
         raise NotImplementedError()
 
+    def parse(self) -> XliffContext:
+        contexts = self.parse_files()
+        if len(contexts) > 1:
+            raise XliffError(
+                gettext("The XLIFF file contains %(count)d files, only one was expected") % {"count": len(contexts)}
+            )
+        return contexts[0]
+
 
 class Version12(VersionParser):
     def __init__(self, xliff_element: "Element", xml_namespaces: dict):
         super().__init__(xliff_element, xml_namespaces)
 
-        file_element = xliff_element.find("file", namespaces=self.xml_namespaces)
-        if file_element is None:
+        file_elements = xliff_element.findall("file", namespaces=self.xml_namespaces)
+        if not file_elements:
             raise XliffError("XLIFF Error: Missing file tag")
 
-        body_element = file_element.find("body", namespaces=self.xml_namespaces)
-        if body_element is None:
-            raise XliffError("XLIFF Error: Missing <body> in <file>")
-
-        self.file_element: Element = file_element
-        self.body_element: Element = body_element
+        for file_element in file_elements:
+            if file_element.find("body", namespaces=self.xml_namespaces) is None:
+                raise XliffError("XLIFF Error: Missing <body> in <file>")
 
-    def parse_file_element(self) -> tuple[str, str, str]:
-        file_element = self.xliff_element.find("file", namespaces=self.xml_namespaces)
-        if file_element is None:
-            raise XliffError("XLIFF Error: Missing file tag")
+        self.file_elements: list[Element] = file_elements
 
+    def parse_file_element(self, file_element: "Element") -> tuple[str, str, str]:
         source_language = file_element.attrib["source-language"]
         target_language = file_element.attrib["target-language"]
         path = file_element.attrib["original"]
 
-        tool_element = file_element.find("tool", namespaces=self.xml_namespaces)
-        if tool_element is None:
-            raise XliffError("XLIFF Error: Missing <tool> in <file>")
-
         return source_language, target_language, path
 
-    def parse_tool_element(self) -> tuple[int, int]:
-        tool_element = self.file_element.find("tool", namespaces=self.xml_namespaces)
+    def parse_tool_element(self, file_element: "Element") -> tuple[int, int]:
+        tool_element = file_element.find("tool", namespaces=self.xml_namespaces)
         if tool_element is None:
             raise XliffError("XLIFF Error: Missing <tool> in <file>")
 
@@ -71,9 +70,10 @@ class Version12(VersionParser):
 
         return int(content_type_id), int(obj_id)
 
-    def parse_body_element(self):
+    def parse_body_element(self, file_element: "Element") -> list[Unit]:
+        body_element = cast("Element", file_element.find("body", namespaces=self.xml_namespaces))
         units = []
-        for trans_unit in self.body_element.findall("trans-unit", namespaces=self.xml_namespaces):
+        for trans_unit in body_element.findall("trans-unit", namespaces=self.xml_namespaces):
             unit_id = trans_unit.attrib["id"]
             plugin_id, field_name = unit_id.rsplit(UNIT_ID_DELIMITER, 1)
 
@@ -111,10 +111,10 @@ class Version12(VersionParser):
             units.append(unit)
         return units
 
-    def parse(self) -> XliffContext:
-        source_language, target_language, path = self.parse_file_element()
-        content_type_id, obj_id = self.parse_tool_element()
-        units = self.parse_body_element()
+    def parse_file(self, file_element: "Element") -> XliffContext:
+        source_language, target_language, path = self.parse_file_element(file_element)
+        content_type_id, obj_id = self.parse_tool_element(file_element)
+        units = self.parse_body_element(file_element)
 
         return XliffContext(
             source_language=source_language,
@@ -125,8 +125,11 @@ class Version12(VersionParser):
             units=units,
         )
 
+    def parse_files(self) -> list[XliffContext]:
+        return [self.parse_file(file_element) for file_element in self.file_elements]
 
-def parse_xliff_document(file) -> XliffContext:
+
+def get_version_parser(file) -> VersionParser:
     try:
         doc = parse(file)
     except ParseError as e:
@@ -144,4 +147,15 @@ def parse_xliff_document(file) -> XliffContext:
     if parser is None:
         raise XliffConfigurationError(f"Missing VersionParser for version: {found_version.value}")
 
-    return parser.parse()
+    return parser
+
+
+def parse_xliff_document(file) -> XliffContext:
+    return get_version_parser(file).parse()
+
+
+def parse_xliff_document_files(file) -> list[XliffContext]:
+    """
+    Parses every <file> of the document into its own context
+    """
+    return get_version_parser(file).parse_files()
@@ -0,0 +1,80 @@
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from typing import Any
+
+import django
+from cms.models import CMSPlugin
+from django.db.models import Field
+
+from djangocms_xliff.settings import PROCESS_POOL_CHUNK_SIZE, PROCESS_POOL_MAX_WORKERS, PROCESS_POOL_START_METHOD
+from djangocms_xliff.types import Unit
+
+logger = logging.getLogger(__name__)
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    The workers are started with an explicit start method instead of the default of the platform, which is not fork
+    everywhere. Every worker sets up django before the first extractor is unpickled, so the modules of the extractors
+    can import models.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=PROCESS_POOL_MAX_WORKERS,
+            mp_context=multiprocessing.get_context(PROCESS_POOL_START_METHOD),
+            initializer=django.setup,
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+
+def map_in_process_pool(func: Callable, values: list[Any], chunk_size: int | None = None) -> list[Any]:
+    """
+    Calls func for every value in worker processes, sending chunk_size values at once. The results are in the order
+    of the values. Less values than one chunk are not worth the overhead and are processed in the current process.
+    """
+    chunk_size = chunk_size or PROCESS_POOL_CHUNK_SIZE
+    if len(values) < chunk_size:
+        return [func(value) for value in values]
+
+    logger.debug(f"Extracting {len(values)} values with {func.__qualname__} in the process pool")
+    return list(get_process_pool().map(func, values, chunksize=chunk_size))
+
+
+def create_units_for_plugin_field(instance: CMSPlugin, field: Field, source: Any) -> list[Unit]:
+    # The extractors import the registry, which imports this module
+    from djangocms_xliff.extractors import create_unit_for_plugin_field, get_instance_plan
+
+    translatable_field = get_instance_plan(instance).get_translatable_field(field.name)
+    if not source or translatable_field is None:
+        return []
+    return [create_unit_for_plugin_field(instance, translatable_field, source)]
+
+
+@cache
+def get_process_batch_extractor(process_extractor: Callable) -> Callable:
+    """
+    Wraps an extractor that only gets the raw field value into a batch extractor, which calls it in the process pool.
+    The process extractor returns the source text of the unit. Fields with an empty result get no unit.
+    """
+
+    def process_batch_extractor(items: list[tuple[CMSPlugin, Field, Any]]) -> list[list[Unit]]:
+        sources = map_in_process_pool(process_extractor, [source for _, _, source in items])
+        return [
+            create_units_for_plugin_field(instance, field, source)
+            for (instance, field, _), source in zip(items, sources, strict=True)
+        ]
+
+    return process_batch_extractor
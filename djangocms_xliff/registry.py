@@ -0,0 +1,102 @@
+import logging
+
+from django.apps import apps
+from django.db.models import CharField, EmailField, Field, SlugField, TextField, URLField
+
+from djangocms_xliff.processes import get_process_batch_extractor
+from djangocms_xliff.settings import (
+    FIELD_BATCH_EXTRACTORS,
+    FIELD_EXTRACTORS,
+    FIELD_IMPORTERS,
+    FIELD_PROCESS_EXTRACTORS,
+    FIELDS,
+)
+from djangocms_xliff.types import FieldTypeHandlers
+
+logger = logging.getLogger(__name__)
+
+# The first class in the MRO of a field that is listed here decides if the field is translatable
+TRANSLATABLE_FIELD_TYPES = {
+    CharField: True,
+    TextField: True,
+    URLField: True,
+    SlugField: True,
+    EmailField: False,
+    **dict.fromkeys(FIELDS, True),
+}
+
+_handlers_by_field_class: dict[type[Field], FieldTypeHandlers] = {}
+_handlers_by_field_type_path: dict[str, FieldTypeHandlers] = {}
+
+
+def find_in_mro(field_class: type[Field], registry: dict):
+    for base in field_class.__mro__:
+        if base in registry:
+            return registry[base]
+    return None
+
+
+def find_batch_extractor(field_class: type[Field]):
+    batch_extractor = find_in_mro(field_class, FIELD_BATCH_EXTRACTORS)
+    if batch_extractor is not None:
+        return batch_extractor
+
+    process_extractor = find_in_mro(field_class, FIELD_PROCESS_EXTRACTORS)
+    if process_extractor is not None:
+        return get_process_batch_extractor(process_extractor)
+
+    return None
+
+
+def resolve_field_handlers(field_class: type[Field]) -> FieldTypeHandlers:
+    return FieldTypeHandlers(
+        is_translatable=bool(find_in_mro(field_class, TRANSLATABLE_FIELD_TYPES)),
+        extractor=find_in_mro(field_class, FIELD_EXTRACTORS),
+        batch_extractor=find_batch_extractor(field_class),
+        importer=find_in_mro(field_class, FIELD_IMPORTERS),
+    )
+
+
+def get_field_handlers(field_class: type[Field]) -> FieldTypeHandlers:
+    handlers = _handlers_by_field_class.get(field_class)
+    if handlers is None:
+        handlers = resolve_field_handlers(field_class)
+        _handlers_by_field_class[field_class] = handlers
+        _handlers_by_field_type_path[f"{field_class.__module__}.{field_class.__name__}"] = handlers
+    return handlers
+
+
+def get_field_handlers_for_type_path(field_type: str) -> FieldTypeHandlers:
+    """
+    Returns the handlers for the field_type of a unit, which is the dotted path of the concrete field class.
+    The field_type comes from an uploaded file, so only the paths of field classes in the registry are resolved,
+    nothing is imported. Other field types get the default handlers.
+    """
+    handlers = _handlers_by_field_type_path.get(field_type)
+    if handlers is None:
+        logger.debug(f"Field type of unit is not in the registry: {field_type}")
+        return FieldTypeHandlers()
+    return handlers
+
+
+def has_batch_extractors() -> bool:
+    return bool(FIELD_BATCH_EXTRACTORS or FIELD_PROCESS_EXTRACTORS)
+
+
+def build_field_registry() -> None:
+    """
+    Resolves the handlers of every field class used by an installed model. Called in AppConfig.ready(),
+    field classes that are created later are resolved on their first lookup.
+    """
+    _handlers_by_field_class.clear()
+    _handlers_by_field_type_path.clear()
+
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, Field):
+                get_field_handlers(type(field))
+
+    # Configured field classes, that are not used by a model yet
+    for registry in (FIELD_EXTRACTORS, FIELD_BATCH_EXTRACTORS, FIELD_PROCESS_EXTRACTORS, FIELD_IMPORTERS):
+        for field_class in registry:
+            get_field_handlers(field_class)
@@ -1,17 +1,136 @@
+from collections.abc import Callable, Generator, Iterable
+from html import escape
+from typing import IO, Any
+
 from django.template.exceptions import TemplateDoesNotExist
 from django.template.loader import render_to_string
+from django.utils.translation import gettext
 
 from djangocms_xliff.apps import DjangoCMSXliffConfig
 from djangocms_xliff.exceptions import XliffConfigurationError
 from djangocms_xliff.settings import XliffVersion
-from djangocms_xliff.types import XliffContext
+from djangocms_xliff.types import Unit, XliffContext, XliffFile
 from djangocms_xliff.utils import (
     get_xliff_export_template_name,
     get_xliff_xml_namespaces,
 )
 
+TOOL_NAME = DjangoCMSXliffConfig.name
+TOOL_COMPANY = "Energie 360°"
+
+
+def escape_xml(value: Any) -> str:
+    """
+    Escapes a value like the autoescaping of django templates, so both renderers output the same bytes
+    """
+    return escape(str(value))
+
+
+def escape_cdata(value: Any) -> str:
+    """
+    A CDATA section ends at the first "]]>", so it is split into two sections
+    """
+    return str(value).replace("]]>", "]]]]><![CDATA[>")
+
+
+def iter_xliff_1_2_units(units: Iterable[Unit]) -> Generator[str]:
+    # The note is translated once per document instead of once per unit
+    max_length_note = gettext("Max characters: %(max_length)d")
+
+    for unit in units:
+        unit_id = escape_xml(unit.id)
+        size = f' maxwidth="{unit.max_length}" size-unit="char"' if unit.max_length else ""
+        notes = [unit.plugin_type, unit.plugin_name, unit.field_verbose_name]
+        if unit.max_length:
+            notes.append(max_length_note % {"max_length": unit.max_length})
+
+        yield (
+            f"\n            "
+            f'<trans-unit id="{unit_id}" resname="{unit_id}"{size} extype="{escape_xml(unit.field_type)}">\n'
+            f"                <source><![CDATA[{escape_cdata(unit.source)}]]></source>\n"
+            f"                <target><![CDATA[{escape_cdata(unit.target)}]]></target>"
+            + "".join(f"\n                <note>{escape_xml(note)}</note>" for note in notes)
+            + "\n            </trans-unit>"
+        )
+
+
+def iter_xliff_1_2_file(context: XliffContext, units: Iterable[Unit]) -> Generator[str]:
+    yield (
+        f'\n    <file original="{escape_xml(context.path)}" datatype="plaintext" '
+        f'source-language="{escape_xml(context.source_language)}" '
+        f'target-language="{escape_xml(context.target_language)}">\n'
+        f'        <tool tool-id="{escape_xml(context.tool_id)}" tool-name="{escape_xml(TOOL_NAME)}" '
+        f'tool-company-name="{escape_xml(TOOL_COMPANY)}"/>\n'
+        "        <body>"
+    )
+    yield from iter_xliff_1_2_units(units)
+    yield "\n        </body>\n    </file>"
+
+
+def iter_xliff_1_2_document(files: Iterable[XliffFile]) -> Generator[str]:
+    xml_namespaces = "".join(
+        f'{escape_xml(name)}="{escape_xml(url)}"' for name, url in get_xliff_xml_namespaces(XliffVersion.V1_2).items()
+    )
+    yield (
+        '<?xml version="1.0" encoding="utf-8" standalone="no"?>\n'
+        f'<xliff {xml_namespaces} version="{XliffVersion.V1_2.value}">'
+    )
+    for context, units in files:
+        yield from iter_xliff_1_2_file(context, units)
+    yield "\n</xliff>\n\n"
+
+
+SERIALIZERS: dict[XliffVersion, Callable[[Iterable[XliffFile]], Generator[str]]] = {
+    XliffVersion.V1_2: iter_xliff_1_2_document,
+}
+
+
+def iter_xliff_files_document(version: XliffVersion, files: Iterable[XliffFile]) -> Generator[str]:
+    """
+    Yields an XLIFF document with one <file> per context, e.g. one per exported object.
+    Every file has its own tool id and path, so its units are imported to its own object.
+    """
+    try:
+        serializer = SERIALIZERS[version]
+    except KeyError as e:
+        raise XliffConfigurationError(f"Serializer for xliff version: {version.value} does not exist") from e
+    return serializer(files)
+
+
+def iter_xliff_document(
+    version: XliffVersion,
+    context: XliffContext,
+    units: Iterable[Unit] | None = None,
+) -> Generator[str]:
+    """
+    Yields the XLIFF document in chunks, one per unit, without building the whole document in memory.
+    Pass units to render them instead of the units of the context, e.g. a generator that extracts them lazily.
+    """
+    return iter_xliff_files_document(version, [(context, context.units if units is None else units)])
+
+
+def iter_xliff_contexts_document(version: XliffVersion, contexts: Iterable[XliffContext]) -> Generator[str]:
+    return iter_xliff_files_document(version, ((context, context.units) for context in contexts))
+
+
+def render_xliff_contexts_document(version: XliffVersion, contexts: Iterable[XliffContext]) -> str:
+    return "".join(iter_xliff_contexts_document(version, contexts))
+
+
+def write_xliff_document(version: XliffVersion, context: XliffContext, file: IO[str]) -> None:
+    for chunk in iter_xliff_document(version, context):
+        file.write(chunk)
+
 
 def render_xliff_document(version: XliffVersion, context: XliffContext) -> str:
+    return "".join(iter_xliff_document(version, context))
+
+
+def render_xliff_template(version: XliffVersion, context: XliffContext) -> str:
+    """
+    Renders the XLIFF document with the django template of the version, which can be overridden in a project.
+    It is slower than render_xliff_document, because the template engine runs once per unit.
+    """
     template_name = get_xliff_export_template_name(version)
     xml_namespaces = get_xliff_xml_namespaces(version)
     try:
@@ -21,8 +140,8 @@ def render_xliff_document(version: XliffVersion, context: XliffContext) -> str:
                 "version": version.value,
                 "xml_namespaces": xml_namespaces,
                 "tool": {
-                    "name": DjangoCMSXliffConfig.name,
-                    "company": "Energie 360°",
+                    "name": TOOL_NAME,
+                    "company": TOOL_COMPANY,
                 },
                 "xliff": context,
             },
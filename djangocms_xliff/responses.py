@@ -0,0 +1,94 @@
+import zlib
+from collections.abc import Generator, Iterable
+from itertools import chain
+
+from django.http import StreamingHttpResponse
+
+from djangocms_xliff.bundles import iter_xliff_bundle_entries
+from djangocms_xliff.renderer import iter_xliff_files_document
+from djangocms_xliff.settings import SHARD_MAX_BYTES, SHARD_MAX_UNITS, XliffVersion
+from djangocms_xliff.shards import get_shard_file_name, iter_shards
+from djangocms_xliff.types import BundleEntry, XliffFile
+
+XLIFF_CONTENT_TYPE = "application/xliff+xml"
+ZIP_CONTENT_TYPE = "application/zip"
+GZIP_CONTENT_TYPE = "application/gzip"
+GZIP_EXTENSION = "gz"
+
+# wbits between 16 + 9 and 16 + 15 write a gzip header and trailer instead of a zlib one
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def iter_encoded_chunks(chunks: Iterable[str], encoding: str = "utf-8") -> Generator[bytes]:
+    for chunk in chunks:
+        yield chunk.encode(encoding)
+
+
+def iter_gzipped_chunks(chunks: Iterable[bytes]) -> Generator[bytes]:
+    """
+    Compresses the chunks into one gzip file. Only the compressor state is held in memory, not the whole file.
+    """
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def create_xliff_response(chunks: Iterable[str], file_name: str, compress: bool = False) -> StreamingHttpResponse:
+    """
+    Streams the chunks of an XLIFF document to the client, optionally compressed as gzip file.
+    """
+    streaming_content = iter_encoded_chunks(chunks)
+    content_type = XLIFF_CONTENT_TYPE
+    if compress:
+        streaming_content = iter_gzipped_chunks(streaming_content)
+        content_type = GZIP_CONTENT_TYPE
+        file_name = f"{file_name}.{GZIP_EXTENSION}"
+
+    return StreamingHttpResponse(
+        streaming_content=streaming_content,
+        content_type=content_type,
+        headers={"Content-Disposition": f"attachment; filename={file_name}"},
+    )
+
+
+def create_bundle_response(chunks: Iterable[bytes], file_name: str) -> StreamingHttpResponse:
+    """
+    Streams a ZIP bundle of XLIFF files to the client, its files are already compressed
+    """
+    return StreamingHttpResponse(
+        streaming_content=chunks,
+        content_type=ZIP_CONTENT_TYPE,
+        headers={"Content-Disposition": f"attachment; filename={file_name}"},
+    )
+
+
+def create_sharded_xliff_response(
+    version: XliffVersion,
+    files: Iterable[XliffFile],
+    file_name: str,
+    compress: bool = False,
+    max_units: int | None = SHARD_MAX_UNITS,
+    max_bytes: int | None = SHARD_MAX_BYTES,
+) -> StreamingHttpResponse:
+    """
+    Streams one XLIFF document, or a ZIP bundle of shards if the document exceeds the shard limits.
+    Only the first shard is held in memory to decide, which response is needed.
+    """
+    if not max_units and not max_bytes:
+        return create_xliff_response(iter_xliff_files_document(version, files), file_name, compress)
+
+    shards = iter_shards(version, files, max_units, max_bytes)
+    first_shard = next(shards)
+    second_shard = next(shards, None)
+    if second_shard is None:
+        return create_xliff_response(iter_xliff_files_document(version, first_shard), file_name, compress)
+
+    entries = (
+        BundleEntry(file_name=get_shard_file_name(file_name, shard), files=shard_files, shard=shard)
+        for shard, shard_files in enumerate(chain([first_shard, second_shard], shards), start=1)
+    )
+    name, _, _ = file_name.rpartition(".")
+    return create_bundle_response(iter_xliff_bundle_entries(version, entries), f"{name or file_name}.zip")
@@ -1,6 +1,7 @@
 from enum import Enum, unique
 
 from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy
 
@@ -28,11 +29,53 @@ FIELD_EXTRACTORS = {
     for field_class, extractor_callable in getattr(settings, "DJANGOCMS_XLIFF_FIELD_EXTRACTORS", ())
 }
 
+FIELD_BATCH_EXTRACTORS = {
+    import_string(field_class): import_string(extractor_callable)
+    for field_class, extractor_callable in getattr(settings, "DJANGOCMS_XLIFF_FIELD_BATCH_EXTRACTORS", ())
+}
+
+FIELD_PROCESS_EXTRACTORS = {
+    import_string(field_class): import_string(extractor_callable)
+    for field_class, extractor_callable in getattr(settings, "DJANGOCMS_XLIFF_FIELD_PROCESS_EXTRACTORS", ())
+}
+
+# Number of worker processes for the process extractors. Default: number of CPUs
+PROCESS_POOL_MAX_WORKERS = getattr(settings, "DJANGOCMS_XLIFF_PROCESS_POOL_MAX_WORKERS", None)
+
+# Number of field values sent to a worker process at once. Fewer values are extracted in the current process
+PROCESS_POOL_CHUNK_SIZE = getattr(settings, "DJANGOCMS_XLIFF_PROCESS_POOL_CHUNK_SIZE", 50)
+
+# Start method of the worker processes: "spawn", "forkserver" or "fork". The workers run django.setup() with the
+# DJANGO_SETTINGS_MODULE of the environment
+PROCESS_POOL_START_METHOD = getattr(settings, "DJANGOCMS_XLIFF_PROCESS_POOL_START_METHOD", "spawn")
+
 FIELD_IMPORTERS = {
-    field_class: import_string(extractor_callable)
+    import_string(field_class): import_string(extractor_callable)
     for field_class, extractor_callable in getattr(settings, "DJANGOCMS_XLIFF_FIELD_IMPORTERS", ())
 }
 
+# Number of objects whose placeholders and extensions are loaded together in multi object exports
+EXPORT_BATCH_SIZE = getattr(settings, "DJANGOCMS_XLIFF_EXPORT_BATCH_SIZE", 100)
+
+# Exports with more units or bytes are split into shards at plugin boundaries and downloaded as ZIP bundle.
+# The limits are disabled by default
+SHARD_MAX_UNITS = getattr(settings, "DJANGOCMS_XLIFF_SHARD_MAX_UNITS", None)
+SHARD_MAX_BYTES = getattr(settings, "DJANGOCMS_XLIFF_SHARD_MAX_BYTES", None)
+
+# Uploaded ZIP bundles are rejected, if a file or all files together are larger than this when unpacked
+BUNDLE_MAX_FILE_BYTES = getattr(settings, "DJANGOCMS_XLIFF_BUNDLE_MAX_FILE_BYTES", 100 * 1024 * 1024)
+BUNDLE_MAX_BYTES = getattr(settings, "DJANGOCMS_XLIFF_BUNDLE_MAX_BYTES", 500 * 1024 * 1024)
+
+# Alias of a django cache to store the extracted units of pages in. The cache is disabled by default
+EXTRACTION_CACHE = getattr(settings, "DJANGOCMS_XLIFF_EXTRACTION_CACHE", None)
+EXTRACTION_CACHE_TIMEOUT = getattr(settings, "DJANGOCMS_XLIFF_EXTRACTION_CACHE_TIMEOUT", 60 * 60 * 24)
+
+# Alias of the database the extraction reads from, e.g. a read replica. Imports always write to the default database
+EXTRACTION_DATABASE = getattr(settings, "DJANGOCMS_XLIFF_EXTRACTION_DATABASE", DEFAULT_DB_ALIAS)
+
+# Load only the translatable columns of plugins, which don't need the full instance for the extraction
+LOAD_ONLY_TRANSLATABLE_FIELDS = getattr(settings, "DJANGOCMS_XLIFF_LOAD_ONLY_TRANSLATABLE_FIELDS", True)
+
 VALIDATORS = [
     import_string(validator_callable) for validator_callable in getattr(settings, "DJANGOCMS_XLIFF_VALIDATORS", ())
 ]
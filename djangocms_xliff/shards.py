@@ -0,0 +1,96 @@
+from collections.abc import Generator, Iterable
+from itertools import groupby
+
+from djangocms_xliff.renderer import iter_xliff_files_document
+from djangocms_xliff.settings import SHARD_MAX_BYTES, SHARD_MAX_UNITS, XliffVersion
+from djangocms_xliff.types import BundleEntry, Unit, XliffContext, XliffFile
+
+
+def get_document_size(version: XliffVersion, context: XliffContext, units: list[Unit]) -> int:
+    return sum(len(chunk.encode()) for chunk in iter_xliff_files_document(version, [(context, units)]))
+
+
+def is_shard_limit_exceeded(units_count: int, size: int, max_units: int | None, max_bytes: int | None) -> bool:
+    return bool((max_units and units_count > max_units) or (max_bytes and size > max_bytes))
+
+
+def iter_shards(
+    version: XliffVersion,
+    files: Iterable[XliffFile],
+    max_units: int | None = None,
+    max_bytes: int | None = None,
+) -> Generator[list[tuple[XliffContext, list[Unit]]]]:
+    """
+    Splits the files of a document into shards with at most max_units units and max_bytes bytes.
+    The units of one plugin are never split, a plugin that exceeds the limits on its own gets its own shard.
+    A file whose units are split is written into every shard with its own part of the units.
+    At least one shard is yielded, even if there are no units.
+    """
+    shard: list[tuple[XliffContext, list[Unit]]] = []
+    shard_units_count = 0
+    shard_size = 0
+    has_yielded = False
+
+    for context, units in files:
+        file_size = get_document_size(version, context, [])
+        file_units: list[Unit] | None = None
+
+        for _plugin_id, plugin_units_iter in groupby(units, key=lambda unit: unit.plugin_id):
+            plugin_units = list(plugin_units_iter)
+            plugin_size = get_document_size(version, context, plugin_units) - file_size
+            added_size = plugin_size if file_units is not None else plugin_size + file_size
+
+            if shard_units_count and is_shard_limit_exceeded(
+                shard_units_count + len(plugin_units), shard_size + added_size, max_units, max_bytes
+            ):
+                yield shard
+                has_yielded = True
+                shard, shard_units_count, shard_size = [], 0, 0
+                file_units = None
+                added_size = plugin_size + file_size
+
+            if file_units is None:
+                file_units = []
+                shard.append((context, file_units))
+
+            file_units.extend(plugin_units)
+            shard_units_count += len(plugin_units)
+            shard_size += added_size
+
+        # Objects without units are kept, so the shards cover every exported object
+        if file_units is None:
+            shard.append((context, []))
+            shard_size += file_size
+
+    if shard or not has_yielded:
+        yield shard
+
+
+def get_shard_file_name(file_name: str, shard: int) -> str:
+    name, dot, extension = file_name.rpartition(".")
+    if not dot:
+        return f"{file_name}_part-{shard:03d}"
+    return f"{name}_part-{shard:03d}.{extension}"
+
+
+def iter_sharded_bundle_entries(
+    version: XliffVersion,
+    entries: Iterable[BundleEntry],
+    max_units: int | None = SHARD_MAX_UNITS,
+    max_bytes: int | None = SHARD_MAX_BYTES,
+) -> Generator[BundleEntry]:
+    """
+    Splits every entry that exceeds the limits into numbered shards, smaller entries are passed through
+    """
+    for entry in entries:
+        if not max_units and not max_bytes:
+            yield entry
+            continue
+
+        shards = list(iter_shards(version, entry.files, max_units, max_bytes))
+        if len(shards) == 1:
+            yield entry
+            continue
+
+        for shard, files in enumerate(shards, start=1):
+            yield BundleEntry(file_name=get_shard_file_name(entry.file_name, shard), files=files, shard=shard)
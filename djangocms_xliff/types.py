@@ -1,8 +1,10 @@
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from cms.models import PageContent
-from django.db.models import Model
+from django.db.models import Field, Model
 from django.utils.translation import gettext
 from djangocms_alias.models import AliasContent
 
@@ -87,3 +89,114 @@ class XliffContext:
         from djangocms_xliff.utils import get_obj
 
         return get_obj(self.content_type_id, self.obj_id)
+
+
+# A <file> of an XLIFF document, the units can be passed separately to render them lazily
+type XliffFile = tuple[XliffContext, Iterable[Unit]]
+
+# An exported context with its file name, rendered later, e.g. while streaming the response
+type ExportContext = tuple[XliffContext, ExportFileName]
+
+# Contexts written as one <file> each into the same document
+type ExportContexts = tuple[list[XliffContext], ExportFileName]
+
+# Content type id, object id, language and source hash by unit id of an export, to record it in the ledger later on
+type ExportedHashes = tuple[int, str | int, str, dict[str, str]]
+
+
+@dataclass
+class BundleEntry:
+    """
+    An XLIFF document in a ZIP bundle. Shards are the numbered parts of a document, that was split by size.
+    """
+
+    file_name: ExportFileName
+    files: list[tuple[XliffContext, list[Unit]]]
+    shard: int | None = None
+
+    @property
+    def units_count(self) -> int:
+        return sum(len(units) for _, units in self.files)
+
+
+@dataclass
+class PendingUnits:
+    """
+    Units of a field with a batch extractor. They are extracted later, together with all fields of the same type.
+    """
+
+    batch_extractor: Callable
+    instance: Model
+    field: Field
+    source: Any
+    units: list[Unit] | None = None
+
+
+type UnitOrPending = Unit | PendingUnits
+
+
+@dataclass(frozen=True)
+class TranslatableField:
+    field: Field
+    field_type: str
+    extractor: Callable | None
+    validators: tuple[Callable, ...]
+    batch_extractor: Callable | None = None
+
+    def is_valid_for(self, instance: Model) -> bool:
+        return all(validator(self.field, instance) for validator in self.validators)
+
+
+@dataclass(frozen=True)
+class ModelPlan:
+    translatable_fields: tuple[TranslatableField, ...]
+    placeholder_fields: tuple[Field, ...]
+
+    @cached_property
+    def requires_instance(self) -> bool:
+        """
+        Custom extractors and instance dependent validators can access any attribute of the instance
+        """
+        return any(
+            translatable_field.extractor is not None
+            or translatable_field.batch_extractor is not None
+            or translatable_field.validators
+            for translatable_field in self.translatable_fields
+        )
+
+    @cached_property
+    def translatable_fields_by_name(self) -> dict[str, TranslatableField]:
+        return {translatable_field.field.name: translatable_field for translatable_field in self.translatable_fields}
+
+    def get_translatable_field(self, field_name: str) -> TranslatableField | None:
+        return self.translatable_fields_by_name.get(field_name)
+
+
+@dataclass(frozen=True)
+class ExportScope:
+    """
+    Restricts an export to some placeholder slots and plugin types. Empty includes allow everything.
+    The plugin type filters apply to every plugin on its own, nested plugins of other types are kept.
+    """
+
+    include_slots: tuple[str, ...] = ()
+    exclude_slots: tuple[str, ...] = ()
+    include_plugin_types: tuple[str, ...] = ()
+    exclude_plugin_types: tuple[str, ...] = ()
+
+    def is_slot_included(self, slot: str) -> bool:
+        if self.include_slots and slot not in self.include_slots:
+            return False
+        return slot not in self.exclude_slots
+
+    def get_cache_key(self) -> str:
+        filters = (self.include_slots, self.exclude_slots, self.include_plugin_types, self.exclude_plugin_types)
+        return ";".join(",".join(sorted(values)) for values in filters)
+
+
+@dataclass(frozen=True)
+class FieldTypeHandlers:
+    is_translatable: bool = False
+    extractor: Callable | None = None
+    batch_extractor: Callable | None = None
+    importer: Callable | None = None
@@ -0,0 +1,203 @@
+from collections import Counter
+from collections.abc import Generator, Hashable
+from difflib import SequenceMatcher
+
+from cms.models import CMSPlugin, PageContent
+
+from djangocms_xliff.extractors import (
+    extract_extension_data_from_page,
+    extract_metadata_from_obj,
+    get_instance_plan,
+    get_placeholders,
+    get_plugin_tree,
+    iter_units_from_plugin_instance,
+)
+from djangocms_xliff.types import ExportScope, Unit, XliffObj
+from djangocms_xliff.utils import get_obj_in_language, get_text_hash
+
+type AlignmentKey = tuple[Hashable, ...]
+type PluginWithUnits = tuple[CMSPlugin, list[Unit]]
+type PluginsBySlot = dict[str, list[PluginWithUnits]]
+
+
+def get_plugins_by_slot(obj: XliffObj, language: str, scope: ExportScope | None = None) -> PluginsBySlot:
+    """
+    Returns the plugins of every placeholder in tree order, together with their units
+    """
+    return {
+        placeholder.slot: [
+            (instance, list(iter_units_from_plugin_instance(instance)))
+            for instance in get_plugin_tree(placeholder, language, scope)
+        ]
+        for placeholder in get_placeholders(obj, scope)
+    }
+
+
+def get_plugin_signature(plugin: PluginWithUnits) -> Hashable:
+    instance, units = plugin
+    return instance.plugin_type, tuple((unit.field_name, unit.source) for unit in units)
+
+
+def align_plugins(source_plugins: list[PluginWithUnits], plugins: list[PluginWithUnits]) -> dict[int, int]:
+    """
+    Returns the index of the aligned source plugin for the index of every plugin, that has one.
+
+    Both trees are aligned as sequences of plugin types and texts, so untranslated plugins are aligned with their
+    source even if plugins were added or removed in one language. Differing plugins in between are aligned one by one,
+    if both languages have the same number and types of plugins there. Otherwise the structure differs and they have
+    no aligned plugin.
+    """
+    matcher = SequenceMatcher(
+        None,
+        [get_plugin_signature(plugin) for plugin in source_plugins],
+        [get_plugin_signature(plugin) for plugin in plugins],
+        autojunk=False,
+    )
+
+    aligned_indexes: dict[int, int] = {}
+    for tag, source_start, source_end, start, end in matcher.get_opcodes():
+        source_indexes = range(source_start, source_end)
+        indexes = range(start, end)
+        if tag == "replace" and len(source_indexes) == len(indexes):
+            plugin_types = [source_plugins[source_index][0].plugin_type for source_index in source_indexes]
+            if plugin_types != [plugins[index][0].plugin_type for index in indexes]:
+                continue
+        elif tag != "equal":
+            continue
+
+        aligned_indexes.update(zip(indexes, source_indexes, strict=True))
+
+    return aligned_indexes
+
+
+def iter_source_plugins(source_plugins: PluginsBySlot) -> Generator[tuple[AlignmentKey, PluginWithUnits]]:
+    """
+    Yields the plugins of the source language with a key: The slot of its placeholder, its index in tree order
+    and its plugin type.
+    """
+    for slot, plugins in source_plugins.items():
+        for index, plugin in enumerate(plugins):
+            yield (slot, index, plugin[0].plugin_type), plugin
+
+
+def iter_aligned_plugins(
+    plugins_by_slot: PluginsBySlot,
+    source_plugins: PluginsBySlot,
+) -> Generator[tuple[AlignmentKey, PluginWithUnits]]:
+    """
+    Yields the plugins with the key of their aligned plugin in the source language.
+    Plugins without an aligned plugin get a key, that is not in the source language.
+    """
+    for slot, plugins in plugins_by_slot.items():
+        aligned_indexes = align_plugins(source_plugins.get(slot, []), plugins)
+        for index, plugin in enumerate(plugins):
+            source_index = aligned_indexes.get(index)
+            if source_index is None:
+                yield (slot, None, plugin[0].pk), plugin
+            else:
+                yield (slot, source_index, plugin[0].plugin_type), plugin
+
+
+def iter_aligned_units_from_plugin(
+    plugin_key: AlignmentKey,
+    units: list[Unit],
+) -> Generator[tuple[AlignmentKey, Unit]]:
+    # Custom extractors can return many units for one field
+    field_counts: Counter[str] = Counter()
+    for unit in units:
+        yield (*plugin_key, unit.field_name, field_counts[unit.field_name]), unit
+        field_counts[unit.field_name] += 1
+
+
+def iter_aligned_units_from_obj_data(
+    obj: XliffObj,
+    language: str,
+    include_metadata: bool,
+) -> Generator[tuple[AlignmentKey, Unit]]:
+    units = extract_metadata_from_obj(obj=obj, language=language) if include_metadata else []
+    if type(obj) is PageContent:
+        units += extract_extension_data_from_page(obj, language)
+
+    for unit in units:
+        yield (unit.plugin_type, unit.field_name), unit
+
+
+def get_source_texts(
+    obj: XliffObj,
+    language: str,
+    include_metadata: bool,
+    source_plugins: PluginsBySlot,
+) -> dict[AlignmentKey, str]:
+    source_texts = {key: unit.source for key, unit in iter_aligned_units_from_obj_data(obj, language, include_metadata)}
+
+    for plugin_key, (_instance, units) in iter_source_plugins(source_plugins):
+        for key, unit in iter_aligned_units_from_plugin(plugin_key, units):
+            source_texts[key] = unit.source
+
+    return source_texts
+
+
+def iter_empty_units_from_plugin(
+    plugin_key: AlignmentKey,
+    instance: CMSPlugin,
+    source_texts: dict[AlignmentKey, str],
+) -> Generator[Unit]:
+    """
+    Yields units for empty fields of a plugin, whose copy in the source language has a text
+    """
+    for translatable_field in get_instance_plan(instance).translatable_fields:
+        field = translatable_field.field
+        if getattr(instance, field.name, None) or not translatable_field.is_valid_for(instance):
+            continue
+
+        source_text = source_texts.get((*plugin_key, field.name, 0))
+        if not source_text:
+            continue
+
+        yield Unit(
+            plugin_id=str(instance.pk),
+            plugin_type=instance.plugin_type,
+            plugin_name=instance.get_plugin_name(),
+            field_name=field.name,
+            field_type=translatable_field.field_type,
+            field_verbose_name=field.verbose_name,  # type: ignore
+            source=source_text,
+            max_length=field.max_length,
+        )
+
+
+def extract_untranslated_units_from_obj(
+    obj: XliffObj,
+    language: str,
+    source_language: str,
+    include_metadata=True,
+    scope: ExportScope | None = None,
+) -> list[Unit]:
+    """
+    Extracts only the units of an object that are not translated yet: Their text is the same as in the aligned
+    plugin of the source language, or empty. Both languages are walked once, the texts are compared by hash.
+    Units without an aligned unit in the source language are always extracted.
+    """
+    source_obj = get_obj_in_language(obj, source_language)
+    source_plugins = get_plugins_by_slot(source_obj, source_language, scope)
+    source_texts = get_source_texts(source_obj, source_language, include_metadata, source_plugins)
+    source_hashes = {key: get_text_hash(text) for key, text in source_texts.items()}
+
+    def is_untranslated(key: AlignmentKey, unit: Unit) -> bool:
+        source_hash = source_hashes.get(key)
+        return source_hash is None or source_hash == get_text_hash(unit.source)
+
+    units = [
+        unit
+        for key, unit in iter_aligned_units_from_obj_data(obj, language, include_metadata)
+        if is_untranslated(key, unit)
+    ]
+
+    plugins = get_plugins_by_slot(obj, language, scope)
+    for plugin_key, (instance, plugin_units) in iter_aligned_plugins(plugins, source_plugins):
+        for key, unit in iter_aligned_units_from_plugin(plugin_key, plugin_units):
+            if is_untranslated(key, unit):
+                units.append(unit)
+        units.extend(iter_empty_units_from_plugin(plugin_key, instance, source_texts))
+
+    return units
@@ -1,6 +1,6 @@
 from django.urls import path
 
-from djangocms_xliff.views import ExportView, ImportView, UploadView
+from djangocms_xliff.views import ExportSubtreeView, ExportView, ImportView, UploadView
 
 app_name = "djangocms_xliff"
 
@@ -10,6 +10,11 @@ urlpatterns = [
         ExportView.as_view(),
         name="export",
     ),
+    path(
+        "export-subtree/<int:content_type_id>/<int:obj_id>/<str:current_language>/",
+        ExportSubtreeView.as_view(),
+        name="export_subtree",
+    ),
     path(
         "upload/<int:content_type_id>/<int:obj_id>/<str:current_language>/",
         UploadView.as_view(),
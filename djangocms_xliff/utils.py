@@ -1,9 +1,14 @@
+import hashlib
+import os
+from contextlib import suppress
 from itertools import groupby
 from typing import Any
 
 from cms.models import PageContent
 from cms.utils.i18n import get_language_object
 from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS
+from django.template import engines
 from django.utils import translation
 from django.utils.timezone import localtime, now
 from djangocms_alias.models import AliasContent
@@ -18,7 +23,7 @@ from djangocms_xliff.settings import (
     XliffVersion,
     get_model_for_alias_content,
 )
-from djangocms_xliff.types import Unit, XliffObj
+from djangocms_xliff.types import Unit, XliffContext, XliffObj
 
 type CMSContentType = PageContent | AliasContent
 
@@ -48,31 +53,64 @@ def get_xliff_export_template_name(version: XliffVersion) -> str:
     return f"{TEMPLATES_FOLDER_EXPORT}/v{version.value}.xliff"
 
 
-def get_xliff_export_file_name(obj: XliffObj, target_language: str, delimiter="_") -> str:
-    path = get_path(obj=obj, language=target_language)
+def get_template_mtime(template_name: str) -> float | None:
+    """
+    Returns the modification time of the file the template loaders would load, without compiling the template.
+    """
+    for engine in engines.all():
+        template_loaders = getattr(getattr(engine, "engine", None), "template_loaders", [])
+        for loader in template_loaders:
+            for origin in loader.get_template_sources(template_name):
+                with suppress(OSError):
+                    return os.path.getmtime(origin.name)
+    return None
+
+
+def get_export_file_name(obj: XliffObj, languages: list[str], delimiter: str, extension: str) -> str:
+    path = get_path(obj=obj, language=languages[0])
+    return get_export_file_name_for_path(path, languages, delimiter, extension)
+
+
+def get_export_file_name_for_path(path: str, languages: list[str], delimiter: str, extension: str) -> str:
     parts = [part for part in path.split("/") if part][1:]
     name = "_".join(parts)
     date_str = localtime(now()).strftime("%y%m%d%H%M%S")
-    return f"{name}{delimiter}{target_language}{delimiter}{date_str}.xliff"
+    return f"{name}{delimiter}{'-'.join(languages)}{delimiter}{date_str}.{extension}"
+
+
+def get_xliff_export_file_name(obj: XliffObj, target_language: str, delimiter="_") -> str:
+    return get_export_file_name(obj, [target_language], delimiter, "xliff")
 
 
-def get_versioning_obj_by_id(model: CMSContentType, obj_id: int) -> PageContent:
+def get_xliff_export_file_name_for_context(xliff_context: XliffContext, delimiter="_") -> str:
+    return get_export_file_name_for_path(xliff_context.path, [xliff_context.target_language], delimiter, "xliff")
+
+
+def get_xliff_archive_file_name(obj: XliffObj, target_languages: list[str], delimiter="_") -> str:
+    return get_export_file_name(obj, target_languages, delimiter, "zip")
+
+
+def get_versioning_obj_by_id(model: CMSContentType, obj_id: int, using: str = DEFAULT_DB_ALIAS) -> PageContent:
     try:
-        return model.admin_manager.get(id=obj_id)
+        return model.admin_manager.using(using).get(id=obj_id)
     except PageContent.DoesNotExist as e:
         raise XliffError(f"{model} with id: {obj_id} does not exist") from e
 
 
-def get_obj(content_type_id: int, obj_id: Any) -> XliffObj:
+def get_obj(content_type_id: int, obj_id: Any, using: str = DEFAULT_DB_ALIAS) -> XliffObj:
+    """
+    Pass using=EXTRACTION_DATABASE for exports. Objects that are changed must be loaded from the default database,
+    because django saves them to the database they were loaded from.
+    """
     model = ContentType.objects.get_for_id(content_type_id).model_class()
     if not model:
         raise XliffError(f"ContentType Lookup for content_type_id {content_type_id} with obj_id {obj_id} failed")
 
     if model in [PageContent, AliasContent]:
-        return get_versioning_obj_by_id(model=model, obj_id=obj_id)  # type: ignore
+        return get_versioning_obj_by_id(model=model, obj_id=obj_id, using=using)  # type: ignore
 
     try:
-        return model.objects.get(pk=obj_id)
+        return model.objects.using(using).get(pk=obj_id)
     except model.DoesNotExist as e:
         raise XliffError(f"{model._meta.verbose_name} with id: {obj_id} does not exist") from e
 
@@ -94,6 +132,15 @@ def get_latest_obj_by_version[T: CMSContentType](obj: T, language: str) -> T:
         raise XliffError(f"Did not find latest version for {type(obj)}: {obj.pk}") from e
 
 
+def get_obj_in_language(obj: XliffObj, language: str) -> XliffObj:
+    """
+    Page and alias contents exist once per language. Other models share their placeholders across languages.
+    """
+    if type(obj) in (PageContent, AliasContent):
+        return get_latest_obj_by_version(obj, language)  # type: ignore
+    return obj
+
+
 def must_get_model_for_alias_content(obj: AliasContent) -> XliffObj:
     if get_model_for_alias_content is None:
         raise XliffConfigurationError(
@@ -131,6 +178,10 @@ def get_type_with_path(cls: type) -> str:
     return f"{typ.__module__}.{typ.__name__}"
 
 
+def get_text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode(), usedforsecurity=False).hexdigest()
+
+
 def get_lang_name(search_code: str) -> str:
     return get_language_object(search_code)["name"]
 
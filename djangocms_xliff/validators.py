@@ -0,0 +1,18 @@
+from collections.abc import Callable
+
+type Validator = Callable[..., bool]
+
+
+def instance_independent[T: Validator](validator: T) -> T:
+    """
+    Marks a validator from DJANGOCMS_XLIFF_VALIDATORS whose result only depends on the field.
+
+    The validator is called once per model field with instance=None and its result is cached,
+    instead of being called for every field of every instance.
+    """
+    validator.instance_independent = True  # type: ignore
+    return validator
+
+
+def is_instance_independent(validator: Validator) -> bool:
+    return getattr(validator, "instance_independent", False)
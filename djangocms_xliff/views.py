@@ -1,28 +1,43 @@
 import json
 from dataclasses import asdict
+from itertools import chain
 
 from django.contrib import admin
 from django.contrib.admin.views.decorators import staff_member_required
 from django.forms import Form
-from django.http import HttpResponse
+from django.http import HttpResponseBase
 from django.shortcuts import render
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.translation import gettext
 from django.views import View
 
+from djangocms_xliff.bundles import parse_xliff_upload
 from djangocms_xliff.exceptions import XliffError
-from djangocms_xliff.exports import export_content_as_xliff
-from djangocms_xliff.forms import ExportForm, UploadFileForm
-from djangocms_xliff.imports import save_xliff_context, validate_xliff
-from djangocms_xliff.parsers import parse_xliff_document
+from djangocms_xliff.exports import (
+    export_content_as_xliff_context,
+    export_subtree_as_xliff_contexts,
+    iter_recorded_xliff_bundle,
+    iter_subtree_export_contexts,
+)
+from djangocms_xliff.forms import ExportForm, ExportSubtreeForm, UploadFileForm
+from djangocms_xliff.imports import is_other_page, save_xliff_contexts, validate_xliff_files
+from djangocms_xliff.responses import create_bundle_response, create_sharded_xliff_response
 from djangocms_xliff.settings import (
+    EXTRACTION_DATABASE,
     TEMPLATES_FOLDER,
     TEMPLATES_FOLDER_EXPORT,
     TEMPLATES_FOLDER_IMPORT,
+    XliffVersion,
+)
+from djangocms_xliff.types import ExportContexts, XliffContext, XliffObj
+from djangocms_xliff.utils import (
+    get_lang_name,
+    get_latest_obj_by_version,
+    get_obj,
+    get_xliff_archive_file_name,
+    get_xliff_version,
 )
-from djangocms_xliff.types import XliffContext, XliffObj
-from djangocms_xliff.utils import get_lang_name, get_latest_obj_by_version, get_obj
 
 
 class XliffView(View):
@@ -52,24 +67,39 @@ class ExportView(XliffView):
             return self.render_template(form, current_language)
 
         try:
-            obj = get_obj(content_type_id, obj_id)
-            xliff_str, file_name = export_content_as_xliff(
-                obj=obj,
-                source_language=form.cleaned_data["source_language"],
-                target_language=current_language,
-            )
+            obj = get_obj(content_type_id, obj_id, using=EXTRACTION_DATABASE)
+            return self.create_response(obj, form, current_language)
         except XliffError as e:
             return self.error_response(e)
 
-        return HttpResponse(
-            content_type="application/xliff+xml",
-            content=xliff_str,
-            headers={"Content-Disposition": f"attachment; filename={file_name}"},
+    def create_response(self, obj: XliffObj, form: ExportForm, current_language: str) -> HttpResponseBase:
+        xliff_contexts, file_name = self.export(obj, form, current_language)
+        xliff_version = get_xliff_version("1.2")
+
+        return create_sharded_xliff_response(
+            version=xliff_version,
+            files=[(xliff_context, xliff_context.units) for xliff_context in xliff_contexts],
+            file_name=file_name,
+            compress=form.cleaned_data["compress"],
         )
 
+    def export(self, obj: XliffObj, form: ExportForm, current_language: str) -> ExportContexts:
+        xliff_context, file_name = export_content_as_xliff_context(
+            obj=obj,
+            source_language=form.cleaned_data["source_language"],
+            target_language=current_language,
+            scope=form.get_scope(),
+            only_untranslated=form.cleaned_data["only_untranslated"],
+            only_changed=form.cleaned_data["only_changed"],
+        )
+        return [xliff_context], file_name
+
+    def get_lead(self) -> str:
+        return gettext('Export the content of the currently selected language "%(language)s".')
+
     def render_template(self, form: Form, current_language: str):
         lead_params = {"language": get_lang_name(current_language)}
-        lead = gettext('Export the content of the currently selected language "%(language)s".')
+        lead = self.get_lead()
 
         line1_params = {"import_from": gettext("Import from XLIFF")}
         line1 = gettext('Translate this file in your preferred XLIFF tool and import later on with "%(import_from)s".')
@@ -89,6 +119,46 @@ class ExportView(XliffView):
         return render(self.request, self.template, context)
 
 
+@method_decorator(staff_member_required, name="dispatch")
+class ExportSubtreeView(ExportView):
+    form_class = ExportSubtreeForm
+
+    def create_response(self, obj: XliffObj, form: ExportForm, current_language: str) -> HttpResponseBase:
+        if not form.cleaned_data["bundle"]:
+            return super().create_response(obj, form, current_language)
+
+        export_contexts = iter_subtree_export_contexts(
+            page_content=obj,  # type: ignore
+            source_language=form.cleaned_data["source_language"],
+            target_languages=[current_language],
+            scope=form.get_scope(),
+            only_changed=form.cleaned_data["only_changed"],
+        )
+        # The root page is exported before the response starts, so errors can still be shown
+        first_export_context = next(export_contexts)
+
+        return create_bundle_response(
+            chunks=iter_recorded_xliff_bundle(
+                XliffVersion.V1_2,
+                chain([first_export_context], export_contexts),
+                only_changed=form.cleaned_data["only_changed"],
+            ),
+            file_name=get_xliff_archive_file_name(obj, [current_language]),
+        )
+
+    def export(self, obj: XliffObj, form: ExportForm, current_language: str) -> ExportContexts:
+        return export_subtree_as_xliff_contexts(
+            page_content=obj,  # type: ignore
+            source_language=form.cleaned_data["source_language"],
+            target_language=current_language,
+            scope=form.get_scope(),
+            only_changed=form.cleaned_data["only_changed"],
+        )
+
+    def get_lead(self) -> str:
+        return gettext('Export the content of this page and all its subpages in the language "%(language)s".')
+
+
 @method_decorator(staff_member_required, name="dispatch")
 class UploadView(XliffView):
     template = f"{TEMPLATES_FOLDER_IMPORT}/upload.html"
@@ -107,18 +177,20 @@ class UploadView(XliffView):
         try:
             uploaded_file = form.cleaned_data["file"]
             uploaded_file_name = uploaded_file.name
-            xliff_context = parse_xliff_document(uploaded_file)
+            xliff_contexts = parse_xliff_upload(uploaded_file)
 
             current_obj = get_obj(content_type_id, obj_id)
-            xliff_obj = xliff_context.get_obj()
+            xliff_objs = [xliff_context.get_obj() for xliff_context in xliff_contexts]
 
-            validate_xliff(current_obj, xliff_obj, xliff_context, current_language)
+            validate_xliff_files(current_obj, xliff_objs, xliff_contexts, current_language)
 
+            # Only shards with subpages may have been uploaded, then there is no old version of this page
+            xliff_obj = next((obj for obj in xliff_objs if not is_other_page(current_obj, obj)), current_obj)
             latest_xliff_obj = get_latest_obj_by_version(xliff_obj, current_language)
 
             return self.render_template_success(
                 file_name=uploaded_file_name,
-                xliff_context=xliff_context,
+                xliff_contexts=xliff_contexts,
                 xliff_obj=xliff_obj,
                 current_obj=latest_xliff_obj,
             )
@@ -156,11 +228,11 @@ class UploadView(XliffView):
             "old_version": old_version.short_name(),
         }
 
-    def get_description(self, file_name: str, xliff_context: XliffContext) -> str:
+    def get_description(self, file_name: str, xliff_contexts: list[XliffContext]) -> str:
         description_params = {
-            "language": get_lang_name(xliff_context.target_language),
+            "language": get_lang_name(xliff_contexts[0].target_language),
             "file_name": file_name,
-            "count_plugins": len(xliff_context.units),
+            "count_plugins": sum(len(xliff_context.units) for xliff_context in xliff_contexts),
         }
         description = gettext(
             'Found %(count_plugins)d plugins in "%(file_name)s" that will be imported to the "%(language)s" page.'
@@ -170,11 +242,12 @@ class UploadView(XliffView):
     def render_template_success(
         self,
         file_name: str,
-        xliff_context: XliffContext,
+        xliff_contexts: list[XliffContext],
         xliff_obj: XliffObj,
         current_obj: XliffObj,
     ):
-        description = self.get_description(file_name, xliff_context)
+        xliff_context = xliff_contexts[0]
+        description = self.get_description(file_name, xliff_contexts)
 
         old_version_hint = self.get_old_version_hint(xliff_obj, current_obj)
 
@@ -195,8 +268,8 @@ class UploadView(XliffView):
                     "current_language": xliff_context.target_language,
                 },
             ),
-            "xliff": xliff_context,
-            "xliff_json": json.dumps(asdict(xliff_context)),
+            "xliffs": xliff_contexts,
+            "xliff_json": json.dumps([asdict(context) for context in xliff_contexts]),
         }
         return render(self.request, self.template_success, context)
 
@@ -206,10 +279,10 @@ class ImportView(XliffView):
     def post(self, request, content_type_id: int, obj_id: int, *args, **kwargs):
         try:
             data = json.loads(request.POST["xliff_json"])
-            xliff_context = XliffContext.from_dict(data)
-            save_xliff_context(xliff_context)
+            xliff_contexts = [XliffContext.from_dict(file_data) for file_data in data]
+            save_xliff_contexts(xliff_contexts)
 
-            obj = xliff_context.get_obj()
+            obj = xliff_contexts[0].get_obj()
 
             model_admin = admin.site._registry[obj._meta.model]  # type: ignore
             return model_admin.response_change(request, obj)
@@ -0,0 +1,55 @@
+"""
+Compares the native XLIFF serializer with the django template.
+Run with: DJANGO_SETTINGS_MODULE=tests.settings python -m tests.benchmark_renderer
+"""
+
+from timeit import timeit
+
+import django
+
+django.setup()
+
+from djangocms_xliff.renderer import render_xliff_document, render_xliff_template  # noqa: E402
+from djangocms_xliff.settings import XliffVersion  # noqa: E402
+from djangocms_xliff.types import Unit, XliffContext  # noqa: E402
+
+
+def create_xliff_context(number_of_units: int) -> XliffContext:
+    units = [
+        Unit(
+            plugin_id=str(index),
+            plugin_type="TextPlugin",
+            plugin_name="Text",
+            field_name="body",
+            field_type="djangocms_text_ckeditor.fields.HTMLField",
+            field_verbose_name="Body",
+            source=f"<p>Paragraph {index} with <strong>some</strong> markup &amp; text</p>",
+            max_length=255,
+        )
+        for index in range(number_of_units)
+    ]
+    return XliffContext(
+        source_language="de",
+        target_language="fr",
+        content_type_id=1,
+        obj_id=1,
+        path="/benchmark",
+        units=units,
+    )
+
+
+def main():
+    for number_of_units in (1_000, 10_000, 100_000):
+        context = create_xliff_context(number_of_units)
+        assert render_xliff_document(XliffVersion.V1_2, context) == render_xliff_template(XliffVersion.V1_2, context)
+
+        template_seconds = timeit(lambda: render_xliff_template(XliffVersion.V1_2, context), number=1)  # noqa: B023
+        native_seconds = timeit(lambda: render_xliff_document(XliffVersion.V1_2, context), number=1)  # noqa: B023
+        print(
+            f"{number_of_units:>7} units: template {template_seconds:.3f}s, native {native_seconds:.3f}s, "
+            f"{template_seconds / native_seconds:.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    main()
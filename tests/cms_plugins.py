@@ -4,6 +4,7 @@ from cms.plugin_pool import plugin_pool
 
 from tests.models import (
     TestChildModel,
+    TestLayoutModel,
     TestMultipleFieldsModel,
     TestOneFieldModel,
     TestParentModel,
@@ -42,3 +43,11 @@ class TestChildPlugin(CMSPluginBase):
     render_template = "testing.html"
     require_parent = True
     parent_classes = ["TestParentPlugin"]
+
+
+@plugin_pool.register_plugin
+class TestLayoutPlugin(CMSPluginBase):
+    model = TestLayoutModel
+    name = "Test layout plugin"
+    render_template = TEST_TEMPLATE
+    allow_children = True
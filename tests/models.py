@@ -36,10 +36,21 @@ class TestChildModel(CMSPlugin):
         verbose_name = "Test Child Model"
 
 
+class TestLayoutModel(CMSPlugin):
+    columns = models.IntegerField(default=1, verbose_name="Columns")
+
+    class Meta:  # type: ignore
+        verbose_name = "Test Layout Model"
+
+
 class TestModelStaticPlaceholder(Model):
     placeholder = OneToOneField(StaticPlaceholder, null=True, on_delete=PROTECT)
 
 
+class TestOtherModelStaticPlaceholder(Model):
+    placeholder = OneToOneField(StaticPlaceholder, null=True, on_delete=PROTECT)
+
+
 class TestModelMetadata(Model):
     title = models.CharField(max_length=100, verbose_name="Title")
     slug = models.SlugField(verbose_name="Slug")
@@ -0,0 +1,32 @@
+from django.http import StreamingHttpResponse
+
+from djangocms_xliff.admin import XliffImportExportMixin
+from djangocms_xliff.exceptions import XliffExportError
+
+
+class ErrorAdmin(XliffImportExportMixin):
+    def iter_objs_with_units(self, request, language):
+        raise XliffExportError("Metadata field not found")
+        yield
+
+    def error_response(self, request, message):
+        return str(message)
+
+
+class EmptyAdmin(XliffImportExportMixin):
+    def iter_objs_with_units(self, request, language):
+        yield from ()
+
+    def get_model_info(self):
+        return "tests", "empty"
+
+
+def test_handle_export_shows_errors_of_the_first_object(rf):
+    assert ErrorAdmin().handle_export(rf.post("/"), "en", "de") == "Metadata field not found"
+
+
+def test_handle_export_without_objects(rf):
+    response = EmptyAdmin().handle_export(rf.post("/"), "en", "de")
+
+    assert isinstance(response, StreamingHttpResponse)
+    assert b"<xliff" in b"".join(response.streaming_content)
@@ -0,0 +1,122 @@
+import hashlib
+import json
+from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+from djangocms_xliff.bundles import MANIFEST_FILE_NAME, iter_xliff_bundle, parse_xliff_upload, read_xliff_bundle
+from djangocms_xliff.exceptions import XliffError
+from djangocms_xliff.exports import iter_recorded_xliff_bundle
+from djangocms_xliff.models import ExportLedgerEntry
+from djangocms_xliff.renderer import render_xliff_document
+from djangocms_xliff.settings import XliffVersion
+from djangocms_xliff.types import Unit
+
+
+def create_units(obj_id: int, count: int) -> list[Unit]:
+    return [
+        Unit(
+            plugin_id=f"{obj_id}{index}",
+            plugin_type="TestPlugin",
+            plugin_name="Test Plugin",
+            field_name="body",
+            field_type="django.db.models.TextField",
+            field_verbose_name="Body",
+            source=f"Text {index}",
+            target=f"Texte {index}",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def export_contexts(create_xliff_page_context):
+    return [
+        (create_xliff_page_context(create_units(1, 3), obj_id=1, path="/de/root"), "root_fr.xliff"),
+        (create_xliff_page_context(create_units(2, 1), obj_id=2, path="/de/root/child"), "root_child_fr.xliff"),
+    ]
+
+
+@pytest.mark.django_db
+def test_iter_xliff_bundle(export_contexts):
+    chunks = list(iter_xliff_bundle(XliffVersion.V1_2, iter(export_contexts)))
+    assert len(chunks) > 1
+
+    bundle = BytesIO(b"".join(chunks))
+    with ZipFile(bundle) as archive:
+        assert archive.namelist() == ["root_fr.xliff", "root_child_fr.xliff", MANIFEST_FILE_NAME]
+
+        manifest = json.loads(archive.read(MANIFEST_FILE_NAME))
+        assert manifest["version"] == "1.2"
+        assert [(file["file_name"], file["objects"][0]["obj_id"], file["units"]) for file in manifest["files"]] == [
+            ("root_fr.xliff", 1, 3),
+            ("root_child_fr.xliff", 2, 1),
+        ]
+
+        for (xliff_context, file_name), manifest_file in zip(export_contexts, manifest["files"], strict=True):
+            data = archive.read(file_name)
+            assert data.decode() == render_xliff_document(XliffVersion.V1_2, xliff_context)
+            assert manifest_file["sha256"] == hashlib.sha256(data).hexdigest()
+
+    assert read_xliff_bundle(bundle) == [xliff_context for xliff_context, _ in export_contexts]
+
+
+@pytest.mark.django_db
+def test_parse_xliff_upload(export_contexts):
+    xliff_context, _ = export_contexts[0]
+    xliff_file = BytesIO(render_xliff_document(XliffVersion.V1_2, xliff_context).encode())
+    assert parse_xliff_upload(xliff_file) == [xliff_context]
+
+    # Bundles packed again without a manifest are read by file name
+    bundle = BytesIO()
+    with ZipFile(bundle, "w") as archive:
+        for xliff_context, file_name in export_contexts:
+            archive.writestr(file_name, render_xliff_document(XliffVersion.V1_2, xliff_context))
+        archive.writestr("readme.txt", "Translated")
+
+    assert parse_xliff_upload(bundle) == [export_contexts[1][0], export_contexts[0][0]]
+
+
+def test_read_xliff_bundle_rejects_large_files():
+    bundle = BytesIO()
+    with ZipFile(bundle, "w", compression=ZIP_DEFLATED) as archive:
+        archive.writestr("small.xliff", b"<xliff/>")
+        archive.writestr("bomb.xliff", b"\0" * 1024 * 1024)
+
+    assert len(bundle.getvalue()) < 10 * 1024
+
+    with pytest.raises(XliffError, match="bomb.xliff"):
+        read_xliff_bundle(bundle, max_file_bytes=1024, max_bytes=10 * 1024 * 1024)
+
+    with pytest.raises(XliffError, match="too large when unpacked"):
+        read_xliff_bundle(bundle, max_file_bytes=10 * 1024 * 1024, max_bytes=1024)
+
+
+@pytest.mark.django_db
+def test_iter_recorded_xliff_bundle(export_contexts):
+    chunks = iter_recorded_xliff_bundle(XliffVersion.V1_2, export_contexts, only_changed=True)
+    next(chunks)
+    chunks.close()
+    assert not ExportLedgerEntry.objects.exists()
+
+    b"".join(iter_recorded_xliff_bundle(XliffVersion.V1_2, export_contexts))
+    assert not ExportLedgerEntry.objects.exists()
+
+    b"".join(iter_recorded_xliff_bundle(XliffVersion.V1_2, export_contexts, only_changed=True))
+    assert ExportLedgerEntry.objects.count() == 4
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "manifest",
+    ["not json", json.dumps({"version": "1.2"}), json.dumps([]), json.dumps({"files": [{"units": 1}]})],
+)
+def test_parse_xliff_upload_with_invalid_manifest(export_contexts, manifest):
+    bundle = BytesIO()
+    with ZipFile(bundle, "w") as archive:
+        for xliff_context, file_name in export_contexts:
+            archive.writestr(file_name, render_xliff_document(XliffVersion.V1_2, xliff_context))
+        archive.writestr(MANIFEST_FILE_NAME, manifest)
+
+    assert parse_xliff_upload(bundle) == [export_contexts[1][0], export_contexts[0][0]]
@@ -0,0 +1,97 @@
+from unittest.mock import patch
+
+import pytest
+from cms import operations
+from cms.models import PageContent
+from cms.signals import post_placeholder_operation
+from django.core.cache import caches
+
+from djangocms_xliff.cache import get_extraction_cache_stats, reset_extraction_cache_stats
+from djangocms_xliff.extractors import extract_units_from_obj
+from tests.models import TestTitleExtension
+
+
+@pytest.fixture
+def extraction_cache():
+    caches["default"].clear()
+    reset_extraction_cache_stats()
+    with patch("djangocms_xliff.cache.EXTRACTION_CACHE", "default"):
+        yield
+    caches["default"].clear()
+    reset_extraction_cache_stats()
+
+
+@pytest.mark.django_db
+def test_extraction_cache_hit(extraction_cache, page_with_one_field_in_plugin, django_assert_max_num_queries):
+    page, _ = page_with_one_field_in_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    expected = extract_units_from_obj(obj, "en")
+
+    with django_assert_max_num_queries(0):
+        assert extract_units_from_obj(obj, "en") == expected
+
+    assert extract_units_from_obj(obj, "en", include_metadata=False) != expected
+    assert get_extraction_cache_stats() == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_extraction_cache_invalidated_by_plugin(extraction_cache, page_with_one_field_in_plugin):
+    page, plugin = page_with_one_field_in_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    extract_units_from_obj(obj, "en", include_metadata=False)
+
+    plugin.body = "Changed plugin"
+    plugin.save()
+
+    computed = extract_units_from_obj(obj, "en", include_metadata=False)
+
+    assert [unit.source for unit in computed] == ["Changed plugin"]
+    assert get_extraction_cache_stats() == {"hits": 0, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_extraction_cache_invalidated_by_extension(extraction_cache, page_with_one_field_in_plugin):
+    page, _ = page_with_one_field_in_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    extract_units_from_obj(obj, "en")
+    TestTitleExtension.objects.create(title="Title Test", extended_object=obj)
+    computed = extract_units_from_obj(obj, "en")
+
+    assert "Title Test" in [unit.source for unit in computed]
+    assert get_extraction_cache_stats() == {"hits": 0, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_extraction_cache_invalidated_by_placeholder_operation(
+    extraction_cache, page_with_multiple_placeholders_and_one_plugin, rf, admin_user
+):
+    page, main_plugin, second_plugin = page_with_multiple_placeholders_and_one_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    extract_units_from_obj(obj, "en", include_metadata=False)
+
+    request = rf.post("/")
+    request.user = admin_user
+
+    source_placeholder = main_plugin.placeholder
+    target_placeholder = second_plugin.placeholder
+    source_placeholder.move_plugin(main_plugin, target_position=2, target_placeholder=target_placeholder)
+    post_placeholder_operation.send(
+        sender=PageContent,
+        operation=operations.MOVE_PLUGIN,
+        request=request,
+        language="en",
+        token="token",
+        origin="/",
+        plugin=main_plugin,
+        source_placeholder=source_placeholder,
+        target_placeholder=target_placeholder,
+    )
+
+    computed = extract_units_from_obj(obj, "en", include_metadata=False)
+
+    assert [unit.source for unit in computed] == ["Plugin in second placeholder", "Plugin in main placeholder"]
+    assert get_extraction_cache_stats() == {"hits": 0, "misses": 2}
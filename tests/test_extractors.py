@@ -1,21 +1,51 @@
+from dataclasses import replace
 from functools import partial
+from types import GeneratorType
+from unittest.mock import patch
 
 import pytest
+from cms.api import add_plugin, create_page, create_page_content
 from cms.models import PageContent
+from cms.utils.placeholder import get_placeholders
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections
+from django.db.models import CharField
+from django.test.utils import CaptureQueriesContext
 
+from djangocms_xliff.exceptions import XliffError, XliffExportError
 from djangocms_xliff.extractors import (
+    clear_declared_placeholders_cache,
+    downcast_plugins,
     extract_extension_data_from_page,
+    extract_extension_data_from_page_contents,
     extract_metadata_from_obj,
+    extract_metadata_from_objs,
     extract_units_from_obj,
     extract_units_from_obj_by_field_name,
+    extract_units_from_objs_by_language,
     extract_units_from_placeholder,
     extract_units_from_plugin,
     extract_units_from_plugin_instance,
+    get_declared_placeholders_for_obj,
+    get_model_plan,
+    get_plugin_tree,
+    get_plugin_types_classification,
+    get_subtree_page_contents,
+    iter_units_from_obj,
+    iter_units_from_objs,
 )
+from djangocms_xliff.registry import build_field_registry
 from djangocms_xliff.settings import METADATA_FIELDS
-from djangocms_xliff.types import Unit
-from djangocms_xliff.utils import get_plugin_id_for_extension_obj, get_plugin_id_for_metadata_obj, get_type_with_path
+from djangocms_xliff.types import ExportScope, Unit
+from djangocms_xliff.utils import (
+    get_obj,
+    get_plugin_id_for_extension_obj,
+    get_plugin_id_for_metadata_obj,
+    get_type_with_path,
+)
+from djangocms_xliff.validators import instance_independent
 from tests.conftest import get_page_placeholder
+from tests.models import TestOtherModelStaticPlaceholder, TestPageExtension, TestTitleExtension
 
 
 def page_with_one_field_expected_units() -> list[Unit]:
@@ -59,6 +89,124 @@ def test_extract_units_from_placeholder(page_with_one_field_in_plugin):
     assert extract_units_from_placeholder(placeholder, "en") == page_with_one_field_expected_units()
 
 
+@pytest.mark.django_db
+def test_extract_units_from_placeholder_in_tree_order(page_with_one_nested_plugin, django_assert_num_queries):
+    page, parent_plugin, child_plugin = page_with_one_nested_plugin()
+
+    placeholder = get_page_placeholder(page=page, slot="main", language="en")
+    second_parent_plugin = add_plugin(placeholder, plugin_type="TestParentPlugin", language="en", body="Parent 2")
+    add_plugin(placeholder, "TestChildPlugin", target=parent_plugin, language="en", title="Child 2")
+    add_plugin(placeholder, "TestChildPlugin", target=second_parent_plugin, language="en", title="Child 3")
+
+    root_plugins = placeholder.get_plugins("en").filter(parent__isnull=True).order_by("position")
+    expected = [unit for cms_plugin in root_plugins for unit in extract_units_from_plugin(cms_plugin)]
+
+    # One query for the plugin rows and one per plugin model
+    with django_assert_num_queries(3):
+        computed = extract_units_from_placeholder(placeholder, "en")
+
+    assert [unit.source for unit in computed] == ["Parent text", "Child text", "Child 2", "Parent 2", "Child 3"]
+    assert computed == expected
+
+
+@pytest.mark.django_db
+def test_extract_units_from_placeholder_with_plugin_type_scope(page_with_one_nested_plugin, django_assert_num_queries):
+    page, parent_plugin, child_plugin = page_with_one_nested_plugin()
+
+    placeholder = get_page_placeholder(page=page, slot="main", language="en")
+    add_plugin(placeholder, "TestChildPlugin", target=parent_plugin, language="en", title="Child 2")
+    add_plugin(placeholder, plugin_type="TestParentPlugin", language="en", body="Parent 2")
+
+    # Children of filtered plugins are kept, the parent model is never queried
+    with django_assert_num_queries(2):
+        computed = extract_units_from_placeholder(
+            placeholder, "en", scope=ExportScope(include_plugin_types=("TestChildPlugin",))
+        )
+    assert [unit.source for unit in computed] == ["Child text", "Child 2"]
+
+    computed = extract_units_from_placeholder(
+        placeholder, "en", scope=ExportScope(exclude_plugin_types=("TestChildPlugin",))
+    )
+    assert [unit.source for unit in computed] == ["Parent text", "Parent 2"]
+
+
+@pytest.mark.django_db
+def test_extract_units_from_placeholder_skips_layout_plugins(create_draft_page, django_assert_num_queries):
+    page = create_draft_page("en")
+    placeholder = get_page_placeholder(page=page, slot="main", language="en")
+
+    layout_plugin = add_plugin(placeholder, plugin_type="TestLayoutPlugin", language="en", columns=2)
+    add_plugin(placeholder, "TestOneFieldPlugin", target=layout_plugin, language="en", body="First plugin")
+
+    # One query for the plugin rows and one for the only translatable plugin model
+    with django_assert_num_queries(2):
+        computed = extract_units_from_placeholder(placeholder, "en")
+
+    assert [unit.source for unit in computed] == ["First plugin"]
+
+
+@pytest.mark.django_db
+def test_downcast_plugins_loads_only_translatable_fields(page_with_multiple_fields_in_one_plugin):
+    page, plugin = page_with_multiple_fields_in_one_plugin()
+    placeholder = get_page_placeholder(page=page, slot="main", language="en")
+
+    instances = downcast_plugins(placeholder.get_plugins("en"))
+    assert instances[plugin.pk].get_deferred_fields() >= {"amount", "is_good"}
+
+    def is_not_empty(field, instance):
+        return instance.amount > 0
+
+    get_model_plan.cache_clear()
+    try:
+        with patch("djangocms_xliff.extractors.VALIDATORS", [is_not_empty]):
+            instances = downcast_plugins(placeholder.get_plugins("en"))
+    finally:
+        get_model_plan.cache_clear()
+
+    assert instances[plugin.pk].get_deferred_fields() == set()
+
+
+def test_get_plugin_types_classification():
+    classification = get_plugin_types_classification()
+
+    assert classification["TestOneFieldPlugin"] is True
+    assert classification["TestLayoutPlugin"] is False
+
+
+@pytest.mark.django_db
+def test_extract_units_from_page_with_missing_placeholder(page_with_multiple_placeholders_and_one_plugin, caplog):
+    page, main_plugin, second_plugin = page_with_multiple_placeholders_and_one_plugin()
+    get_page_placeholder(page=page, slot="main", language="en").delete()
+
+    obj = PageContent.admin_manager.get(page=page, language="en")
+    computed = extract_units_from_obj(obj, "en", include_metadata=False)
+
+    assert [unit.plugin_id for unit in computed] == [str(second_plugin.pk)]
+    assert 'Declared placeholder "main" does not exist' in caplog.text
+
+
+@pytest.mark.django_db
+def test_declared_placeholders_are_cached_per_template(page_with_one_field_in_plugin):
+    page, _ = page_with_one_field_in_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    clear_declared_placeholders_cache()
+    with patch(
+        "djangocms_xliff.extractors._get_template_placeholders_original", wraps=get_placeholders
+    ) as mocked_get_placeholders:
+        assert [pl.slot for pl in get_declared_placeholders_for_obj(obj)] == ["main", "second"]
+        assert [pl.slot for pl in get_declared_placeholders_for_obj(obj)] == ["main", "second"]
+        assert mocked_get_placeholders.call_count == 1
+
+        with patch("djangocms_xliff.extractors.get_template_mtime", return_value=0.0):
+            get_declared_placeholders_for_obj(obj)
+        assert mocked_get_placeholders.call_count == 2
+
+        clear_declared_placeholders_cache()
+        get_declared_placeholders_for_obj(obj)
+        assert mocked_get_placeholders.call_count == 3
+
+
 @pytest.mark.django_db
 def test_extract_units_from_page_one_field(page_with_one_field_in_plugin):
     page, _ = page_with_one_field_in_plugin()
@@ -67,6 +215,29 @@ def test_extract_units_from_page_one_field(page_with_one_field_in_plugin):
     assert extract_units_from_obj(obj, "en", include_metadata=False) == page_with_one_field_expected_units()
 
 
+@pytest.mark.django_db
+def test_iter_units_from_obj(page_with_multiple_placeholders_and_multiple_plugins):
+    page, *_ = page_with_multiple_placeholders_and_multiple_plugins()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    units = iter_units_from_obj(obj, "en")
+
+    assert isinstance(units, GeneratorType)
+    assert list(units) == extract_units_from_obj(obj, "en")
+
+
+@pytest.mark.django_db
+def test_iter_units_from_obj_without_plugins(create_draft_page):
+    page = create_draft_page("en")
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    units = iter_units_from_obj(obj, "en")
+    with pytest.raises(XliffExportError):
+        next(units)
+
+    assert list(iter_units_from_obj(obj, "en", include_metadata=False, allow_empty_plugins=True)) == []
+
+
 @pytest.mark.django_db
 def test_extract_units_from_page_multiple_fields(page_with_multiple_fields_in_one_plugin):
     page, plugin = page_with_multiple_fields_in_one_plugin()
@@ -227,6 +398,120 @@ def test_extract_units_form_page_multiple_placeholders_multiple_plugins(
     assert extract_units_from_obj(obj, "en", include_metadata=False) == expected
 
 
+@pytest.mark.django_db
+def test_extract_units_from_obj_with_slot_scope(page_with_multiple_placeholders_and_multiple_plugins):
+    page, main_plugin_1, main_plugin_2, second_plugin = page_with_multiple_placeholders_and_multiple_plugins()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    with patch("djangocms_xliff.extractors.get_plugin_tree", wraps=get_plugin_tree) as plugin_tree_mock:
+        computed = extract_units_from_obj(
+            obj, "en", include_metadata=False, scope=ExportScope(include_slots=("second",))
+        )
+
+    assert [unit.plugin_id for unit in computed] == [str(second_plugin.pk)]
+    assert [call.args[0].slot for call in plugin_tree_mock.call_args_list] == ["second"]
+
+    computed = extract_units_from_obj(obj, "en", include_metadata=False, scope=ExportScope(exclude_slots=("second",)))
+    assert {unit.plugin_id for unit in computed} == {str(main_plugin_1.pk), str(main_plugin_2.pk)}
+
+
+@pytest.mark.django_db(databases=["default", "replica"])
+def test_extract_units_from_obj_reads_from_extraction_database(page_with_one_field_in_plugin):
+    page, plugin = page_with_one_field_in_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    with (
+        patch("djangocms_xliff.extractors.EXTRACTION_DATABASE", "replica"),
+        CaptureQueriesContext(connections["default"]) as default_queries,
+        CaptureQueriesContext(connections["replica"]) as replica_queries,
+    ):
+        computed = extract_units_from_obj(obj, "en", include_metadata=False, allow_empty_plugins=True)
+
+    # The replica is empty, so the placeholders of the page are not found there
+    assert computed == []
+    assert any("cms_placeholder" in query["sql"] for query in replica_queries)
+    assert not any("cms_placeholder" in query["sql"] for query in default_queries)
+
+    with pytest.raises(XliffError):
+        get_obj(ContentType.objects.get_for_model(obj).pk, obj.pk, using="replica")
+
+
+@pytest.mark.django_db
+def test_extract_units_with_validators(page_with_multiple_placeholders_and_multiple_plugins):
+    page, main_plugin_1, main_plugin_2, second_plugin = page_with_multiple_placeholders_and_multiple_plugins()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    validated_fields = []
+
+    @instance_independent
+    def is_not_lead(field, instance):
+        validated_fields.append(field.name)
+        return field.name != "lead"
+
+    def is_not_second_plugin(field, instance):
+        return instance.pk != second_plugin.pk
+
+    get_model_plan.cache_clear()
+    try:
+        with patch("djangocms_xliff.extractors.VALIDATORS", [is_not_lead, is_not_second_plugin]):
+            computed = extract_units_from_obj(obj, "en", include_metadata=False)
+            extract_units_from_obj(obj, "en", include_metadata=False)
+    finally:
+        get_model_plan.cache_clear()
+
+    assert [(unit.plugin_id, unit.field_name) for unit in computed] == [
+        (str(main_plugin_1.pk), "body"),
+        (str(main_plugin_2.pk), "title"),
+    ]
+    # Instance independent validators only run once per model field
+    assert sorted(validated_fields) == ["body", "lead", "title"]
+
+
+@pytest.mark.django_db
+def test_extract_units_with_batch_extractors(page_with_multiple_placeholders_and_multiple_plugins):
+    page, main_plugin_1, main_plugin_2, second_plugin = page_with_multiple_placeholders_and_multiple_plugins()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    expected = [
+        replace(unit, source=unit.source.upper()) if unit.field_type == get_type_with_path(CharField()) else unit
+        for unit in extract_units_from_obj(obj, "en", include_metadata=False)
+    ]
+
+    calls = []
+
+    def upper_char_field_batch_extractor(items):
+        calls.append([(instance.pk, field.name) for instance, field, source in items])
+        return [
+            [
+                Unit(
+                    plugin_id=str(instance.pk),
+                    plugin_type=instance.plugin_type,
+                    plugin_name=instance.get_plugin_name(),
+                    field_name=field.name,
+                    field_type=get_type_with_path(field),
+                    field_verbose_name=field.verbose_name,
+                    source=source.upper(),
+                    max_length=field.max_length,
+                )
+            ]
+            for instance, field, source in items
+        ]
+
+    try:
+        with patch("djangocms_xliff.registry.FIELD_BATCH_EXTRACTORS", {CharField: upper_char_field_batch_extractor}):
+            build_field_registry()
+            get_model_plan.cache_clear()
+            computed = extract_units_from_obj(obj, "en", include_metadata=False)
+    finally:
+        build_field_registry()
+        get_model_plan.cache_clear()
+
+    assert computed == expected
+    assert calls == [
+        [(main_plugin_1.pk, "body"), (main_plugin_2.pk, "title"), (second_plugin.pk, "body")],
+    ]
+
+
 @pytest.mark.django_db
 def test_extract_units_from_model(model_with_static_placeholder):
     test_model, _ = model_with_static_placeholder()
@@ -376,3 +661,134 @@ def test_extract_units_from_title_extension(page_with_title_extension):
         )
 
     assert computed == expected
+
+
+@pytest.fixture
+def page_contents_with_extensions(create_draft_page):
+    page_contents = []
+    for i in range(3):
+        page = create_draft_page("en", slug=f"page-{i}", overwrite_url=f"page/{i}")
+        page_content = page.get_content_obj("en")
+        placeholder = get_page_placeholder(page=page, slot="main", language="en")
+        add_plugin(placeholder, plugin_type="TestOneFieldPlugin", language="en", body=f"Plugin {i}")
+        TestTitleExtension.objects.create(title=f"Title extension {i}", extended_object=page_content)
+        TestPageExtension.objects.create(title=f"Page extension {i}", extended_object=page)
+        page_contents.append(PageContent.admin_manager.get(pk=page_content.pk))
+    return page_contents
+
+
+@pytest.mark.django_db
+def test_extract_extension_data_from_page_contents(page_contents_with_extensions, django_assert_num_queries):
+    expected = {
+        page_content.pk: extract_extension_data_from_page(page_content, "en")
+        for page_content in page_contents_with_extensions
+    }
+
+    # One query per registered extension model, for all pages
+    with django_assert_num_queries(2):
+        computed = extract_extension_data_from_page_contents(page_contents_with_extensions, "en")
+
+    assert computed == expected
+    assert [unit.source for unit in computed[page_contents_with_extensions[1].pk]] == [
+        "Title extension 1",
+        "Page extension 1",
+    ]
+
+
+@pytest.mark.django_db
+def test_iter_units_from_objs(page_contents_with_extensions):
+    computed = list(iter_units_from_objs(page_contents_with_extensions, "en"))
+
+    assert computed == [
+        (page_content, extract_units_from_obj(page_content, "en")) for page_content in page_contents_with_extensions
+    ]
+
+
+@pytest.mark.django_db
+def test_iter_units_from_objs_extracts_shared_placeholders_once(model_with_static_placeholder):
+    test_model, _ = model_with_static_placeholder()
+    other_test_model = TestOtherModelStaticPlaceholder.objects.create(placeholder=test_model.placeholder)
+
+    computed = list(iter_units_from_objs([test_model, other_test_model], "en", include_metadata=False))
+
+    assert computed == [(test_model, page_with_one_field_expected_units()), (other_test_model, [])]
+
+
+@pytest.mark.django_db
+def test_extract_units_from_objs_by_language(page_with_multiple_placeholders_and_multiple_plugins):
+    page, *_ = page_with_multiple_placeholders_and_multiple_plugins()
+    create_page_content("de", "Test", page)
+    for slot in ("main", "second"):
+        placeholder = get_page_placeholder(page=page, slot=slot, language="de")
+        add_plugin(placeholder, plugin_type="TestOneFieldPlugin", language="de", body=f"Deutsch {slot}")
+
+    objs_by_language = {
+        language: PageContent.admin_manager.get(page=page, language=language) for language in ("en", "de")
+    }
+
+    # Warm the caches of declared placeholders, model plans and content types, so only the extraction is measured
+    expected = {language: extract_units_from_obj(obj, language) for language, obj in objs_by_language.items()}
+
+    with CaptureQueriesContext(connections["default"]) as separate_queries:
+        for language, obj in objs_by_language.items():
+            extract_units_from_obj(obj, language)
+
+    with CaptureQueriesContext(connections["default"]) as queries:
+        computed = extract_units_from_objs_by_language(objs_by_language)
+
+    assert computed == expected
+    assert len(queries) < len(separate_queries)
+
+
+@pytest.mark.django_db
+def test_get_subtree_page_contents(create_draft_page, django_assert_num_queries):
+    root = create_draft_page("en")
+    child = create_page("Child", "testing.html", "en", parent=root, slug="child")
+    grandchild = create_page("Grandchild", "testing.html", "en", parent=child, slug="grandchild")
+    create_page("Other", "testing.html", "en", slug="other")
+
+    root_content = PageContent.admin_manager.select_related("page").get(page=root, language="en")
+
+    # One query for the page contents with their pages and one for the page urls
+    with django_assert_num_queries(2):
+        page_contents = get_subtree_page_contents(root_content, "en")
+        page_urls = [page_content.page.get_url_obj("en") for page_content in page_contents]
+
+    assert [page_content.page for page_content in page_contents] == [root, child, grandchild]
+    assert [page_url.slug for page_url in page_urls] == ["test-example", "child", "grandchild"]
+
+
+@pytest.mark.django_db
+def test_iter_units_from_objs_loads_plugins_per_batch(create_draft_page, django_assert_max_num_queries):
+    root = create_draft_page("en")
+    for index in range(5):
+        page = create_page(f"Child {index}", "testing.html", "en", parent=root, slug=f"child-{index}")
+        placeholder = get_page_placeholder(page=page, slot="main", language="en")
+        add_plugin(placeholder, plugin_type="TestOneFieldPlugin", language="en", body=f"Child {index}")
+
+    page_contents = get_subtree_page_contents(PageContent.admin_manager.get(page=root, language="en"), "en")
+
+    with CaptureQueriesContext(connections["default"]) as queries:
+        computed = list(iter_units_from_objs(page_contents, "en", include_metadata=False, allow_empty_plugins=True))
+
+    assert [[unit.source for unit in units] for _, units in computed] == [[]] + [[f"Child {i}"] for i in range(5)]
+    assert len([query for query in queries if 'FROM "cms_cmsplugin"' in query["sql"]]) == 1
+
+
+@pytest.mark.django_db
+def test_extract_metadata_from_objs(create_draft_page, django_assert_num_queries):
+    root = create_draft_page("en")
+    for index in range(5):
+        create_page(f"Child {index}", "testing.html", "en", parent=root, slug=f"child-{index}")
+
+    page_contents = list(PageContent.admin_manager.select_related("page").filter(language="en").order_by("page__path"))
+    expected = [extract_metadata_from_obj(page_content, "en") for page_content in page_contents]
+
+    page_contents = list(PageContent.admin_manager.select_related("page").filter(language="en").order_by("page__path"))
+
+    # One query for the page urls of all page contents
+    with django_assert_num_queries(1):
+        computed = extract_metadata_from_objs(page_contents, "en")
+
+    assert computed == expected
+    assert [units[-1].source for units in computed][1:] == [f"child-{index}" for index in range(5)]
@@ -1,15 +1,17 @@
 from functools import partial
 
 import pytest
-from cms.api import create_page
+from cms.api import add_plugin, create_page
 from cms.models import CMSPlugin, PageContent
 
 from djangocms_xliff.exceptions import XliffImportError
-from djangocms_xliff.extractors import extract_units_from_obj
+from djangocms_xliff.extractors import extract_units_from_obj, get_subtree_page_contents, iter_units_from_objs
 from djangocms_xliff.imports import (
     save_xliff_context,
+    save_xliff_contexts,
     validate_page_with_xliff_context,
     validate_units_max_lengths,
+    validate_xliff_files,
 )
 from djangocms_xliff.settings import UNIT_ID_METADATA_ID
 from djangocms_xliff.types import Unit
@@ -119,6 +121,65 @@ def test_extract_and_save_xliff_context(
     assert main_plugin_2_updated.lead == main_plugin_2_target_text_lead  # type: ignore
 
 
+@pytest.mark.django_db
+def test_extract_and_save_subtree(create_xliff_page_context, create_draft_page):
+    root = create_draft_page("en")
+    plugins = []
+    for page in (root, create_page("Child", "testing.html", "en", parent=root, slug="child")):
+        placeholder = page.get_placeholders("en").get(slot="main")
+        plugins.append(add_plugin(placeholder, plugin_type="TestOneFieldPlugin", language="en", body="Text"))
+
+    root_content = PageContent.admin_manager.get(page=root, language="en")
+    page_contents = get_subtree_page_contents(root_content, "en")
+    units = [unit for _, obj_units in iter_units_from_objs(page_contents, "en") for unit in obj_units]
+    for unit in units:
+        unit.target = f"{unit.source} translated"
+
+    xliff_context = create_xliff_page_context(units, source_language="de", target_language="en", obj_id=root_content.pk)
+    save_xliff_context(xliff_context)
+
+    # Every unit is routed to its page by its id
+    assert [CMSPlugin.objects.get(pk=plugin.pk).get_bound_plugin().body for plugin in plugins] == [
+        "Text translated",
+        "Text translated",
+    ]
+    assert PageContent.admin_manager.get(page__parent=root, language="en").title == "Child translated"
+
+
+@pytest.mark.django_db
+def test_validate_and_save_xliff_files(create_xliff_page_context, create_draft_page):
+    root = create_draft_page("en")
+    child = create_page("Child", "testing.html", "en", parent=root, slug="child")
+    other = create_page("Other", "testing.html", "en", slug="other")
+    for page in (root, child):
+        placeholder = page.get_placeholders("en").get(slot="main")
+        add_plugin(placeholder, plugin_type="TestOneFieldPlugin", language="en", body="Text")
+
+    root_content = PageContent.admin_manager.get(page=root, language="en")
+    page_contents = get_subtree_page_contents(root_content, "en")
+    xliff_contexts = []
+    for obj, units in iter_units_from_objs(page_contents, "en"):
+        for unit in units:
+            unit.target = f"{unit.source} translated"
+        xliff_contexts.append(
+            create_xliff_page_context(units, source_language="de", target_language="en", obj_id=obj.pk)
+        )
+
+    validate_xliff_files(root_content, page_contents, xliff_contexts, "en")
+
+    other_content = PageContent.admin_manager.get(page=other, language="en")
+    with pytest.raises(XliffImportError):
+        validate_xliff_files(root_content, [root_content, other_content], xliff_contexts, "en")
+
+    save_xliff_contexts(xliff_contexts)
+
+    assert PageContent.admin_manager.get(page=child, language="en").title == "Child translated"
+    assert [plugin.get_bound_plugin().body for plugin in CMSPlugin.objects.filter(language="en")] == [
+        "Text translated",
+        "Text translated",
+    ]
+
+
 @pytest.mark.django_db
 def test_save_page_with_metadata(page_with_metadata, create_xliff_page_context):
     language_to_translate = "de"
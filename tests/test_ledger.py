@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+import pytest
+from cms.models import PageContent
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+
+from djangocms_xliff.exports import export_content_as_xliff_context
+from djangocms_xliff.extractors import extract_units_from_obj
+from djangocms_xliff.imports import save_xliff_context
+from djangocms_xliff.ledger import filter_changed_units, get_ledger_hashes, record_exported_units
+from djangocms_xliff.models import ExportLedgerEntry
+
+
+def get_changed_unit_ids(obj):
+    return [unit.id for unit in filter_changed_units(obj, "en", extract_units_from_obj(obj, "en"))]
+
+
+@pytest.mark.django_db
+def test_filter_changed_units(page_with_multiple_fields_in_one_plugin, django_assert_num_queries):
+    page, plugin = page_with_multiple_fields_in_one_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    units = extract_units_from_obj(obj, "en")
+    assert get_changed_unit_ids(obj) == [unit.id for unit in units]
+
+    record_exported_units(obj, "en", units)
+    record_exported_units(obj, "en", units)
+
+    assert ExportLedgerEntry.objects.count() == len(units)
+    assert get_changed_unit_ids(obj) == []
+
+    plugin.lead = "Changed lead"
+    plugin.save()
+
+    assert get_changed_unit_ids(obj) == [f"{plugin.pk}__lead"]
+
+    ContentType.objects.get_for_model(obj)
+    with django_assert_num_queries(1):
+        get_ledger_hashes(obj, "en")
+
+
+@pytest.mark.django_db
+def test_imported_units_are_not_changed(page_with_multiple_fields_in_one_plugin, create_xliff_page_context):
+    page, plugin = page_with_multiple_fields_in_one_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    units = extract_units_from_obj(obj, "en", include_metadata=False)
+    record_exported_units(obj, "en", units)
+
+    for unit in units:
+        unit.target = f"{unit.source} translated"
+
+    xliff_context = create_xliff_page_context(
+        units,
+        source_language="de",
+        target_language="en",
+        obj_id=obj.pk,
+    )
+    xliff_context.content_type_id = ContentType.objects.get_for_model(obj).pk
+    save_xliff_context(xliff_context)
+
+    plugin.refresh_from_db()
+    assert plugin.lead == "Lead test translated"
+    assert filter_changed_units(obj, "en", extract_units_from_obj(obj, "en", include_metadata=False)) == []
+
+
+@pytest.mark.django_db
+def test_imported_units_without_content_type_are_not_recorded(
+    page_with_multiple_fields_in_one_plugin, create_xliff_page_context
+):
+    page, plugin = page_with_multiple_fields_in_one_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    units = extract_units_from_obj(obj, "en", include_metadata=False)
+    for unit in units:
+        unit.target = f"{unit.source} translated"
+
+    for content_type_id in (0, 999999):
+        xliff_context = create_xliff_page_context(units, source_language="de", target_language="en", obj_id=obj.pk)
+        xliff_context.content_type_id = content_type_id
+        save_xliff_context(xliff_context)
+
+    plugin.refresh_from_db()
+    assert plugin.lead == "Lead test translated"
+    assert not ExportLedgerEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_only_delta_exports_are_recorded(page_with_multiple_fields_in_one_plugin):
+    page, plugin = page_with_multiple_fields_in_one_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    convert_kwargs = {"obj": obj, "source_language": "de", "target_language": "en"}
+    with (
+        patch("djangocms_xliff.exports.get_path", return_value="/"),
+        patch("djangocms_xliff.exports.get_xliff_export_file_name", return_value="export.xliff"),
+    ):
+        export_content_as_xliff_context(**convert_kwargs)
+        assert not ExportLedgerEntry.objects.exists()
+
+        context, _ = export_content_as_xliff_context(**convert_kwargs, only_changed=True)
+        assert ExportLedgerEntry.objects.count() == len(context.units)
+
+        context, _ = export_content_as_xliff_context(**convert_kwargs, only_changed=True)
+        assert context.units == []
+
+
+@pytest.mark.django_db
+def test_record_unit_hashes_without_update_conflicts(page_with_multiple_fields_in_one_plugin, monkeypatch):
+    page, plugin = page_with_multiple_fields_in_one_plugin()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+    monkeypatch.setattr(connection.features, "supports_update_conflicts_with_target", False)
+
+    units = extract_units_from_obj(obj, "en")
+    record_exported_units(obj, "en", units[:1])
+    record_exported_units(obj, "en", units)
+    assert ExportLedgerEntry.objects.count() == len(units)
+    assert get_changed_unit_ids(obj) == []
+
+    plugin.lead = "Changed lead"
+    plugin.save()
+    record_exported_units(obj, "en", extract_units_from_obj(obj, "en"))
+
+    assert ExportLedgerEntry.objects.count() == len(units)
+    assert get_changed_unit_ids(obj) == []
@@ -1,9 +1,13 @@
 import io
 
+import pytest
 from cms.models import Page
 from django.contrib.contenttypes.models import ContentType
 
-from djangocms_xliff.parsers import parse_xliff_document
+from djangocms_xliff.exceptions import XliffError
+from djangocms_xliff.parsers import parse_xliff_document, parse_xliff_document_files
+from djangocms_xliff.renderer import render_xliff_contexts_document
+from djangocms_xliff.settings import XliffVersion
 from djangocms_xliff.types import Unit
 
 
@@ -165,3 +169,30 @@ def test_parse_xliff_version_1_2_html(create_xliff_page_context):
     )
 
     assert parse_xliff_document(file_buffer) == expected
+
+
+@pytest.mark.django_db
+def test_parse_xliff_document_with_many_files(create_xliff_page_context):
+    def create_unit(plugin_id: str) -> Unit:
+        return Unit(
+            plugin_id=plugin_id,
+            plugin_type="TestPlugin",
+            plugin_name="Test Plugin",
+            field_name="title",
+            field_type="django.db.models.CharField",
+            field_verbose_name="Title",
+            source="Welcome",
+            target="Willkommen",
+        )
+
+    contexts = [
+        create_xliff_page_context([create_unit("1"), create_unit("2")], obj_id=1, path="/root"),
+        create_xliff_page_context([], obj_id=2, path="/root/child"),
+        create_xliff_page_context([create_unit("3")], obj_id=3, path="/root/child/grandchild"),
+    ]
+    file_content = render_xliff_contexts_document(XliffVersion.V1_2, contexts)
+
+    assert parse_xliff_document_files(io.StringIO(file_content)) == contexts
+
+    with pytest.raises(XliffError):
+        parse_xliff_document(io.StringIO(file_content))
@@ -0,0 +1,57 @@
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+from cms.models import PageContent
+from django.db.models import CharField
+
+from djangocms_xliff.extractors import extract_units_from_obj, get_model_plan
+from djangocms_xliff.processes import map_in_process_pool, shutdown_process_pool
+from djangocms_xliff.registry import build_field_registry
+from djangocms_xliff.utils import get_type_with_path
+
+
+def upper_char_field_extractor(source):
+    return source.upper()
+
+
+def test_map_in_process_pool_keeps_order():
+    values = [f"text {index}" for index in range(20)]
+
+    try:
+        assert map_in_process_pool(upper_char_field_extractor, values, chunk_size=3) == [v.upper() for v in values]
+    finally:
+        shutdown_process_pool()
+
+
+def test_map_in_process_pool_runs_small_inputs_in_process():
+    with patch("djangocms_xliff.processes.get_process_pool") as get_process_pool:
+        assert map_in_process_pool(upper_char_field_extractor, ["a", "b"], chunk_size=3) == ["A", "B"]
+
+    get_process_pool.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_extract_units_with_process_extractors(page_with_multiple_placeholders_and_multiple_plugins):
+    page, *_ = page_with_multiple_placeholders_and_multiple_plugins()
+    obj = PageContent.admin_manager.get(page=page, language="en")
+
+    expected = [
+        replace(unit, source=unit.source.upper()) if unit.field_type == get_type_with_path(CharField()) else unit
+        for unit in extract_units_from_obj(obj, "en", include_metadata=False)
+    ]
+
+    try:
+        with (
+            patch("djangocms_xliff.registry.FIELD_PROCESS_EXTRACTORS", {CharField: upper_char_field_extractor}),
+            patch("djangocms_xliff.processes.PROCESS_POOL_CHUNK_SIZE", 1),
+        ):
+            build_field_registry()
+            get_model_plan.cache_clear()
+            computed = extract_units_from_obj(obj, "en", include_metadata=False)
+    finally:
+        shutdown_process_pool()
+        build_field_registry()
+        get_model_plan.cache_clear()
+
+    assert computed == expected
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+import pytest
+from django.db.models import CharField, EmailField, IntegerField, TextField
+
+from djangocms_xliff.registry import (
+    build_field_registry,
+    get_field_handlers,
+    get_field_handlers_for_type_path,
+)
+
+
+class UpperCharField(CharField):
+    pass
+
+
+class HTMLField(TextField):
+    pass
+
+
+class CustomHTMLField(HTMLField):
+    pass
+
+
+def html_field_extractor(instance, field, source):
+    return []
+
+
+def html_field_importer(instance, unit):
+    return instance
+
+
+@pytest.fixture
+def registry():
+    with (
+        patch("djangocms_xliff.registry.FIELD_EXTRACTORS", {HTMLField: html_field_extractor}),
+        patch("djangocms_xliff.registry.FIELD_IMPORTERS", {HTMLField: html_field_importer}),
+    ):
+        build_field_registry()
+        yield
+    build_field_registry()
+
+
+def test_field_handlers_are_resolved_by_mro(registry):
+    assert get_field_handlers(CharField).is_translatable
+    assert get_field_handlers(UpperCharField).is_translatable
+    assert not get_field_handlers(EmailField).is_translatable
+    assert not get_field_handlers(IntegerField).is_translatable
+
+    handlers = get_field_handlers(CustomHTMLField)
+    assert handlers.is_translatable
+    assert handlers.extractor is html_field_extractor
+    assert handlers.importer is html_field_importer
+    assert get_field_handlers(CustomHTMLField) is handlers
+
+
+def test_field_handlers_for_type_path(registry):
+    assert get_field_handlers_for_type_path("tests.test_registry.HTMLField").importer is html_field_importer
+    assert get_field_handlers_for_type_path("tests.test_registry.CustomHTMLField").importer is None
+
+    get_field_handlers(CustomHTMLField)
+    assert get_field_handlers_for_type_path("tests.test_registry.CustomHTMLField").importer is html_field_importer
+    assert get_field_handlers_for_type_path("django.db.models.fields.CharField").importer is None
+    assert get_field_handlers_for_type_path("not_installed.fields.LinkField").importer is None
+
+
+def test_field_handlers_for_type_path_does_not_import(registry):
+    with patch("djangocms_xliff.registry.get_field_handlers") as get_field_handlers_mock:
+        for field_type in ("os.path.join", "os.system", "builtins.object", "tests.test_registry.UpperCharField"):
+            handlers = get_field_handlers_for_type_path(field_type)
+            assert handlers.importer is None
+            assert handlers.extractor is None
+
+    get_field_handlers_mock.assert_not_called()
@@ -1,7 +1,11 @@
+from io import BytesIO, StringIO
+
+import pytest
 from cms.models import Page
 from django.contrib.contenttypes.models import ContentType
 
-from djangocms_xliff.renderer import render_xliff_document
+from djangocms_xliff.parsers import parse_xliff_document
+from djangocms_xliff.renderer import render_xliff_document, render_xliff_template, write_xliff_document
 from djangocms_xliff.settings import XliffVersion
 from djangocms_xliff.types import Unit
 
@@ -45,3 +49,58 @@ def test_create_xliff_version_1_2_simple(create_xliff_page_context):
 """  # noqa: E501
 
     assert render_xliff_document(XliffVersion.V1_2, xliff_context) == expected
+
+
+@pytest.mark.django_db
+def test_render_xliff_document_like_template(create_xliff_page_context):
+    units = [
+        Unit(
+            plugin_id="1",
+            plugin_type="TestPlugin",
+            plugin_name="Quotes \"and\" <tags> & 'apostrophes'",
+            field_name="body",
+            field_verbose_name=None,
+            field_type="djangocms_text_ckeditor.fields.HTMLField",
+            source="<p>Grüezi &amp; willkommen</p>",
+            target="<p>Bienvenue</p>",
+        ),
+        Unit(
+            plugin_id="2",
+            plugin_type="TestPlugin",
+            plugin_name="Test Plugin",
+            field_name="title",
+            field_verbose_name="Title",
+            field_type="django.db.models.CharField",
+            source="Willkommen",
+            max_length=1000,
+        ),
+    ]
+    xliff_context = create_xliff_page_context(units, path="/a&b")
+
+    assert render_xliff_document(XliffVersion.V1_2, xliff_context) == render_xliff_template(
+        XliffVersion.V1_2, xliff_context
+    )
+    assert render_xliff_document(XliffVersion.V1_2, create_xliff_page_context([])) == render_xliff_template(
+        XliffVersion.V1_2, create_xliff_page_context([])
+    )
+
+
+@pytest.mark.django_db
+def test_write_xliff_document_splits_cdata_end(create_xliff_page_context):
+    unit = Unit(
+        plugin_id="1",
+        plugin_type="TestPlugin",
+        plugin_name="Test Plugin",
+        field_name="body",
+        field_type="django.db.models.TextField",
+        source="if (a[b[0]]>1) { }",
+        target="]]>",
+    )
+    xliff_context = create_xliff_page_context([unit])
+
+    file = StringIO()
+    write_xliff_document(XliffVersion.V1_2, xliff_context, file)
+
+    parsed = parse_xliff_document(BytesIO(file.getvalue().encode()))
+    assert parsed.units[0].source == unit.source
+    assert parsed.units[0].target == unit.target
@@ -0,0 +1,25 @@
+import gzip
+
+from djangocms_xliff.responses import create_xliff_response
+
+CHUNKS = ['<?xml version="1.0" encoding="utf-8" standalone="no"?>\n', "<xliff>", "Grüezi " * 1000, "</xliff>\n"]
+
+
+def test_create_xliff_response():
+    response = create_xliff_response(chunks=iter(CHUNKS), file_name="export.xliff")
+
+    assert response.streaming
+    assert response["Content-Type"] == "application/xliff+xml"
+    assert response["Content-Disposition"] == "attachment; filename=export.xliff"
+    assert b"".join(response.streaming_content).decode() == "".join(CHUNKS)
+
+
+def test_create_compressed_xliff_response():
+    response = create_xliff_response(chunks=iter(CHUNKS), file_name="export.xliff", compress=True)
+
+    assert response["Content-Type"] == "application/gzip"
+    assert response["Content-Disposition"] == "attachment; filename=export.xliff.gz"
+
+    content = b"".join(response.streaming_content)
+    assert len(content) < len("".join(CHUNKS).encode())
+    assert gzip.decompress(content).decode() == "".join(CHUNKS)
@@ -0,0 +1,128 @@
+import json
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+
+from djangocms_xliff.bundles import MANIFEST_FILE_NAME, iter_xliff_bundle, parse_xliff_upload
+from djangocms_xliff.imports import merge_xliff_contexts
+from djangocms_xliff.renderer import render_xliff_contexts_document
+from djangocms_xliff.settings import XliffVersion
+from djangocms_xliff.shards import get_shard_file_name, iter_shards
+from djangocms_xliff.types import Unit, XliffContext
+
+
+def create_plugin_units(plugin_id: str, field_names: list[str]) -> list[Unit]:
+    return [
+        Unit(
+            plugin_id=plugin_id,
+            plugin_type="TestPlugin",
+            plugin_name="Test Plugin",
+            field_name=field_name,
+            field_type="django.db.models.TextField",
+            field_verbose_name=field_name.capitalize(),
+            source=f"Text of {plugin_id} {field_name}",
+        )
+        for field_name in field_names
+    ]
+
+
+@pytest.fixture
+def xliff_context(create_xliff_page_context) -> XliffContext:
+    units = [
+        *create_plugin_units("1", ["title", "body"]),
+        *create_plugin_units("2", ["title"]),
+        *create_plugin_units("3", ["title", "lead", "body"]),
+        *create_plugin_units("4", ["title"]),
+    ]
+    return create_xliff_page_context(units, obj_id=1)
+
+
+def get_plugin_ids(shard) -> list[list[str]]:
+    return [[unit.plugin_id for unit in units] for _, units in shard]
+
+
+@pytest.mark.django_db
+def test_iter_shards_by_units(xliff_context):
+    shards = list(iter_shards(XliffVersion.V1_2, [(xliff_context, xliff_context.units)], max_units=2))
+
+    # The units of a plugin are never split, the third plugin exceeds the limit on its own
+    assert [get_plugin_ids(shard) for shard in shards] == [
+        [["1", "1"]],
+        [["2"]],
+        [["3", "3", "3"]],
+        [["4"]],
+    ]
+    assert all(context is xliff_context for shard in shards for context, _ in shard)
+
+
+@pytest.mark.django_db
+def test_iter_shards_by_bytes(xliff_context, create_xliff_page_context):
+    max_bytes = 1600
+    other_context = create_xliff_page_context(create_plugin_units("5", ["title"]), obj_id=2)
+    files = [(xliff_context, xliff_context.units), (other_context, other_context.units)]
+
+    shards = list(iter_shards(XliffVersion.V1_2, files, max_bytes=max_bytes))
+
+    assert len(shards) > 1
+    assert [unit for shard in shards for _, units in shard for unit in units] == [
+        *xliff_context.units,
+        *other_context.units,
+    ]
+    for shard in shards:
+        document = render_xliff_contexts_document(
+            XliffVersion.V1_2, [XliffContext(**{**context.__dict__, "units": units}) for context, units in shard]
+        )
+        assert len(document.encode()) <= max_bytes
+
+
+@pytest.mark.django_db
+def test_iter_shards_without_units(create_xliff_page_context):
+    empty_context = create_xliff_page_context([])
+
+    assert list(iter_shards(XliffVersion.V1_2, [], max_units=1)) == [[]]
+    assert list(iter_shards(XliffVersion.V1_2, [(empty_context, [])], max_units=1)) == [[(empty_context, [])]]
+
+
+def test_get_shard_file_name():
+    assert get_shard_file_name("page_fr.xliff", 2) == "page_fr_part-002.xliff"
+    assert get_shard_file_name("page", 12) == "page_part-012"
+
+
+@pytest.mark.django_db
+def test_import_subset_of_shards(xliff_context):
+    for unit in xliff_context.units:
+        unit.target = unit.source.replace("Text", "Texte")
+
+    bundle = BytesIO(b"".join(iter_xliff_bundle(XliffVersion.V1_2, [(xliff_context, "page_fr.xliff")], max_units=3)))
+    with ZipFile(bundle) as archive:
+        manifest = json.loads(archive.read(MANIFEST_FILE_NAME))
+        shards = {file["file_name"]: archive.read(file["file_name"]) for file in manifest["files"]}
+
+    assert [(file["file_name"], file["shard"], file["units"]) for file in manifest["files"]] == [
+        ("page_fr_part-001.xliff", 1, 3),
+        ("page_fr_part-002.xliff", 2, 3),
+        ("page_fr_part-003.xliff", 3, 1),
+    ]
+
+    # The translators return the last and the first shard in a new zip file, without the manifest
+    returned_bundle = BytesIO()
+    with ZipFile(returned_bundle, "w") as archive:
+        archive.writestr("page_fr_part-003.xliff", shards["page_fr_part-003.xliff"])
+        archive.writestr("page_fr_part-001.xliff", shards["page_fr_part-001.xliff"])
+
+    (merged_context,) = parse_xliff_upload(returned_bundle)
+    assert merged_context.obj_id == xliff_context.obj_id
+    assert merged_context.units == [*xliff_context.units[:3], xliff_context.units[-1]]
+
+
+@pytest.mark.django_db
+def test_merge_xliff_contexts(xliff_context, create_xliff_page_context):
+    other_context = create_xliff_page_context(create_plugin_units("5", ["title"]), obj_id=2)
+    first_shard = XliffContext(**{**xliff_context.__dict__, "units": xliff_context.units[:3]})
+    second_shard = XliffContext(**{**xliff_context.__dict__, "units": xliff_context.units[2:]})
+
+    assert merge_xliff_contexts([second_shard, other_context, first_shard]) == [
+        XliffContext(**{**xliff_context.__dict__, "units": [*xliff_context.units[2:], *xliff_context.units[:2]]}),
+        other_context,
+    ]
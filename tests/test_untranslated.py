@@ -0,0 +1,78 @@
+import pytest
+from cms.api import add_plugin, create_page_content
+from cms.models import PageContent
+
+from djangocms_xliff.untranslated import extract_untranslated_units_from_obj
+from tests.conftest import get_page_placeholder
+
+
+@pytest.fixture
+def page_partially_translated(create_draft_page):
+    def _page_partially_translated():
+        page = create_draft_page("en")
+        create_page_content("de", "Test", page)
+
+        for language, title, lead, body in (
+            ("en", "Same title", "Lead", "Body"),
+            ("de", "Same title", "Einleitung", ""),
+        ):
+            placeholder = get_page_placeholder(page=page, slot="main", language=language)
+            add_plugin(
+                placeholder, "TestMultipleFieldsPlugin", language, title=title, lead=lead, amount=1, is_good=False
+            )
+            add_plugin(placeholder, "TestOneFieldPlugin", language, body=body)
+
+        return page
+
+    return _page_partially_translated
+
+
+@pytest.mark.django_db
+def test_extract_untranslated_units_from_obj(page_partially_translated):
+    page = page_partially_translated()
+    obj = PageContent.admin_manager.get(page=page, language="de")
+
+    computed = extract_untranslated_units_from_obj(obj, "de", "en", include_metadata=False)
+
+    # The translated lead is skipped, the empty body is filled with the source text
+    assert [(unit.plugin_type, unit.field_name, unit.source) for unit in computed] == [
+        ("TestMultipleFieldsPlugin", "title", "Same title"),
+        ("TestOneFieldPlugin", "body", "Body"),
+    ]
+    assert all(unit.plugin_id.isdigit() for unit in computed)
+
+
+@pytest.mark.django_db
+def test_extract_untranslated_units_from_obj_with_metadata(page_partially_translated):
+    page = page_partially_translated()
+    obj = PageContent.admin_manager.get(page=page, language="de")
+
+    computed = extract_untranslated_units_from_obj(obj, "de", "en")
+
+    assert ("title", "Test") in [(unit.field_name, unit.source) for unit in computed]
+
+
+@pytest.mark.django_db
+def test_extract_untranslated_units_with_added_plugin(create_draft_page):
+    page = create_draft_page("en")
+    create_page_content("de", "Test", page)
+
+    for language, bodies in (
+        ("en", ["First", "Second"]),
+        ("de", ["Neu", "First", "Zweiter"]),
+    ):
+        placeholder = get_page_placeholder(page=page, slot="main", language=language)
+        for body in bodies:
+            add_plugin(placeholder, "TestOneFieldPlugin", language, body=body)
+        add_plugin(placeholder, "TestMultipleFieldsPlugin", language, title="Last", amount=1, is_good=False)
+
+    obj = PageContent.admin_manager.get(page=page, language="de")
+    computed = extract_untranslated_units_from_obj(obj, "de", "en", include_metadata=False)
+
+    # The added plugin has no aligned plugin and is exported. The untranslated plugin after it is still aligned
+    # with its source, not with the next source plugin of the same type.
+    assert [(unit.plugin_type, unit.field_name, unit.source) for unit in computed] == [
+        ("TestOneFieldPlugin", "body", "Neu"),
+        ("TestOneFieldPlugin", "body", "First"),
+        ("TestMultipleFieldsPlugin", "title", "Last"),
+    ]